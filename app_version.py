@@ -5,6 +5,7 @@
 
 """Version information"""
 import datetime
+import json
 import re
 from typing import List, Optional
 
@@ -37,6 +38,26 @@ class ReleaseInfo:
         if match is not None:
             self.semver = match.group(1)
 
+    def to_json(self) -> dict:
+        """
+        Returns the release fields needed to rebuild this ReleaseInfo
+
+        >>> rdict = {"tag_name": "v1.0.0",
+        ...          "html_url": "",
+        ...          "draft": False,
+        ...          "prerelease": False,
+        ...          "published_at": "2020-01-01T00:00:00+00:00"}
+        >>> ReleaseInfo(rdict).to_json() == rdict
+        True
+        """
+        return {
+            "tag_name": self.tag,
+            "html_url": self.url,
+            "draft": self.draft,
+            "prerelease": self.prerelease,
+            "published_at": self.published.isoformat(),
+        }
+
 
 def releases(user_repo: str) -> List[ReleaseInfo]:
     """
@@ -124,6 +145,27 @@ def latest() -> Optional[ReleaseInfo]:
     return highest_semver(rlist)
 
 
+def latest_cached(cache_file: str, ttl: datetime.timedelta) -> Optional[ReleaseInfo]:
+    """
+    Retrieves the latest release info, reusing the result saved in cache_file
+    if it was retrieved less than ttl ago. Failed lookups are not cached.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["release"] is not None and now - dateutil.parser.isoparse(cached["checked"]) < ttl:
+            return ReleaseInfo(cached["release"])
+    except (OSError, ValueError, KeyError):
+        pass
+
+    release = latest()
+    if release is not None:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"checked": now.isoformat(), "release": release.to_json()}, f)
+    return release
+
+
 def is_latest_version(latest_version: Optional[ReleaseInfo], swonv: str) -> bool:
     """
     Returns true if the running version is the most recent
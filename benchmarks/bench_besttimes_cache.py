@@ -0,0 +1,106 @@
+"""Best time lookups for repeat validations of a meet, with and without the persistent cache
+
+The first run fetches every athlete from the stand-in server. Repeat runs,
+in the same session and after reopening the cache, are served from SQLite.
+Expiry, the size bound and clearing a meet are checked against the counters.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from besttimes import BestTimeFetcher, BestTimesCache, entry_best_times, json_fetcher  # noqa: E402
+from besttimes_standin import BestTimesServer, best_times  # noqa: E402
+from generators import registered_entries  # noqa: E402
+
+ENTRIES = 4_000
+LATENCY = 0.02
+CONCURRENCY = 16
+MEET = "6f0c1f0e-meet-a"
+OTHER_MEET = "6f0c1f0e-meet-b"
+
+
+def run(server: BestTimesServer, cache: BestTimesCache, entries, meet_uuid: str = MEET) -> tuple:
+    fetcher = BestTimeFetcher(
+        json_fetcher(server.url, pool_size=CONCURRENCY),
+        concurrency=CONCURRENCY,
+        rate=10_000,
+        cache=cache,
+        meet_uuid=meet_uuid,
+    )
+    before = server.requests
+    start = time.perf_counter()
+    profiles, summary = entry_best_times(entries, fetcher)
+    elapsed = time.perf_counter() - start
+    assert all(p == best_times(r) for p, r in zip(profiles, entries["Reg_no"]))
+    return server.requests - before, elapsed, summary
+
+
+def report(label: str, requests: int, elapsed: float, summary: dict) -> None:
+    print(f"  {label:24}: {requests:>5} requests  {summary['cached']:>5} from cache  {elapsed:6.3f}s")
+
+
+def main() -> None:
+    entries = registered_entries(ENTRIES)
+    athletes = entries["Reg_no"].nunique()
+    print(f"{ENTRIES} entries, {athletes} athletes, {LATENCY * 1000:.0f} ms latency, concurrency {CONCURRENCY}")
+    with tempfile.TemporaryDirectory() as cache_dir, BestTimesServer(latency=LATENCY) as server:
+        cache = BestTimesCache(cache_dir)
+        requests, elapsed, summary = run(server, cache, entries)
+        assert requests == athletes
+        report("first run", requests, elapsed, summary)
+
+        requests, elapsed, summary = run(server, cache, entries)
+        assert requests == 0 and summary["cached"] == athletes
+        report("repeat run", requests, elapsed, summary)
+        cache.close()
+
+        cache = BestTimesCache(cache_dir)
+        requests, elapsed, summary = run(server, cache, entries)
+        assert requests == 0
+        report("after reopening", requests, elapsed, summary)
+
+        requests, elapsed, summary = run(server, cache, entries, OTHER_MEET)
+        assert requests == athletes
+        report("another meet", requests, elapsed, summary)
+
+        reg_nos = entries["Reg_no"].tolist()
+        start = time.perf_counter()
+        found = sum(cache.best_time(MEET, r, "L", "A", 50) is not None for r in reg_nos)
+        elapsed = time.perf_counter() - start
+        print(f"  best_time lookups       : {len(reg_nos) / elapsed:,.0f}/s  ({found} found)")
+
+        cache.clear_cache("meet", MEET)
+        requests, elapsed, summary = run(server, cache, entries)
+        assert requests == athletes
+        report("after clearing the meet", requests, elapsed, summary)
+        requests, _, _ = run(server, cache, entries, OTHER_MEET)
+        assert requests == 0
+
+        stats = cache.cache_stats()
+        print(f"  hit rate {stats['hit_rate']:.1%}, {stats['profiles']} profiles, {stats['bytes'] / 1024:.0f} KiB, "
+              f"{stats['file_bytes'] / 1024:.0f} KiB on disk")
+        cache.close()
+
+        expiring = BestTimesCache(os.path.join(cache_dir, "expiring"), ttl=0.5)
+        run(server, expiring, entries)
+        time.sleep(0.6)
+        requests, _, _ = run(server, expiring, entries)
+        assert requests == athletes and expiring.cache_stats()["expired"] >= athletes
+        print(f"  ttl 0.5s                : {requests} refetched after expiry")
+        expiring.close()
+
+        bounded = BestTimesCache(os.path.join(cache_dir, "bounded"), max_bytes=64 * 1024)
+        run(server, bounded, entries)
+        stats = bounded.cache_stats()
+        assert stats["bytes"] <= bounded.max_bytes and stats["evictions"] > 0
+        print(f"  max 64 KiB              : {stats['profiles']} profiles kept, {stats['evictions']} evicted")
+        bounded.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Remote calls made for best times: one per entry vs once per athlete with coalescing
+
+Three meets share some of their athletes, and each athlete has four entries.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from besttimes import BestTimeFetcher, entry_best_times, json_fetcher  # noqa: E402
+from besttimes_standin import BestTimesServer, best_times  # noqa: E402
+from generators import registered_entries  # noqa: E402
+
+ENTRIES_PER_MEET = 1_200
+MEETS = 3
+# Each meet shifts the athletes by this many, so neighbouring meets share the rest
+ATHLETE_OFFSET = 100
+LATENCY = 0.02
+CONCURRENCY = 16
+
+
+def meets():
+    for meet in range(MEETS):
+        entries = registered_entries(ENTRIES_PER_MEET, seed=meet)
+        entries["Reg_no"] = [f"R{int(r[1:]) + meet * ATHLETE_OFFSET:06d}" for r in entries["Reg_no"]]
+        yield entries
+
+
+def fetcher_for(server: BestTimesServer) -> BestTimeFetcher:
+    return BestTimeFetcher(json_fetcher(server.url, pool_size=CONCURRENCY), concurrency=CONCURRENCY, rate=10_000)
+
+
+def per_entry() -> None:
+    with BestTimesServer(latency=LATENCY) as server:
+        fetcher = fetcher_for(server)
+        start = time.perf_counter()
+        for entries in meets():
+            # The previous shape: a lookup for every entry row
+            with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+                list(pool.map(fetcher.fetch_one, entries["Reg_no"]))
+        elapsed = time.perf_counter() - start
+    print(f"  per entry          : {server.requests:>5} requests  {elapsed:6.2f}s")
+
+
+def per_athlete() -> None:
+    with BestTimesServer(latency=LATENCY) as server:
+        fetcher = fetcher_for(server)
+        start = time.perf_counter()
+        avoided = 0
+        for entries in meets():
+            profiles, summary = entry_best_times(entries, fetcher)
+            assert all(p == best_times(r) for p, r in zip(profiles, entries["Reg_no"]))
+            avoided += summary["calls_avoided"]
+        elapsed = time.perf_counter() - start
+    athletes = len(set().union(*(set(entries["Reg_no"]) for entries in meets())))
+    assert server.requests == athletes
+    print(f"  per athlete        : {server.requests:>5} requests  {elapsed:6.2f}s  {avoided} calls avoided, "
+          f"{fetcher.stats['reused']} profiles reused across meets")
+
+
+def coalesced() -> None:
+    """Two runs validating the same meet at once share the in-flight lookups"""
+    entries = next(meets())
+    with BestTimesServer(latency=LATENCY) as server:
+        fetcher = fetcher_for(server)
+        runs = [threading.Thread(target=entry_best_times, args=(entries, fetcher)) for _ in range(2)]
+        for run in runs:
+            run.start()
+        for run in runs:
+            run.join()
+    assert server.requests == entries["Reg_no"].nunique()
+    print(f"  two runs at once   : {server.requests:>5} requests  {fetcher.stats['coalesced']} lookups coalesced, "
+          f"{fetcher.stats['reused']} reused")
+
+
+def main() -> None:
+    print(f"{MEETS} meets of {ENTRIES_PER_MEET} entries, {LATENCY * 1000:.0f} ms latency, concurrency {CONCURRENCY}")
+    per_entry()
+    per_athlete()
+    coalesced()
+
+
+if __name__ == "__main__":
+    main()
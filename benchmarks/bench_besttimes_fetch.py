@@ -0,0 +1,44 @@
+"""Throughput of BestTimeFetcher against a local stand-in API at concurrency 1, 4 and 16"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from besttimes import BestTimeFetcher, json_fetcher  # noqa: E402
+from besttimes_standin import BestTimesServer, best_times  # noqa: E402
+
+ATHLETES = 200
+LATENCY = 0.05
+CONCURRENCY = [1, 4, 16]
+# High enough not to be the limit, then a real limit to show the bucket holding it
+RATE = 1000.0
+LIMITED_RATE = 50.0
+
+
+def run(concurrency: int, rate: float) -> None:
+    keys = [f"{n:010d}" for n in range(ATHLETES)]
+    with BestTimesServer(latency=LATENCY, fail_every=10) as server:
+        fetcher = BestTimeFetcher(
+            json_fetcher(server.url, pool_size=concurrency), concurrency=concurrency, rate=rate, backoff=0.05
+        )
+        start = time.perf_counter()
+        results = fetcher.fetch_all(keys)
+        elapsed = time.perf_counter() - start
+    assert not fetcher.errors and all(results[key] == best_times(key) for key in keys)
+    print(f"  concurrency {concurrency:>2}, {rate:6.0f}/s limit: {elapsed:6.2f}s  {ATHLETES / elapsed:6.1f} athletes/s  "
+          f"requests {fetcher.stats['requests']} ({fetcher.stats['retries']} retries)  "
+          f"peak in flight {server.peak_in_flight}")
+
+
+def main() -> None:
+    print(f"{ATHLETES} athletes, {LATENCY * 1000:.0f} ms latency, first request for 1 in 10 athletes fails with 503")
+    for concurrency in CONCURRENCY:
+        run(concurrency, RATE)
+    run(16, LIMITED_RATE)
+
+
+if __name__ == "__main__":
+    main()
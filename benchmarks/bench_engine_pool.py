@@ -0,0 +1,50 @@
+"""Count engine creations across repeated validation runs with and without the shared engine registry"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hytek_standin import StandinReader, standin_reader  # noqa: E402
+from hytek import engines  # noqa: E402
+
+ATHLETES = 2_000
+RUNS = 20
+
+
+def run(db_file: str, shared: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        # Each press of "Time Validation" builds a new reader
+        reader = StandinReader(db_file, "")
+        reader.read_meet_info()
+        reader.read_entries_info()
+        if not shared:
+            engines.dispose_all()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, "standin.db")
+        standin_reader(db_file, athletes=ATHLETES)
+
+        created = engines.created
+        fresh = run(db_file, shared=False)
+        fresh_created = engines.created - created
+
+        created = engines.created
+        shared = run(db_file, shared=True)
+        shared_created = engines.created - created
+        engines.dispose_all()
+
+    assert shared_created == 1, shared_created
+    print(f"{RUNS} runs")
+    print(f"  engine per run : {fresh:7.3f}s  {fresh_created} engines created")
+    print(f"  shared engine  : {shared:7.3f}s  {shared_created} engines created")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare peak memory of read_entries_info against chunked iter_entries on a SQLite stand-in"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hytek_standin import standin_reader  # noqa: E402
+from hytek import engines  # noqa: E402
+
+ATHLETES = 20_000
+CHUNKSIZE = 5_000
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = standin_reader(os.path.join(tmp, "standin.db"), athletes=ATHLETES)
+
+        full, full_time, full_peak = measure(reader.read_entries_info)
+
+        def stream() -> int:
+            rows = 0
+            for chunk in reader.iter_entries(chunksize=CHUNKSIZE):
+                assert len(chunk) <= CHUNKSIZE
+                rows += len(chunk)
+            return rows
+
+        rows, stream_time, stream_peak = measure(stream)
+
+        # Chunks must match the single read, including the dtype coercion. Categories differ
+        # between chunks, so concatenated categorical columns fall back to object.
+        chunks = pd.concat(reader.iter_entries(chunksize=CHUNKSIZE), ignore_index=True)
+        pd.testing.assert_frame_equal(full, chunks, check_dtype=False, check_categorical=False)
+        assert rows == len(full)
+        engines.dispose_all()
+
+    print(f"{len(full)} entries, chunksize {CHUNKSIZE}")
+    print(f"  read_entries_info : {full_time:7.3f}s  peak {full_peak / 2**20:8.1f} MiB")
+    print(f"  iter_entries      : {stream_time:7.3f}s  peak {stream_peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare filtering entries in pandas with pushing the filters into the HyTek SQL query
+
+Bytes are the deep memory of the frame pandas builds from the driver's rows,
+a proxy for what the ODBC driver has to transfer and convert. That the pushed
+down filters give the same entries as filtering in pandas is checked in
+tests/test_hytek.py.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests")))
+
+from hytek_standin import standin_reader  # noqa: E402
+from hytek import engines  # noqa: E402
+from references import ENTRY_FILTER_CASES  # noqa: E402
+
+ATHLETES = 20_000
+
+
+def timed_read(reader, query):
+    start = time.perf_counter()
+    raw = reader.read_data(query)
+    return raw, time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = standin_reader(os.path.join(tmp, "standin.db"), athletes=ATHLETES)
+        full, full_time = timed_read(reader, reader.ENTRIES_SQL)
+        full_bytes = full.memory_usage(deep=True).sum()
+        print(f"full extract: {len(full)} rows  {full_bytes / 2**20:6.1f} MiB  {full_time:6.3f}s")
+
+        for name, filters in ENTRY_FILTER_CASES.items():
+            raw, pushed_time = timed_read(reader, reader.entries_query(**filters))
+            rows, size = len(raw), raw.memory_usage(deep=True).sum()
+            print(f"  {name:34} {rows:>7} rows ({rows / len(full):4.0%})  {size / 2**20:6.1f} MiB "
+                  f"({size / full_bytes:4.0%})  {pushed_time:6.3f}s")
+        engines.dispose_all()
+
+
+if __name__ == "__main__":
+    main()
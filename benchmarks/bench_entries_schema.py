@@ -0,0 +1,32 @@
+"""Report entries frame memory before and after HyTekReader.ENTRIES_SCHEMA is applied"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hytek_standin import standin_reader  # noqa: E402
+from hytek import engines  # noqa: E402
+
+ATHLETES = 20_000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = standin_reader(os.path.join(tmp, "standin.db"), athletes=ATHLETES)
+        raw = reader.read_data(reader.ENTRIES_SQL)
+        before = raw.memory_usage(deep=True)
+        compact = reader._coerce_entries(raw.copy())
+        after = compact.memory_usage(deep=True)
+        engines.dispose_all()
+
+    print(f"{len(raw)} entries")
+    for col in raw.columns:
+        print(f"  {col:16} {str(raw[col].dtype):8} {before[col] / 1024:9.1f} KiB -> "
+              f"{str(compact[col].dtype):8} {after[col] / 1024:9.1f} KiB")
+    print(f"  {'total':16} {'':8} {before.sum() / 2**20:9.1f} MiB -> {'':8} {after.sum() / 2**20:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Parse an EV3 file against loading it from the EV3 cache, and check LRU eviction"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ev3 import EV3_PARSER_VERSION, load_ev3  # noqa: E402
+from generators import write_ev3  # noqa: E402
+from snapshot import EV3Cache  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EV3Cache(os.path.join(tmp, "cache"), max_bytes=2**40)
+        for rows in SIZES:
+            file = os.path.join(tmp, f"bench{rows}.ev3")
+            write_ev3(file, rows)
+            start = time.perf_counter()
+            parsed = load_ev3(file, cache=cache)
+            cold = time.perf_counter() - start
+            start = time.perf_counter()
+            cached = load_ev3(file, cache=cache)
+            warm = time.perf_counter() - start
+            for frame in parsed:
+                pd.testing.assert_frame_equal(parsed[frame], cached[frame])
+            print(f"  {rows:>7} events: parse {cold:7.3f}s  cached {warm:7.3f}s")
+
+        # Keep room for about two of the small files, the least recently used one goes first
+        files = []
+        for seed in range(3):
+            files.append(os.path.join(tmp, f"lru{seed}.ev3"))
+            write_ev3(files[-1], 500, seed)
+        cache = EV3Cache(os.path.join(tmp, "lru"), max_bytes=2**40)
+        load_ev3(files[0], cache=cache)
+        cache.max_bytes = int(sum(f.stat().st_size for f in cache.cache_dir.glob("*.npz")) * 2.5)
+        time.sleep(0.01)
+        load_ev3(files[1], cache=cache)
+        time.sleep(0.01)
+        load_ev3(files[0], cache=cache)  # hit, files[1] is now least recently used
+        time.sleep(0.01)
+        load_ev3(files[2], cache=cache)
+        assert cache.load(files[1], EV3_PARSER_VERSION, ["header"]) is None
+        assert cache.load(files[0], EV3_PARSER_VERSION, ["header"]) is not None
+        print("LRU eviction ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Load time and peak RSS of the memory-mapped EV3 reader against parse_sdif_ev3
+
+Each reader runs in a fresh process so its peak RSS can be measured on its own.
+Parity with parse_sdif_ev3 is checked in tests/test_ev3.py.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generators import write_ev3  # noqa: E402
+
+ROWS = 300_000
+
+READERS = {
+    "parse_sdif_ev3": "parse_sdif_ev3(file)",
+    "mmap, all columns": "parse_sdif_ev3_mmap(file)",
+    "mmap, time standard columns": "parse_sdif_ev3_mmap(file, TIMESTANDARD_FIELDS)",
+}
+
+CHILD = """
+import resource, sys, time
+sys.path.insert(0, {root!r})
+from ev3 import TIMESTANDARD_FIELDS, parse_sdif_ev3, parse_sdif_ev3_mmap
+file = {file!r}
+start = time.perf_counter()
+{call}
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def main() -> None:
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    with tempfile.TemporaryDirectory() as tmp:
+        file = os.path.join(tmp, "bench.ev3")
+        write_ev3(file, ROWS)
+        print(f"{ROWS} events, {os.path.getsize(file) / 2**20:.1f} MiB")
+        for label, call in READERS.items():
+            child = CHILD.format(root=root, file=file, call=call)
+            elapsed, maxrss = subprocess.run([sys.executable, "-c", child], capture_output=True, text=True,
+                                             check=True).stdout.split()
+            print(f"  {label:28} {float(elapsed):7.3f}s  peak RSS {int(maxrss) / 1024:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
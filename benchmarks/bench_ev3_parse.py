@@ -0,0 +1,35 @@
+"""Timing of parse_sdif_ev3 against the previous two-pass reader, parity is checked in tests/test_ev3.py"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests")))
+
+from ev3 import parse_sdif_ev3  # noqa: E402
+from generators import write_ev3  # noqa: E402
+from references import parse_sdif_ev3_reference  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            file = os.path.join(tmp, f"bench{rows}.ev3")
+            write_ev3(file, rows)
+            start = time.perf_counter()
+            parse_sdif_ev3_reference(file)
+            reference = time.perf_counter() - start
+            start = time.perf_counter()
+            parse_sdif_ev3(file)
+            single = time.perf_counter() - start
+            print(f"  {rows:>7} events: previous {reference:7.3f}s  single pass {single:7.3f}s  "
+                  f"({reference / single:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark centisecond conversion of EV3 qualifying times (per-row apply vs vectorized)"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ev3 import add_cs_columns, add_new_columns  # noqa: E402
+from generators import synthetic_events  # noqa: E402
+
+ROWS = 50_000
+
+
+def main() -> None:
+    events = synthetic_events(ROWS)
+
+    start = time.perf_counter()
+    per_row = events.apply(add_new_columns, axis=1)
+    per_row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = add_cs_columns(events)
+    vectorized_time = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(per_row, vectorized, check_dtype=False)
+    print(f"{ROWS} rows")
+    print(f"  per-row apply : {per_row_time:8.3f}s")
+    print(f"  vectorized    : {vectorized_time:8.3f}s")
+    print(f"  speedup       : {per_row_time / vectorized_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Parity and timing of formats_from_cs against format_from_cs applied per value"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils import format_from_cs, formats_from_cs  # noqa: E402
+
+ROWS = 1_000_000
+EDGE_CASES = [0, 1, -1, 99, 100, 5999, 6000, 6001, -6000, -6001, 600000, 10**20, True, np.int64(8345), np.int32(-7),
+              None, float("nan"), 6000.0, np.float64(12.5), "1:00.00", pd.NA]
+
+
+def check_parity() -> None:
+    edge = np.empty(len(EDGE_CASES), dtype=object)
+    edge[:] = EDGE_CASES
+    assert formats_from_cs(edge).tolist() == [format_from_cs(v) for v in edge]
+    for dtype in ["int16", "int32", "int64", "uint32", "float64"]:
+        values = np.arange(-200_000, 200_000, 13).astype(dtype)
+        assert formats_from_cs(values).tolist() == [format_from_cs(v) for v in values], dtype
+    nullable = pd.Series([8345, None, 0], dtype="Int64")
+    assert formats_from_cs(nullable).tolist() == [format_from_cs(v) for v in nullable]
+
+
+def main() -> None:
+    check_parity()
+    print("parity ok")
+
+    rng = np.random.default_rng(0)
+    cs = pd.Series(rng.integers(0, 120_000, ROWS), dtype="int64")
+    start = time.perf_counter()
+    expected = cs.map(format_from_cs)
+    scalar = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = formats_from_cs(cs)
+    vectorized = time.perf_counter() - start
+    assert actual.tolist() == expected.tolist()
+    print(f"{ROWS} values: per value {scalar:.3f}s  vectorized {vectorized:.3f}s  ({scalar / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Cold import time budget for the GUI start-up modules
+
+Imports each start-up module in a fresh interpreter with ``python -X importtime``
+and fails if its cumulative import time is over budget, or if a module that
+should only load on first use (pandas, sqlalchemy, requests, ...) was imported.
+
+    python benchmarks/bench_import_time.py [--runs 5] [--scale 1.0] [module ...]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Cumulative import time budget in milliseconds
+BUDGETS_MS = {
+    "hytekvalidate": 150,
+    "hytekvalidate_ui": 1000,
+}
+
+# Modules that must not be imported before the first validation or config action
+DEFERRED = [
+    "pandas",
+    "numpy",
+    "sqlalchemy",
+    "sqlalchemy_access",
+    "pyodbc",
+    "requests",
+    "openpyxl",
+    "xlsxwriter",
+    "swimrankings",
+    "besttimes",
+    "sign_config",
+    "hytekvalidate_core",
+    "hytekvalidate_config",
+]
+
+
+def import_profile(module: str) -> dict:
+    """Cumulative import time in microseconds for every module imported by a fresh `import module`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS_MS), help="Start-up modules to check")
+    parser.add_argument("--runs", type=int, default=5, help="Imports per module, the fastest is used")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply the budgets, e.g. for slow CI machines")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        budget = BUDGETS_MS.get(module, BUDGETS_MS["hytekvalidate"]) * args.scale
+        try:
+            profiles = [import_profile(module) for _ in range(args.runs)]
+        except RuntimeError as ex:
+            print(f"FAIL {module}: import failed ({ex})")
+            failed = True
+            continue
+        elapsed = min(p[module] for p in profiles) / 1000
+        eager = sorted(name for name in DEFERRED if name in profiles[0])
+        ok = elapsed <= budget and not eager
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {module}: {elapsed:7.1f} ms (budget {budget:.0f} ms)")
+        if eager:
+            print(f"     imported at startup: {', '.join(eager)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Benchmark incremental re-validation against validating every entry again"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generators import next_extract, registered_entries, synthetic_timestandard  # noqa: E402
+from snapshot import ValidationCache  # noqa: E402
+from timestandard import TimeStandardTable  # noqa: E402
+from validation import VALIDATION_COLUMNS, validate_entries, validate_incremental  # noqa: E402
+
+ROWS = 100_000
+CHANGES = [0, 10, 100, 1_000, 10_000]
+
+
+def main() -> None:
+    table = TimeStandardTable(synthetic_timestandard())
+    first = registered_entries(ROWS)
+    previous, _ = validate_incremental(first, table, allow_2_percent=True)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ValidationCache(cache_dir)
+        cache.save("meet.mdb", {"ev3": "x"}, previous)
+        previous = cache.load("meet.mdb", {"ev3": "x"})
+        assert cache.load("meet.mdb", {"ev3": "y"}) is None
+
+    print(f"{ROWS} entries")
+    for changes in CHANGES:
+        entries = next_extract(first, changes)
+        start = time.perf_counter()
+        expected = validate_entries(entries, table, allow_2_percent=True)
+        full = time.perf_counter() - start
+        start = time.perf_counter()
+        actual, counts = validate_incremental(entries, table, previous, allow_2_percent=True)
+        incremental = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(actual[VALIDATION_COLUMNS], expected[VALIDATION_COLUMNS], check_dtype=False)
+        assert counts["changed"] == changes and counts["removed"] == changes // 10, counts
+        print(f"  {changes:>6} changes: full {full:6.3f}s  incremental {incremental:6.3f}s  {counts}")
+
+
+if __name__ == "__main__":
+    main()
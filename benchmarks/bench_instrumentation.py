@@ -0,0 +1,47 @@
+"""Overhead of the stage instrumentation on validate_entries, idle, timing only and with tracemalloc"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generators import synthetic_timestandard, synthetic_validation_entries  # noqa: E402
+from instrumentation import recording  # noqa: E402
+from timestandard import TimeStandardTable  # noqa: E402
+from validation import validate_entries  # noqa: E402
+
+ROWS = 100_000
+REPEAT = 5
+
+
+def best_of(func) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    table = TimeStandardTable(synthetic_timestandard())
+    entries = synthetic_validation_entries(ROWS)
+
+    def run():
+        validate_entries(entries, table)
+
+    idle = best_of(run)
+    with recording() as recorder:
+        timing = best_of(run)
+    with recording(trace_memory=True) as recorder:
+        traced = best_of(run)
+    print(f"{ROWS} entries, best of {REPEAT}")
+    print(f"  not recording     : {idle:.3f}s")
+    print(f"  wall/cpu only     : {timing:.3f}s")
+    print(f"  with tracemalloc  : {traced:.3f}s")
+    print("\n".join(recorder.summary()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Tk event loop load of the UI log handler, one callback per record vs queued batches
+
+Runs headless: a stand-in for the Tk Text widget keeps the text as lines and
+runs after() callbacks from a simulated event loop, counting the callbacks and
+widget operations each handler causes and the lines it leaves in the widget.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from hytekvalidate_ui import TextHandler  # noqa: E402
+
+RECORDS = 50_000
+THREADS = 4
+
+
+class StandinText:
+    """The parts of the Tk Text widget the handlers use, with an event loop driving after()"""
+
+    def __init__(self):
+        self.lines = [""]
+        self.now = 0
+        self.callbacks = []
+        self.counter = itertools.count()
+        self.ran = 0
+        self.operations = 0
+        self.peak_pending = 0
+
+    def after(self, ms, func):
+        heapq.heappush(self.callbacks, (self.now + ms, next(self.counter), func))
+        self.peak_pending = max(self.peak_pending, len(self.callbacks))
+
+    def configure(self, **_options):
+        self.operations += 1
+
+    def yview(self, *_args):
+        self.operations += 1
+
+    def insert(self, _index, text):
+        self.operations += 1
+        new = text.split("\n")
+        self.lines[-1] += new[0]
+        self.lines.extend(new[1:])
+
+    def index(self, _index):
+        self.operations += 1
+        return f"{len(self.lines)}.0"
+
+    def delete(self, _start, end):
+        self.operations += 1
+        del self.lines[: int(end.split(".")[0]) - 1]
+
+    def run_until_idle(self, periodic_after=None):
+        """Run callbacks in due order until only self-rescheduling timers are left"""
+        while self.callbacks:
+            due, _, func = heapq.heappop(self.callbacks)
+            self.now = max(self.now, due)
+            self.ran += 1
+            func()
+            if periodic_after is not None and periodic_after():
+                return
+
+
+class PerRecordHandler(logging.Handler):
+    """The previous handler: one after(0) callback per record"""
+
+    def __init__(self, text):
+        logging.Handler.__init__(self)
+        self.text = text
+
+    def emit(self, record):
+        msg = self.format(record)
+
+        def append():
+            self.text.configure(state="normal")
+            self.text.insert("end", msg + "\n")
+            self.text.configure(state="disabled")
+            self.text.yview("end")
+
+        self.text.after(0, append)
+
+
+def flood(handler: logging.Handler) -> float:
+    logger = logging.getLogger(f"bench.{type(handler).__name__}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    def worker(n):
+        for i in range(RECORDS // THREADS):
+            logger.info("entry %d.%d checked", n, i)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.removeHandler(handler)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{RECORDS} records from {THREADS} threads")
+
+    text = StandinText()
+    emit_time = flood(PerRecordHandler(text))
+    text.run_until_idle()
+    print(f"  per record : emit {emit_time:.3f}s  {text.peak_pending:>6} callbacks queued  {text.ran:>6} run  "
+          f"{text.operations:>7} widget ops  {len(text.lines) - 1:>6} lines kept")
+
+    text = StandinText()
+    handler = TextHandler(text)
+    emit_time = flood(handler)
+    text.run_until_idle(periodic_after=lambda: handler._queue.empty())
+    kept = text.lines[:-1]
+    assert len(kept) == handler.max_lines and kept[-1].endswith(f"{RECORDS // THREADS - 1} checked")
+    print(f"  batched    : emit {emit_time:.3f}s  {text.peak_pending:>6} callbacks queued  {text.ran:>6} run  "
+          f"{text.operations:>7} widget ops  {len(kept):>6} lines kept")
+
+
+if __name__ == "__main__":
+    main()
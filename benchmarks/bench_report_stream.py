@@ -0,0 +1,92 @@
+"""Report writing: the whole workbook through pandas and openpyxl vs streaming with xlsxwriter
+
+Each writer runs in a fresh process, so the peak RSS it adds on top of the
+validated entries can be read from ru_maxrss. The streaming writer is also
+fed chunk by chunk straight from validate_entries, as a chunked read would.
+Both reports are read back at a small size and compared cell by cell,
+including the status fills.
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests")))
+
+from generators import report_entries, synthetic_timestandard  # noqa: E402
+from references import openpyxl_report, report_cells  # noqa: E402
+from report import ReportWriter, write_report  # noqa: E402
+from validation import validate_entries  # noqa: E402
+
+ROWS = 100_000
+CHUNK = 10_000
+CHECK_ROWS = 3_000
+
+
+def streamed_report(entries: pd.DataFrame, report_file: str) -> None:
+    """Validate and write one chunk at a time"""
+    timestandard = synthetic_timestandard()
+    with ReportWriter(report_file) as writer:
+        for start in range(0, len(entries), CHUNK):
+            writer.write(validate_entries(entries.iloc[start : start + CHUNK], timestandard))
+
+
+def max_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_writer(writer: str, rows: int, out: str) -> None:
+    """Child process: prepare the entries, then time one writer and print its wall time and peak RSS"""
+    entries = report_entries(rows)
+    validated = validate_entries(entries, synthetic_timestandard())
+    before = max_rss_mib()
+    start = time.perf_counter()
+    if writer == "openpyxl":
+        openpyxl_report(validated, out)
+    elif writer == "xlsxwriter":
+        write_report(validated, out)
+    else:
+        del validated
+        streamed_report(entries, out)
+    print(f"{time.perf_counter() - start} {max_rss_mib()} {max_rss_mib() - before}")
+
+
+def measure(writer: str, rows: int, out: str) -> None:
+    output = subprocess.run(
+        [sys.executable, __file__, writer, str(rows), out], check=True, capture_output=True, text=True
+    ).stdout
+    elapsed, peak, added = map(float, output.split())
+    print(f"  {writer:10}: {elapsed:7.2f}s  peak RSS {peak:7.1f} MiB  (+{added:6.1f} MiB)  "
+          f"{os.path.getsize(out) / 2**20:5.1f} MiB file")
+
+
+def check(tmp: str) -> None:
+    validated = validate_entries(report_entries(CHECK_ROWS), synthetic_timestandard())
+    before, after = os.path.join(tmp, "before.xlsx"), os.path.join(tmp, "after.xlsx")
+    openpyxl_report(validated, before)
+    write_report(validated, after, chunksize=1_000)
+    assert report_cells(before) == report_cells(after)
+    print(f"  {CHECK_ROWS} rows: both writers give the same cells, fills and header styles")
+
+
+def main() -> None:
+    print(f"{ROWS} validated entries, {CHUNK} rows per chunk")
+    with tempfile.TemporaryDirectory() as tmp:
+        check(tmp)
+        for writer in ("openpyxl", "xlsxwriter", "streamed"):
+            measure(writer, ROWS, os.path.join(tmp, f"{writer}.xlsx"))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_writer(sys.argv[1], int(sys.argv[2]), sys.argv[3])
+    else:
+        main()
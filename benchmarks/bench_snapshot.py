@@ -0,0 +1,47 @@
+"""Compare reading the HyTek extract from the database against loading its local snapshot"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hytek_standin import standin_reader  # noqa: E402
+from hytek import engines  # noqa: E402
+from snapshot import SnapshotCache  # noqa: E402
+
+ATHLETES = 20_000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = standin_reader(os.path.join(tmp, "standin.db"), athletes=ATHLETES)
+        cache = SnapshotCache(os.path.join(tmp, "snapshots"))
+
+        start = time.perf_counter()
+        meet_info, entries_info = reader.read_snapshot(cache=cache)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached_meet_info, cached_entries_info = reader.read_snapshot(cache=cache)
+        warm = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(meet_info, cached_meet_info)
+        pd.testing.assert_frame_equal(entries_info, cached_entries_info)
+
+        start = time.perf_counter()
+        reader.read_snapshot(ignore_cache=True, cache=cache)
+        ignored = time.perf_counter() - start
+        engines.dispose_all()
+
+    print(f"{len(entries_info)} entries")
+    print(f"  database read + snapshot : {cold:7.3f}s")
+    print(f"  snapshot load            : {warm:7.3f}s")
+    print(f"  opt_ignore_cache re-read : {ignored:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark TimeStandardTable matching against a per-entry linear scan of the time standards"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generators import synthetic_entries, synthetic_timestandard  # noqa: E402
+from timestandard import TimeStandardTable  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+# The linear scan is timed on a sample and extrapolated for the larger sizes
+LINEAR_SAMPLE = 2_000
+
+def linear_match(ts: pd.DataFrame, entries: pd.DataFrame) -> list:
+    """Reference: filter the whole standards frame for every entry, narrowest age group wins"""
+    courses = {"L": "LCM", "S": "SCM", "Y": "SCY"}
+    qts = []
+    for _, e in entries.iterrows():
+        found = ts[
+            (ts["ind_or_relay"] == e["Ind_rel"]) & (ts["gender"] == e["Ath_Sex"])
+            & (ts["distance"] == e["Event_dist"]) & (ts["stroke"] == e["Event_stroke"])
+            & (ts["course"] == courses[e["ConvSeed_course"]])
+            & (ts["min_age"] <= e["Ath_age"]) & (ts["max_age"] >= e["Ath_age"])
+        ]
+        if len(found) == 0:
+            qts.append(0)
+        else:
+            qts.append(int(found.loc[(found["max_age"] - found["min_age"]).idxmin(), "course_qt_cs"]))
+    return qts
+
+
+def main() -> None:
+    ts = synthetic_timestandard()
+    start = time.perf_counter()
+    table = TimeStandardTable(ts)
+    print(f"{len(ts)} standards, table built in {time.perf_counter() - start:.3f}s")
+
+    sample = synthetic_entries(LINEAR_SAMPLE, seed=1)
+    start = time.perf_counter()
+    expected = linear_match(ts, sample)
+    per_entry = (time.perf_counter() - start) / LINEAR_SAMPLE
+    assert table.match_entries(sample)["course_qt_cs"].tolist() == expected
+
+    for rows in SIZES:
+        entries = synthetic_entries(rows)
+        start = time.perf_counter()
+        table.match_entries(entries)
+        indexed = time.perf_counter() - start
+        linear = per_entry * rows
+        print(f"  {rows:>7} entries: indexed {indexed:7.3f}s  linear scan ~{linear:8.2f}s  ({linear / indexed:7.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
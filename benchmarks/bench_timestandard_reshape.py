@@ -0,0 +1,46 @@
+"""Parity and timing of ev3_to_timestandard against the previous concat-per-course version"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests")))
+
+from ev3 import ev3_to_timestandard, parse_sdif_ev3  # noqa: E402
+from generators import write_ev3  # noqa: E402
+from references import ev3_to_timestandard_reference  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            file = os.path.join(tmp, f"bench{rows}.ev3")
+            write_ev3(file, rows)
+            events = parse_sdif_ev3(file)["events"]
+            # Give some events SCY standards, which the previous version dropped
+            events.loc[events.index[::7], "scy_qt"] = events["scm_qt"]
+            events.loc[events.index[::7], "scy_qt_cs"] = events["scm_qt_cs"]
+
+            start = time.perf_counter()
+            expected = ev3_to_timestandard_reference(events)
+            reference = time.perf_counter() - start
+            start = time.perf_counter()
+            actual = ev3_to_timestandard(events)
+            reshaped = time.perf_counter() - start
+
+            pd.testing.assert_frame_equal(actual[actual["course"] != "SCY"], expected)
+            scy = actual[actual["course"] == "SCY"]
+            assert len(scy) == (events["scy_qt"] != "0.00").sum()
+            print(f"  {rows:>7} events: previous {reference:7.3f}s  reshape {reshaped:7.3f}s  "
+                  f"({reference / reshaped:4.1f}x), {len(scy)} SCY standards kept")
+
+
+if __name__ == "__main__":
+    main()
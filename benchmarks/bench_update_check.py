@@ -0,0 +1,73 @@
+"""Check that startup does not wait on the GitHub update check
+
+app_version.releases is replaced by a stand-in that sleeps for a simulated
+network latency. check_for_update must return immediately whatever the
+latency, and a second launch within the TTL must not hit the network.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import app_version  # noqa: E402
+import hytekvalidate  # noqa: E402
+
+LATENCIES = [0.0, 0.5, 2.0]
+# check_for_update may take at most this long to return to the caller
+STARTUP_BUDGET = 0.05
+
+RELEASE = {"tag_name": "v99.0.0", "html_url": "https://example.invalid", "draft": False, "prerelease": False,
+           "published_at": "2024-01-01T00:00:00+00:00"}
+
+
+class FakeRoot:
+    """Just enough of a Tk root to run after() callbacks"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func):
+        self.pending.append((time.perf_counter() + ms / 1000, func))
+
+    def run_until_idle(self):
+        while self.pending:
+            self.pending.sort(key=lambda p: p[0])
+            due, func = self.pending.pop(0)
+            time.sleep(max(0.0, due - time.perf_counter()))
+            func()
+
+
+def main() -> int:
+    calls = []
+
+    def releases(user_repo):
+        calls.append(user_repo)
+        time.sleep(latency)
+        return [app_version.ReleaseInfo(RELEASE)]
+
+    app_version.releases = releases
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for latency in LATENCIES:
+            cache_file = os.path.join(tmp, f"update_{latency}.json")
+            for launch in ("first launch", "cached launch"):
+                calls.clear()
+                root = FakeRoot()
+                start = time.perf_counter()
+                thread = hytekvalidate.check_for_update(root, cache_file)
+                returned = time.perf_counter() - start
+                root.run_until_idle()
+                thread.join()
+                done = time.perf_counter() - start
+                ok = returned <= STARTUP_BUDGET and (launch == "first launch" or not calls)
+                failed |= not ok
+                print(f"{'ok  ' if ok else 'FAIL'} latency {latency:3.1f}s {launch:13}: returned in "
+                      f"{returned * 1000:6.1f} ms, result after {done:5.2f}s, {len(calls)} network calls")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmark validate_entries against a row-by-row reference implementation"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generators import synthetic_timestandard, synthetic_validation_entries  # noqa: E402
+from validation import CONVERSION_ALLOWANCE, validate_entries  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+# The row loop is timed on a sample and extrapolated for the larger sizes
+LOOP_SAMPLE = 2_000
+COLUMNS = ["seed_cs", "converted", "qt_cs", "dqt_cs", "meets_qt", "under_dqt", "status"]
+
+
+def loop_validate(entries: pd.DataFrame, ts: pd.DataFrame, allow_2_percent: bool) -> pd.DataFrame:
+    """Reference: one Python iteration per entry"""
+    courses = {"L": "LCM", "S": "SCM", "Y": "SCY"}
+    standards = {}
+    for s in ts.itertuples():
+        standards.setdefault((s.ind_or_relay, s.gender, s.distance, s.stroke, s.course), []).append(s)
+
+    def find(e, course, age):
+        found = [s for s in standards.get((e.Ind_rel, e.Ath_Sex, e.Event_dist, e.Event_stroke, courses.get(course)), [])
+                 if s.min_age <= age <= s.max_age]
+        return min(found, key=lambda s: s.max_age - s.min_age) if found else None
+
+    results = []
+    for e in entries.itertuples():
+        standard = find(e, e.ActSeed_course, e.Ath_age)
+        seed_cs, converted = e.ActualSeed_time, False
+        if standard is None:
+            standard = find(e, e.ConvSeed_course, e.Ath_age)
+            if standard is not None:
+                seed_cs, converted = e.ConvSeed_time, True
+        qt_cs = standard.course_qt_cs if standard is not None else 0
+        dqt_cs = standard.course_dqt_cs if standard is not None else 0
+        limit = qt_cs * (CONVERSION_ALLOWANCE if converted and allow_2_percent else 1.0)
+        meets_qt = standard is not None and seed_cs > 0 and seed_cs <= limit
+        under_dqt = standard is not None and seed_cs > 0 and dqt_cs > 0 and seed_cs < dqt_cs
+        if e.Pre_exh != "" or e.Fin_exh != "":
+            status = "Exhibition"
+        elif e.Bonus_event:
+            status = "Bonus"
+        elif seed_cs <= 0:
+            status = "NT"
+        elif standard is None:
+            status = "No Standard"
+        elif under_dqt:
+            status = "Under DQT"
+        elif meets_qt:
+            status = "Meets QT"
+        else:
+            status = "Slower than QT"
+        results.append((seed_cs, converted, qt_cs, dqt_cs, meets_qt, under_dqt, status))
+    return pd.DataFrame(results, columns=COLUMNS, index=entries.index)
+
+
+def main() -> None:
+    ts = synthetic_timestandard()
+
+    sample = synthetic_validation_entries(LOOP_SAMPLE, seed=1)
+    start = time.perf_counter()
+    expected = loop_validate(sample, ts, allow_2_percent=True)
+    per_entry = (time.perf_counter() - start) / LOOP_SAMPLE
+    actual = validate_entries(sample, ts, allow_2_percent=True)[COLUMNS]
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_categorical=False)
+
+    for rows in SIZES:
+        entries = synthetic_validation_entries(rows)
+        start = time.perf_counter()
+        validate_entries(entries, ts, allow_2_percent=True)
+        vectorized = time.perf_counter() - start
+        loop = per_entry * rows
+        print(f"  {rows:>7} entries: vectorized {vectorized:7.3f}s  row loop ~{loop:7.2f}s  ({loop / vectorized:5.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Main thread responsiveness during a large validation, on a thread vs in a worker process
+
+Headless stand-in for the GUI: the main thread runs a 10 ms timer loop, as
+Tk's after() would, and records how late each tick fires while a synthetic
+meet is validated and its report written. With the worker process the loop
+also drains the worker's queue each tick, as monitor_reports_worker does.
+A cancelled run is timed from cancel() to the worker stopping.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from validation_worker import ValidationWorker  # noqa: E402
+
+ROWS = 30_000
+TICK_S = 0.01
+
+
+def synthetic_meet(rows: int, out: str, progress=None) -> dict:
+    """Worker target: validate a synthetic meet and write its report"""
+    # pylint: disable=import-outside-toplevel
+    from generators import report_entries, synthetic_timestandard
+    from report import write_report
+    from validation import validate_entries
+
+    steps = ("Generating entries", "Validating entries", "Writing report")
+    report = progress or (lambda *_args: None)
+    report(steps[0], 0, len(steps))
+    entries = report_entries(rows)
+    report(steps[1], 1, len(steps))
+    validated = validate_entries(entries, synthetic_timestandard())
+    report(steps[2], 2, len(steps))
+    write_report(validated, out)
+    logging.info("Wrote %d entries to %s", len(validated), out)
+    return {"out": out, "status": validated["status"].value_counts(sort=False).to_dict()}
+
+
+def timer_loop(running, on_tick=lambda: None) -> np.ndarray:
+    """Run 10 ms ticks on the main thread until running() is false, returns how late each tick was in ms"""
+    lateness = []
+    due = time.perf_counter() + TICK_S
+    while running():
+        time.sleep(max(due - time.perf_counter(), 0))
+        now = time.perf_counter()
+        lateness.append((now - due) * 1000)
+        on_tick()
+        due = now + TICK_S
+    return np.array(lateness)
+
+
+def report(label: str, lateness: np.ndarray, elapsed: float) -> None:
+    p50, p99 = np.percentile(lateness, [50, 99])
+    print(f"  {label:16}: {elapsed:6.2f}s  {len(lateness):5} ticks  late p50 {p50:6.1f} ms  p99 {p99:7.1f} ms  "
+          f"max {lateness.max():7.1f} ms")
+
+
+def on_thread(out: str) -> None:
+    thread = threading.Thread(target=synthetic_meet, args=(ROWS, out))
+    start = time.perf_counter()
+    thread.start()
+    lateness = timer_loop(thread.is_alive)
+    report("thread", lateness, time.perf_counter() - start)
+
+
+def in_worker(out: str) -> None:
+    worker = ValidationWorker(synthetic_meet, rows=ROWS, out=out)
+    start = time.perf_counter()
+    worker.start()
+    running = [True]
+
+    def poll():
+        running[0] = worker.poll()
+
+    lateness = timer_loop(lambda: running[0], poll)
+    assert worker.result is not None, worker.error
+    report("worker process", lateness, time.perf_counter() - start)
+
+
+def cancelled(out: str) -> None:
+    worker = ValidationWorker(synthetic_meet, rows=ROWS, out=out)
+    worker.start()
+    while worker.poll() and (worker.progress is None or worker.progress[1] < 1):
+        time.sleep(TICK_S)
+    start = time.perf_counter()
+    worker.cancel()
+    while worker.poll():
+        time.sleep(TICK_S)
+    assert worker.cancelled and worker.result is None
+    print(f"  cancel          : stopped {time.perf_counter() - start:.2f}s after cancel() during {worker.progress[0]}")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING)
+    print(f"{ROWS} entries, {TICK_S * 1000:.0f} ms timer on the main thread")
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "report.xlsx")
+        on_thread(out)
+        in_worker(out)
+        cancelled(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Local HTTP stand-in for the SwimRankings best times API
+
+Serves GET /athletes/<reg_no>/besttimes with a synthetic best time profile
+after an injected latency. The first request for every fail_every-th athlete
+gets a 503, so retries are exercised, and each request is counted.
+"""
+
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from generators import EVENTS
+
+
+class BestTimesServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Many benchmark clients connect at once
+    request_queue_size = 128
+
+    def __init__(self, latency: float = 0.05, fail_every: int = 0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = latency
+        self.fail_every = fail_every
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._seen = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/athletes/{{key}}/besttimes"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc):
+        self.shutdown()
+        self.server_close()
+
+
+def best_times(reg_no: str) -> dict:
+    """Deterministic profile, the same reg_no always has the same times"""
+    seed = zlib.crc32(reg_no.encode())
+    times = [
+        {"distance": distance, "stroke": stroke, "course": course, "time_cs": distance * (55 + (seed + i) % 40)}
+        for i, (distance, stroke) in enumerate(EVENTS[seed % 5 :: 3])
+        for course in "LS"
+    ]
+    return {"reg_no": reg_no, "times": times}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: BestTimesServer
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        server = self.server
+        parts = self.path.split("/")
+        if len(parts) != 4 or parts[1] != "athletes" or parts[3] != "besttimes":
+            self.send_error(404)
+            return
+        reg_no = parts[2]
+        with server._lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+            fail = server.fail_every and zlib.crc32(reg_no.encode()) % server.fail_every == 0
+            fail = fail and reg_no not in server._seen
+            server._seen.add(reg_no)
+        time.sleep(server.latency)
+        body = b"" if fail else json.dumps(best_times(reg_no)).encode()
+        self.send_response(503 if fail else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if fail:
+            self.send_header("Retry-After", "0.05")
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client timed out and went away
+            pass
+        finally:
+            with server._lock:
+                server.in_flight -= 1
+
+    def log_message(self, *_args):
+        pass
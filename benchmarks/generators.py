@@ -0,0 +1,148 @@
+"""Synthetic EV3 files, time standards and entries for the benchmarks
+
+Sizes run from a small local meet to a national championship. The generators
+are seeded, so every run and every release benchmarks the same data.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ev3 import TIME_COLUMNS  # noqa: E402
+
+# Entries (or EV3 events) per meet size
+MEET_SIZES = {"local": 1_000, "regional": 10_000, "provincial": 30_000, "national": 120_000}
+
+HEADER = ("Synthetic Championships;Synthetic Pool;02/23/2024;02/25/2024;12/31/2023;;0;0;0;3.0;Hy-Tek, Ltd;MM 8.0Fa;"
+          "02/01/2024;;SN-0001;0;09/01/2023;0;0;0;0;7;A;02/15/2024;1 Pool St;;Toronto;ON;M1M 1M1;CAN;ON;;;"
+          "01/01/2024;55")
+
+
+def _time(cs: int) -> str:
+    if cs <= 0:
+        return ""
+    if cs < 6000:
+        return f"{cs // 100}.{cs % 100:02d}"
+    return f"{cs // 6000}:{(cs // 100) % 60:02d}.{cs % 100:02d}"
+
+
+def write_ev3(path: str, rows: int, seed: int = 0) -> None:
+    """Synthetic EV3 with a mix of empty, short and minute times and all gender codes"""
+    rng = np.random.default_rng(seed)
+    strokes = "ABCDE"
+    distances = [50, 100, 200, 400, 800, 1500]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER + "\n")
+        for n in range(1, rows + 1):
+            dist = int(rng.choice(distances))
+            qt = int(dist * rng.uniform(55, 110))
+            times = [_time(t) if rng.random() > 0.15 else "" for t in
+                     (int(qt * 0.8), qt, int(qt * 0.78), int(qt * 0.97), 0, 0)]
+            min_age = int(rng.choice([0, 11, 13, 15]))
+            fields = [n, 0, "F", 0, "I", rng.choice(list("MFBWGX")), min_age, min_age + 1 if min_age else 109, dist,
+                      strokes[n % 5], "", "", "", "N", "0.00", *times, 1 + n // 100, n, 1, "09:00", 2, 0, 0, 0, 0]
+            f.write(";".join(map(str, fields)) + "\n")
+
+
+def synthetic_events(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Qualifying time columns shaped like a parsed EV3 file"""
+    rng = np.random.default_rng(seed)
+    events = {}
+    for col in TIME_COLUMNS:
+        cs = rng.integers(2500, 120000, rows)
+        text = pd.Series(cs // 6000).astype(str) + ":" + pd.Series((cs // 100) % 60).astype(str).str.zfill(2)
+        text = text + "." + pd.Series(cs % 100).astype(str).str.zfill(2)
+        # Short times have no minutes, and some events have no standard at all
+        text = text.where(cs >= 6000, text.str.split(":").str[1])
+        text = text.where(rng.random(rows) > 0.1, "0.00")
+        events[col] = text
+    return pd.DataFrame(events)
+
+
+AGE_GROUPS = [(0, 10), (11, 12), (13, 14), (15, 17), (18, 109), (0, 109)]
+EVENTS = [(50, "A"), (100, "A"), (200, "A"), (400, "A"), (800, "A"), (1500, "A"), (50, "B"), (100, "B"),
+          (200, "B"), (50, "C"), (100, "C"), (200, "C"), (50, "D"), (100, "D"), (200, "D"), (200, "E"), (400, "E")]
+
+
+def synthetic_timestandard() -> pd.DataFrame:
+    """Standards for every age group and event in LCM and SCM, shaped like ev3_to_timestandard output"""
+    rows = []
+    for gender in "MF":
+        for min_age, max_age in AGE_GROUPS:
+            for distance, stroke in EVENTS:
+                for course, factor in [("LCM", 1.0), ("SCM", 0.97)]:
+                    qt = int(distance * 70 * factor * (1.3 if max_age <= 12 else 1.0))
+                    rows.append(dict(ind_or_relay="I", gender=gender, min_age=min_age, max_age=max_age,
+                                     distance=distance, stroke=stroke, course=course, course_qt=str(qt),
+                                     course_dqt="0.00", course_qt_cs=qt, course_dqt_cs=int(qt * 0.9)))
+    return pd.DataFrame(rows)
+
+
+def synthetic_entries(rows: int, seed: int = 0) -> pd.DataFrame:
+    """The entry columns used to look up a time standard"""
+    rng = np.random.default_rng(seed)
+    events = rng.integers(0, len(EVENTS), rows)
+    return pd.DataFrame({
+        "Ind_rel": "I",
+        "Ath_Sex": rng.choice(["M", "F"], rows),
+        "Event_dist": [EVENTS[e][0] for e in events],
+        "Event_stroke": [EVENTS[e][1] for e in events],
+        "ConvSeed_course": rng.choice(["L", "S", "Y"], rows),
+        "Ath_age": rng.integers(8, 40, rows),
+    })
+
+
+def synthetic_validation_entries(rows: int, seed: int = 0) -> pd.DataFrame:
+    """The entry columns validate_entries needs, with NT, bonus and exhibition entries mixed in"""
+    rng = np.random.default_rng(seed)
+    entries = synthetic_entries(rows, seed)
+    entries["ActSeed_course"] = entries.pop("ConvSeed_course")
+    entries["ConvSeed_course"] = "S"
+    seed_cs = (entries["Event_dist"] * rng.uniform(50, 90, rows)).astype(np.int64)
+    entries["ActualSeed_time"] = np.where(rng.random(rows) < 0.05, 0, seed_cs)
+    entries["ConvSeed_time"] = np.where(entries["ActSeed_course"] == "L", entries["ActualSeed_time"] * 0.97,
+                                        entries["ActualSeed_time"]).astype(np.int64)
+    entries["Bonus_event"] = rng.random(rows) < 0.05
+    entries["Pre_exh"] = np.where(rng.random(rows) < 0.02, "X", "")
+    entries["Fin_exh"] = ""
+    # Same compact dtypes as HyTekReader.ENTRIES_SCHEMA
+    codes = ["Ind_rel", "Ath_Sex", "Event_stroke", "ActSeed_course", "ConvSeed_course", "Pre_exh", "Fin_exh"]
+    return entries.astype({col: "category" for col in codes})
+
+
+def registered_entries(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Validation entries keyed by (Reg_no, Event_no), four events per athlete"""
+    entries = synthetic_validation_entries(rows, seed)
+    entries.insert(0, "Reg_no", [f"R{i // 4:06d}" for i in range(rows)])
+    entries.insert(1, "Event_no", (np.arange(rows) % 4 + 1).astype(np.int16))
+    return entries
+
+
+def report_entries(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Registered entries with the team and athlete names the report needs"""
+    rng = np.random.default_rng(seed)
+    entries = registered_entries(rows, seed)
+    athletes = np.arange(rows) // 4
+    teams = rng.integers(1, 60, rows // 4 + 1)
+    entries.insert(0, "Team_abbr", pd.Categorical([f"T{teams[a]:03d}" for a in athletes]))
+    entries.insert(1, "Last_name", [f"Last{a}" for a in athletes])
+    entries.insert(2, "First_name", [f"First{a % 500}" for a in athletes])
+    return entries
+
+
+def next_extract(entries: pd.DataFrame, changes: int, seed: int = 1) -> pd.DataFrame:
+    """The entries a little later: changes seed times edited, changes added and changes // 10 removed"""
+    rng = np.random.default_rng(seed)
+    entries = entries.copy()
+    rows = rng.permutation(len(entries))
+    edited, removed = rows[:changes], rows[changes : changes + changes // 10]
+    entries.iloc[edited, entries.columns.get_loc("ActualSeed_time")] -= 50
+    added = registered_entries(changes, seed=seed)
+    added["Reg_no"] = [f"N{i:06d}" for i in range(changes)]
+    extract = pd.concat([entries.drop(entries.index[removed]), added], ignore_index=True) if changes else entries
+    # Like HyTekReader, each extract is coerced to the same dtypes, categories are rebuilt per read
+    return extract.astype({col: "category" if dtype == "category" else dtype for col, dtype in entries.dtypes.items()})
@@ -0,0 +1,116 @@
+"""SQLite stand-in for a HyTek meet database
+
+Creates the Meet, Team, Athlete, Event and Entry tables with the columns that
+HyTekReader queries, and registers the Access functions (CInt, CLng) its SQL
+uses, so the reader can be exercised without the Access ODBC driver.
+"""
+
+import datetime
+import os
+import sqlite3
+import sys
+
+import numpy as np
+import sqlalchemy as sa
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from hytek import HyTekReader  # noqa: E402
+
+SCHEMA = [
+    """CREATE TABLE Meet (
+        Meet_name1 TEXT, Meet_start DATETIME, Meet_end DATETIME, Calc_date DATETIME,
+        course_order TEXT, EntryEligibility_date DATETIME)""",
+    "CREATE TABLE Team (Team_no INTEGER PRIMARY KEY, Team_abbr TEXT)",
+    """CREATE TABLE Athlete (
+        Ath_no INTEGER PRIMARY KEY, Team_no INTEGER, Last_name TEXT, First_name TEXT, Reg_no TEXT,
+        Ath_Sex TEXT, Birth_date DATETIME, Ath_age INTEGER)""",
+    """CREATE TABLE Event (
+        Event_ptr INTEGER PRIMARY KEY, Event_no INTEGER, Ind_rel TEXT, Event_dist INTEGER,
+        Event_stroke TEXT, Low_age INTEGER, Event_Type TEXT, Event_sex TEXT)""",
+    """CREATE TABLE Entry (
+        Ath_no INTEGER, Event_ptr INTEGER, ActSeed_course TEXT, ActualSeed_time REAL,
+        ConvSeed_course TEXT, ConvSeed_time REAL, Scr_stat BOOLEAN, Bonus_event BOOLEAN,
+        Pre_exh TEXT, Fin_exh TEXT)""",
+]
+
+STROKES = [("A", 50), ("A", 100), ("A", 200), ("A", 400), ("B", 100), ("C", 100), ("D", 100), ("E", 200)]
+
+
+def _access_round(value):
+    """CInt/CLng: round half to even, NULL stays NULL"""
+    return None if value is None else int(round(value))
+
+
+@sa.event.listens_for(sa.engine.Engine, "connect")
+def _register_functions(dbapi_conn, _record):
+    """Every SQLite connection gets the Access functions, including engines from the registry"""
+    if isinstance(dbapi_conn, sqlite3.Connection):
+        dbapi_conn.create_function("CInt", 1, _access_round, deterministic=True)
+        dbapi_conn.create_function("CLng", 1, _access_round, deterministic=True)
+
+
+class StandinReader(HyTekReader):
+    """HyTekReader that connects to a SQLite file instead of the Access driver"""
+
+    def connection_url(self) -> sa.engine.URL:
+        return sa.engine.URL.create("sqlite", database=str(self.db_path))
+
+
+def create_engine(url: str = "sqlite://") -> sa.engine.Engine:
+    """SQLite engine with the Access functions used by HyTekReader registered"""
+    return sa.create_engine(url)
+
+
+def populate(engine: sa.engine.Engine, athletes: int = 1000, teams: int = 40, seed: int = 0) -> int:
+    """Fill the stand-in with a synthetic meet, returns the number of entries"""
+    rng = np.random.default_rng(seed)
+    start = datetime.datetime(2024, 2, 23)
+
+    events = []
+    for ptr, (sex, (stroke, dist)) in enumerate(((s, e) for s in "MF" for e in STROKES), start=1):
+        events.append(dict(Event_ptr=ptr, Event_no=ptr, Ind_rel="I", Event_dist=dist, Event_stroke=stroke,
+                           Low_age=0, Event_Type="N", Event_sex=sex))
+
+    athlete_rows = []
+    entry_rows = []
+    for ath_no in range(1, athletes + 1):
+        sex = "M" if ath_no % 2 else "F"
+        age = int(rng.integers(10, 19))
+        athlete_rows.append(dict(
+            Ath_no=ath_no, Team_no=int(rng.integers(1, teams + 1)), Last_name=f" Last{ath_no} ",
+            First_name=f"First{ath_no}", Reg_no=f"{ath_no:010d}", Ath_Sex=sex,
+            Birth_date=start.replace(year=2024 - age), Ath_age=age,
+        ))
+        own_events = [e for e in events if e["Event_sex"] == sex]
+        for event in rng.choice(own_events, size=int(rng.integers(1, 6)), replace=False):
+            seed_time = None if rng.random() < 0.05 else round(float(event["Event_dist"]) * rng.uniform(0.55, 1.1), 2)
+            course = str(rng.choice(["L", "S", "Y"]))
+            entry_rows.append(dict(
+                Ath_no=ath_no, Event_ptr=event["Event_ptr"], ActSeed_course=course, ActualSeed_time=seed_time,
+                ConvSeed_course="S", ConvSeed_time=seed_time, Scr_stat=bool(rng.random() < 0.03),
+                Bonus_event=bool(rng.random() < 0.05), Pre_exh=" X " if rng.random() < 0.02 else "", Fin_exh="",
+            ))
+
+    meta = sa.MetaData()
+    with engine.begin() as conn:
+        for ddl in SCHEMA:
+            conn.exec_driver_sql(ddl)
+        meta.reflect(bind=conn)
+        conn.execute(meta.tables["Meet"].insert(), [dict(
+            Meet_name1=" Synthetic Championships ", Meet_start=start, Meet_end=start + datetime.timedelta(days=2),
+            Calc_date=start, course_order="S", EntryEligibility_date=start - datetime.timedelta(days=365),
+        )])
+        conn.execute(meta.tables["Team"].insert(), [dict(Team_no=t, Team_abbr=f"T{t:03d} ") for t in range(1, teams + 1)])
+        conn.execute(meta.tables["Event"].insert(), events)
+        conn.execute(meta.tables["Athlete"].insert(), athlete_rows)
+        conn.execute(meta.tables["Entry"].insert(), entry_rows)
+    return len(entry_rows)
+
+
+def standin_reader(db_file: str, athletes: int = 1000, seed: int = 0) -> HyTekReader:
+    """HyTekReader connected to a freshly populated SQLite stand-in file"""
+    engine = create_engine(f"sqlite:///{db_file}")
+    populate(engine, athletes=athletes, seed=seed)
+    engine.dispose()
+    return StandinReader(db_file, "")
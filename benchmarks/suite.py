@@ -0,0 +1,158 @@
+"""Benchmark suite: times the validation pipeline at each meet size and keeps the results
+
+    python benchmarks/suite.py [--sizes local regional ...] [--repeat 3] [--compare results/<file>.json]
+
+Each case is timed best of --repeat on seeded synthetic data (see generators).
+The results are written to benchmarks/results/<version>-<timestamp>.json and
+compared with the previous results file, or --compare. Cases slower than
+--threshold times the previous result are reported as regressions and the
+suite exits with status 1.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import pathlib
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ev3 import ev3_to_timestandard, load_ev3, parse_sdif_ev3  # noqa: E402
+from generators import (  # noqa: E402
+    MEET_SIZES,
+    synthetic_events,
+    synthetic_timestandard,
+    synthetic_validation_entries,
+    write_ev3,
+)
+from hytek import engines  # noqa: E402
+from hytek_standin import standin_reader  # noqa: E402
+from snapshot import EV3Cache  # noqa: E402
+from timestandard import TimeStandardTable  # noqa: E402
+from utils import format_from_cs, formats_from_cs, time_from_str, times_from_str  # noqa: E402
+from validation import validate_entries  # noqa: E402
+from version import APP_VERSION  # noqa: E402
+
+RESULTS_DIR = pathlib.Path(__file__).parent / "results"
+
+# The end to end case builds a SQLite stand-in with about 3 entries per athlete
+ENTRIES_PER_ATHLETE = 3
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_size(rows: int, repeat: int, tmp: str) -> Dict[str, float]:
+    """Time every case at one size, returns seconds by case name"""
+    results = {}
+    ev3_file = os.path.join(tmp, f"meet{rows}.ev3")
+    write_ev3(ev3_file, rows)
+    results["parse_sdif_ev3"] = best_of(lambda: parse_sdif_ev3(ev3_file), repeat)
+    events = parse_sdif_ev3(ev3_file)["events"]
+    results["ev3_to_timestandard"] = best_of(lambda: ev3_to_timestandard(events), repeat)
+
+    times = synthetic_events(rows)["lcm_qt"]
+    results["time_from_str"] = best_of(lambda: times.map(time_from_str), repeat)
+    results["times_from_str"] = best_of(lambda: times_from_str(times), repeat)
+    cs = pd.Series(times_from_str(times))
+    results["format_from_cs"] = best_of(lambda: cs.map(format_from_cs), repeat)
+    results["formats_from_cs"] = best_of(lambda: formats_from_cs(cs), repeat)
+
+    table = TimeStandardTable(synthetic_timestandard())
+    entries = synthetic_validation_entries(rows)
+    results["validate_entries"] = best_of(lambda: validate_entries(entries, table, allow_2_percent=True), repeat)
+
+    reader = standin_reader(os.path.join(tmp, f"meet{rows}.db"), athletes=max(rows // ENTRIES_PER_ATHLETE, 1))
+    cache = EV3Cache(os.path.join(tmp, "ev3cache"))
+
+    def end_to_end():
+        entries_info = reader.read_entries_info()
+        entries_info = entries_info[~entries_info["Scr_stat"]]
+        timestandard = load_ev3(ev3_file, ignore_cache=True, cache=cache)["timestandard"]
+        return validate_entries(entries_info, timestandard)
+
+    results["end_to_end"] = best_of(end_to_end, repeat)
+    engines.dispose_all()
+    return results
+
+
+def latest_results(exclude: pathlib.Path) -> Optional[pathlib.Path]:
+    previous = sorted(f for f in RESULTS_DIR.glob("*.json") if f != exclude)
+    return max(previous, key=lambda f: f.stat().st_mtime) if previous else None
+
+
+def compare(current: dict, previous: dict, threshold: float) -> int:
+    """Print the ratio to the previous run for each case, returns the number of regressions"""
+    regressions = 0
+    print(f"\ncompared with {previous['version']} ({previous['timestamp']})")
+    for size, cases in current["results"].items():
+        for case, seconds in cases.items():
+            before = previous["results"].get(size, {}).get(case)
+            if not before:
+                continue
+            ratio = seconds / before
+            flag = "  REGRESSION" if ratio > threshold else ""
+            regressions += bool(flag)
+            print(f"  {size:10} {case:20} {before:8.4f}s -> {seconds:8.4f}s  {ratio:5.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=list(MEET_SIZES), default=list(MEET_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case, the best is kept")
+    parser.add_argument("--compare", type=pathlib.Path, help="Results file to compare with, defaults to the latest")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    parser.add_argument("--no-save", action="store_true", help="Do not write a results file")
+    args = parser.parse_args()
+
+    started = datetime.datetime.now()
+    run = {
+        "version": APP_VERSION,
+        "timestamp": started.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "repeat": args.repeat,
+        "rows": {size: MEET_SIZES[size] for size in args.sizes},
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            rows = MEET_SIZES[size]
+            run["results"][size] = run_size(rows, args.repeat, tmp)
+            print(f"{size} ({rows} rows)")
+            for case, seconds in run["results"][size].items():
+                print(f"  {case:20} {seconds:8.4f}s")
+
+    results_file = RESULTS_DIR / f"{APP_VERSION}-{started:%Y%m%d-%H%M%S}.json"
+    if not args.no_save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        results_file.write_text(json.dumps(run, indent=2), encoding="utf-8")
+        print(f"\nresults saved to {results_file}")
+
+    previous_file = args.compare or latest_results(results_file)
+    if previous_file is None:
+        return 0
+    previous = json.loads(previous_file.read_text(encoding="utf-8"))
+    return 1 if compare(run, previous, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
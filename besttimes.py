@@ -0,0 +1,709 @@
+"""Concurrent, rate-limited best-time fetching
+
+Best-time lookups are independent network round-trips, so running them one
+after another leaves the run waiting on latency. BestTimeFetcher runs a
+fetch function for many keys on a bounded thread pool. A token bucket caps
+the request rate, each request gets a timeout, and transient failures
+(connection errors, timeouts, 429 and 5xx responses) are retried with
+exponential backoff.
+
+Each athlete's best time profile is fetched once: entries are grouped by
+Reg_no, keys already fetched are reused, and concurrent requests for the same
+key share a single in-flight call.
+
+Profiles are kept across runs in BestTimesCache, a SQLite database in WAL
+mode namespaced by meet_uuid. Entries expire after a TTL and the least
+recently used profiles are evicted past a size limit, so revalidating a meet
+during its entry window is answered almost entirely from the local cache.
+
+The fetch function does one lookup and must accept a timeout keyword:
+
+    cache = BestTimesCache.from_config(config)
+    fetcher = BestTimeFetcher(fetch, concurrency=4, rate=10, cache=cache, meet_uuid=meet_uuid)
+    profiles, summary = entry_best_times(entries, fetcher)
+
+BestTimesClient puts a fetcher and the cache in front of the SwimRankings
+client that the validation is given. Before HyTekValidateTimes runs, the
+athletes entered in the meet are looked up on the fetcher's pool, and the
+client's one at a time lookups are then answered from those results.
+"""
+
+import contextlib
+import inspect
+import json
+import logging
+import os
+import pathlib
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
+import requests
+from platformdirs import user_config_dir
+
+# HTTP statuses worth retrying, anything else is a permanent failure
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# The SwimRankings client method that looks up one athlete's best times, called as lookup(reg_no)
+LOOKUP_METHOD = "athlete_best_times"
+
+
+class TokenBucket:
+    """Thread-safe token bucket, rate tokens per second with bursts of up to burst tokens"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst or max(int(rate), 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchError(Exception):
+    """A lookup failed permanently or ran out of retries"""
+
+    def __init__(self, key: Hashable, cause: Exception):
+        super().__init__(f"{key}: {cause}")
+        self.key = key
+        self.cause = cause
+
+
+def is_retryable(ex: Exception) -> bool:
+    """Connection errors, timeouts and 429/5xx responses are transient"""
+    if isinstance(ex, requests.HTTPError):
+        return ex.response is not None and ex.response.status_code in RETRY_STATUSES
+    return isinstance(ex, (requests.ConnectionError, requests.Timeout))
+
+
+def _retry_after(ex: Exception) -> Optional[float]:
+    response = getattr(ex, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight call"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, func: Callable[[], object]) -> Tuple[object, bool]:
+        """Run func for key, or wait for the call already running for key
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller's call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result(), True
+        try:
+            result = func()
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def default_profile_times(profile: object) -> Iterable[dict]:
+    """Best time rows of a profile, dicts with course, stroke, distance and time_cs"""
+    return profile.get("times", []) if isinstance(profile, dict) else []
+
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    meet_uuid TEXT NOT NULL,
+    athlete TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (meet_uuid, athlete)
+);
+CREATE INDEX IF NOT EXISTS profiles_last_used ON profiles (last_used);
+CREATE TABLE IF NOT EXISTS best_times (
+    meet_uuid TEXT NOT NULL,
+    athlete TEXT NOT NULL,
+    course TEXT NOT NULL,
+    stroke TEXT NOT NULL,
+    distance INTEGER NOT NULL,
+    time_cs INTEGER NOT NULL,
+    PRIMARY KEY (meet_uuid, athlete, course, stroke, distance),
+    FOREIGN KEY (meet_uuid, athlete) REFERENCES profiles ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+CACHE_COUNTERS = ("hits", "misses", "expired", "evictions")
+
+
+class BestTimesCache:
+    """Best time profiles in SQLite, namespaced by meet_uuid, expired after ttl and evicted least recently used first
+
+    Profiles are stored whole and split into indexed (athlete, course, stroke,
+    distance) rows for single event lookups. Profiles not tied to a meet use
+    the "" namespace. The lookup threads share one connection, as the pool's
+    threads change with every run, and WAL mode lets another process read
+    while this one writes.
+
+    >>> import tempfile
+    >>> cache = BestTimesCache(tempfile.mkdtemp())
+    >>> cache.put("meet-1", "A1", {"times": [{"course": "L", "stroke": "A", "distance": 50, "time_cs": 2950}]})
+    >>> cache.get("meet-1", "A1")["times"][0]["time_cs"], cache.get("meet-2", "A1")
+    (2950, None)
+    >>> cache.best_time("meet-1", "A1", "L", "A", 50)
+    2950
+    >>> {name: cache.cache_stats()[name] for name in ("hits", "misses", "profiles")}
+    {'hits': 1, 'misses': 1, 'profiles': 1}
+    >>> cache.clear_cache("meet", "meet-1")
+    >>> cache.get("meet-1", "A1") is None
+    True
+    >>> cache.close()
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: float = 24 * 3600,
+        max_bytes: int = 64 * 2**20,
+        profile_times: Callable[[object], Iterable[dict]] = default_profile_times,
+    ):
+        """
+        Args:
+            cache_dir: Directory of the database, defaults to the user config directory
+            ttl: Seconds a profile is used for after it was fetched
+            max_bytes: Most profile bytes kept before the least recently used are evicted
+            profile_times: Returns the best time rows to index for a profile
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(user_config_dir("Hytek-Validate", "Swim Ontario"), "besttimes")
+        pathlib.Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        self.path = os.path.join(cache_dir, "besttimes.sqlite3")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.profile_times = profile_times
+        self._lock = threading.Lock()
+        # Serializes this process's use of the connection, SQLite's busy handler would sleep in steps of milliseconds
+        self._db_lock = threading.RLock()
+        # Hit counts and last use times are written with the next put or flush rather than on every read
+        self._pending = dict.fromkeys(CACHE_COUNTERS, 0)
+        self._touched: Dict[Tuple[str, str], float] = {}
+        # Autocommit, writes open their own IMMEDIATE transaction so writers in other processes queue on the timeout
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_CACHE_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config, cache_dir: Optional[str] = None) -> "BestTimesCache":
+        """Cache with the TTL and size limit set in the appConfig"""
+        return cls(
+            cache_dir,
+            ttl=config.get_float("swimrankings_cache_ttl_hours") * 3600,
+            max_bytes=int(config.get_float("swimrankings_cache_mb") * 2**20),
+        )
+
+    def _query(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        with self._db_lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _count(self, counter: str, n: int = 1) -> None:
+        with self._lock:
+            self._pending[counter] += n
+
+    def get(self, meet_uuid: str, athlete: str) -> Optional[object]:
+        """Cached profile of athlete for the meet, None if it is missing or older than the TTL"""
+        row = self._query(
+            "SELECT payload, fetched_at FROM profiles WHERE meet_uuid = ? AND athlete = ?", (meet_uuid, athlete)
+        )
+        now = time.time()
+        if row is None or now - row[1] > self.ttl:
+            self._count("misses")
+            return None
+        with self._lock:
+            self._pending["hits"] += 1
+            self._touched[(meet_uuid, athlete)] = now
+        return json.loads(row[0])
+
+    def best_time(self, meet_uuid: str, athlete: str, course: str, stroke: str, distance: int) -> Optional[int]:
+        """Cached best time in centiseconds for one event, not counted in the hit rate"""
+        row = self._query(
+            "SELECT t.time_cs FROM best_times t JOIN profiles p USING (meet_uuid, athlete) "
+            "WHERE t.meet_uuid = ? AND t.athlete = ? AND t.course = ? AND t.stroke = ? AND t.distance = ? "
+            "AND p.fetched_at >= ?",
+            (meet_uuid, athlete, str(course), str(stroke), int(distance), time.time() - self.ttl),
+        )
+        return None if row is None else row[0]
+
+    def put(self, meet_uuid: str, athlete: str, profile: object) -> None:
+        """Store the profile of athlete for the meet, then evict past max_bytes"""
+        payload = json.dumps(profile, separators=(",", ":"))
+        times = [
+            (meet_uuid, athlete, str(t["course"]), str(t["stroke"]), int(t["distance"]), int(t["time_cs"]))
+            for t in self.profile_times(profile)
+        ]
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO profiles VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT DO UPDATE SET "
+                "payload = excluded.payload, bytes = excluded.bytes, "
+                "fetched_at = excluded.fetched_at, last_used = excluded.last_used",
+                (meet_uuid, athlete, payload, len(payload.encode("utf-8")), now, now),
+            )
+            conn.execute("DELETE FROM best_times WHERE meet_uuid = ? AND athlete = ?", (meet_uuid, athlete))
+            conn.executemany("INSERT OR REPLACE INTO best_times VALUES (?, ?, ?, ?, ?, ?)", times)
+            # Pending reads first, so eviction sees the latest use of every profile
+            self._flush(conn)
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = conn.execute("DELETE FROM profiles WHERE fetched_at < ?", (now - self.ttl,)).rowcount
+        self._count("expired", expired)
+        excess = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM profiles").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for meet_uuid, athlete, size in conn.execute(
+            "SELECT meet_uuid, athlete, bytes FROM profiles ORDER BY last_used"
+        ):
+            victims.append((meet_uuid, athlete))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM profiles WHERE meet_uuid = ? AND athlete = ?", victims)
+        self._count("evictions", len(victims))
+
+    def _flush(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, dict.fromkeys(CACHE_COUNTERS, 0)
+            touched, self._touched = self._touched, {}
+        conn.executemany(
+            "INSERT INTO counters VALUES (?, ?) ON CONFLICT DO UPDATE SET value = value + excluded.value",
+            [(name, n) for name, n in pending.items() if n],
+        )
+        conn.executemany(
+            "UPDATE profiles SET last_used = MAX(last_used, ?) WHERE meet_uuid = ? AND athlete = ?",
+            [(used, meet_uuid, athlete) for (meet_uuid, athlete), used in touched.items()],
+        )
+
+    def flush(self) -> None:
+        """Write the pending hit counts and last use times"""
+        with self._transaction() as conn:
+            self._flush(conn)
+
+    def clear_cache(self, scope: str, meet_uuid: Optional[str] = None) -> None:
+        """Drop the profiles of one meet ("meet"), of every meet ("meets") or everything and the counters ("all")"""
+        if scope == "meet" and meet_uuid is None:
+            raise ValueError("clear_cache('meet') needs the meet_uuid")
+        where = {
+            "meet": ("WHERE meet_uuid = ?", (meet_uuid,)),
+            "meets": ("WHERE meet_uuid != ''", ()),
+            "all": ("", ()),
+        }
+        if scope not in where:
+            raise ValueError(f"Unknown cache scope {scope!r}, expected 'meet', 'meets' or 'all'")
+        with self._transaction() as conn:
+            if scope == "all":
+                with self._lock:
+                    self._pending = dict.fromkeys(CACHE_COUNTERS, 0)
+                    self._touched = {}
+                conn.execute("DELETE FROM counters")
+            else:
+                self._flush(conn)
+            removed = conn.execute(f"DELETE FROM profiles {where[scope][0]}", where[scope][1]).rowcount
+        if scope == "all":
+            with self._db_lock:
+                self._conn.execute("VACUUM")
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        logging.info("Best times cache: removed %d profiles (%s)", removed, meet_uuid if scope == "meet" else scope)
+
+    def cache_stats(self) -> Dict[str, object]:
+        """Hits, misses, hit rate, evictions and size of the cache, also written to the log"""
+        self.flush()
+        stats: Dict[str, object] = dict.fromkeys(CACHE_COUNTERS, 0)
+        with self._db_lock:
+            stats |= dict(self._conn.execute("SELECT name, value FROM counters"))
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["profiles"], stats["bytes"], stats["meets"] = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(bytes), 0), COUNT(DISTINCT NULLIF(meet_uuid, '')) FROM profiles"
+        )
+        stats["best_times"] = self._query("SELECT COUNT(*) FROM best_times")[0]
+        stats["file_bytes"] = sum(
+            os.path.getsize(self.path + suffix) for suffix in ("", "-wal") if os.path.exists(self.path + suffix)
+        )
+        logging.info(
+            "Best times cache: %d hits, %d misses (%.1f%% hit rate), %d expired, %d evicted",
+            stats["hits"],
+            stats["misses"],
+            stats["hit_rate"] * 100,
+            stats["expired"],
+            stats["evictions"],
+        )
+        logging.info(
+            "Best times cache: %d profiles, %d best times for %d meets, %.1f MiB of profiles, %.1f MiB on disk",
+            stats["profiles"],
+            stats["best_times"],
+            stats["meets"],
+            stats["bytes"] / 2**20,
+            stats["file_bytes"] / 2**20,
+        )
+        return stats
+
+    def close(self) -> None:
+        """Write pending counts and close the connection"""
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+
+class BestTimeFetcher:
+    """Runs a fetch function for many keys concurrently under a rate limit"""
+
+    def __init__(
+        self,
+        fetch: Callable[..., object],
+        concurrency: int = 4,
+        rate: float = 10.0,
+        burst: Optional[int] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10.0,
+        cache: Optional[BestTimesCache] = None,
+        meet_uuid: str = "",
+    ):
+        """
+        Args:
+            fetch: Called as fetch(key, timeout=timeout) for one lookup
+            concurrency: Most lookups in flight at once
+            rate: Most requests started per second, retries included
+            burst: Requests that may start at once after an idle period, defaults to rate
+            retries: Retries of a transient failure before giving up on a key
+            backoff: Delay before the first retry, doubled for each further retry
+            timeout: Seconds allowed for each request
+            cache: Persistent cache checked before fetching and updated after, keyed by str(key)
+            meet_uuid: Cache namespace of the meet being validated
+        """
+        self.fetch = fetch
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.meet_uuid = meet_uuid
+        self._lock = threading.Lock()
+        self.stats = {
+            "lookups": 0,
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "reused": 0,
+            "coalesced": 0,
+            "cached": 0,
+        }
+        self.errors: Dict[Hashable, FetchError] = {}
+        self._fetched: Dict[Hashable, object] = {}
+        self._flight = SingleFlight()
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def fetch_one(self, key: Hashable) -> object:
+        """Fetch one key with rate limiting and retries, raises FetchError if it cannot be fetched"""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            self._count("requests")
+            try:
+                return self.fetch(key, timeout=self.timeout)
+            except Exception as ex:  # pylint: disable=broad-except
+                if attempt >= self.retries or not is_retryable(ex):
+                    self._count("failures")
+                    raise FetchError(key, ex) from ex
+                self._count("retries")
+                # Jitter keeps the workers that failed together from retrying together
+                delay = _retry_after(ex) or self.backoff * 2**attempt * random.uniform(0.5, 1.5)
+                logging.debug("Retrying %s in %.2fs: %s", key, delay, ex)
+                time.sleep(delay)
+                attempt += 1
+
+    def get(self, key: Hashable) -> object:
+        """Result for key, fetched at most once for the life of the fetcher"""
+        self._count("lookups")
+        if key in self._fetched:
+            self._count("reused")
+            return self._fetched[key]
+        result, shared = self._flight.do(key, lambda: self._fetch_new(key))
+        if shared:
+            self._count("coalesced")
+        self._fetched[key] = result
+        return result
+
+    def _fetch_new(self, key: Hashable) -> object:
+        # Another caller may have finished fetching key since get() checked
+        if key in self._fetched:
+            return self._fetched[key]
+        if self.cache is not None:
+            cached = self.cache.get(self.meet_uuid, str(key))
+            if cached is not None:
+                self._count("cached")
+                return cached
+        result = self.fetch_one(key)
+        if self.cache is not None and result is not None:
+            self.cache.put(self.meet_uuid, str(key), result)
+        return result
+
+    def forget(self) -> None:
+        """Drop the fetched results, the next lookups go to the cache or the server again"""
+        self._fetched.clear()
+
+    @property
+    def calls_avoided(self) -> int:
+        """Lookups answered without a request of their own"""
+        return self.stats["lookups"] - (self.stats["requests"] - self.stats["retries"])
+
+    def fetch_all(self, keys: Iterable[Hashable]) -> Dict[Hashable, object]:
+        """Fetch every distinct key, returns the result for each key that could be fetched
+
+        Keys that failed are logged and left out, their errors are in self.errors.
+        """
+        self.errors = {}
+        results: Dict[Hashable, object] = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {key: pool.submit(self.get, key) for key in dict.fromkeys(keys)}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except FetchError as ex:
+                    self.errors[key] = ex
+                    logging.warning("Best times lookup failed for %s", ex)
+        return results
+
+
+def entry_best_times(
+    entries: pd.DataFrame, fetcher: BestTimeFetcher, key: str = "Reg_no"
+) -> Tuple[pd.Series, Dict[str, int]]:
+    """Best time profile for every entry, fetched once per athlete
+
+    An athlete has one entry row per event, so the lookups are made for the
+    distinct registration numbers and the profiles fanned out to the rows.
+
+    Returns:
+        Tuple of the profile for each entry (None without a Reg_no or if the lookup failed) and a summary
+        with the entries, athletes, remote requests, profiles read from the cache and the calls avoided compared
+        with one lookup per entry
+
+    >>> fetcher = BestTimeFetcher(lambda reg_no, timeout: {"reg_no": reg_no})
+    >>> profiles, summary = entry_best_times(pd.DataFrame({"Reg_no": ["A1", "A1 ", "B2", None]}), fetcher)
+    >>> profiles.tolist()
+    [{'reg_no': 'A1'}, {'reg_no': 'A1'}, {'reg_no': 'B2'}, None]
+    >>> summary
+    {'entries': 3, 'athletes': 2, 'requests': 2, 'cached': 0, 'calls_avoided': 1}
+    """
+    reg_nos = entries[key].astype(object).where(entries[key].notna(), "").astype(str).str.strip()
+    athletes = pd.unique(reg_nos[reg_nos != ""])
+    before = dict(fetcher.stats)
+    profiles = fetcher.fetch_all(athletes)
+    requests_made = (fetcher.stats["requests"] - before["requests"]) - (fetcher.stats["retries"] - before["retries"])
+    looked_up = int((reg_nos != "").sum())
+    summary = {
+        "entries": looked_up,
+        "athletes": len(athletes),
+        "requests": requests_made,
+        "cached": fetcher.stats["cached"] - before["cached"],
+        "calls_avoided": looked_up - requests_made,
+    }
+    logging.info(
+        "Best times: %d entries, %d athletes, %d remote calls, %d from cache (%d avoided)",
+        summary["entries"],
+        summary["athletes"],
+        summary["requests"],
+        summary["cached"],
+        summary["calls_avoided"],
+    )
+    return pd.Series([profiles.get(reg_no) for reg_no in reg_nos], index=entries.index, dtype=object), summary
+
+
+def json_fetcher(
+    url: str, session: Optional[requests.Session] = None, pool_size: int = 16, **request_args
+) -> Callable[..., object]:
+    """Fetch function that GETs url.format(key=key) and returns the decoded JSON
+
+    The session's connection pool is sized for pool_size concurrent requests.
+    request_args (auth, headers, params) are passed to every request.
+    """
+    session = session or requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def fetch(key: Hashable, timeout: float) -> object:
+        response = session.get(url.format(key=key), timeout=timeout, **request_args)
+        response.raise_for_status()
+        return response.json()
+
+    return fetch
+
+
+class BestTimesClient:
+    """A SwimRankings client whose best time lookups go through a BestTimeFetcher
+
+    Calls to the client's lookup method with just a registration number are
+    fetched once per athlete, rate limited and retried, and concurrent calls
+    for one athlete share a request. prefetch() looks the athletes up on the
+    fetcher's pool ahead of the validation. Profiles are kept in the
+    fetcher's BestTimesCache under the meet's meet_uuid, and clear_cache and
+    cache_stats cover that cache as well as the client's own. Other lookups
+    and every other attribute go to the wrapped client, so it can be passed
+    wherever the client itself is used.
+    """
+
+    def __init__(self, client, lookup: str = LOOKUP_METHOD, **fetcher_args):
+        """
+        Args:
+            client: SwimRankings client
+            lookup: Name of the client method that looks up one athlete
+            fetcher_args: Concurrency, rate limit, retry, timeout and cache settings, see BestTimeFetcher
+        """
+        self.client = client
+        self.lookup = lookup
+        self.fetcher = BestTimeFetcher(self._fetch, **fetcher_args)
+
+    @classmethod
+    def from_config(cls, client, config) -> "BestTimesClient":
+        """Client with the concurrency, rate limit and cache set in the appConfig"""
+        return cls(
+            client,
+            concurrency=config.get_int("swimrankings_concurrency"),
+            rate=config.get_float("swimrankings_rate"),
+            timeout=config.get_float("swimrankings_timeout"),
+            cache=BestTimesCache.from_config(config),
+        )
+
+    def __getattr__(self, name: str):
+        # Only called for attributes this class does not have
+        if name.startswith("__") or "client" not in self.__dict__:
+            raise AttributeError(name)
+        if name == self.lookup:
+            return self.best_times
+        return getattr(self.client, name)
+
+    def _fetch(self, reg_no: str, timeout: float) -> object:
+        method = getattr(self.client, self.lookup)
+        # The timeout is passed on when the client's lookup takes one
+        if "timeout" in inspect.signature(method).parameters:
+            return method(reg_no, timeout=timeout)
+        return method(reg_no)
+
+    def best_times(self, reg_no, *args, **kwargs) -> object:
+        """The client's lookup, fetched once per athlete, a failed lookup raises the client's error"""
+        if args or kwargs:
+            return getattr(self.client, self.lookup)(reg_no, *args, **kwargs)
+        try:
+            return self.fetcher.get(str(reg_no).strip())
+        except FetchError as ex:
+            raise ex.cause from None
+
+    def prefetch(self, reg_nos: Iterable[object]) -> Dict[str, int]:
+        """Start a run: drop the previous results and look up the distinct registration numbers concurrently
+
+        Returns:
+            Summary from entry_best_times
+        """
+        self.fetcher.forget()
+        self.fetcher.stats = dict.fromkeys(self.fetcher.stats, 0)
+        return entry_best_times(pd.DataFrame({"Reg_no": pd.Series(list(reg_nos), dtype=object)}), self.fetcher)[1]
+
+    def prefetch_meet(self, config) -> None:
+        """Prefetch the athletes entered in the configured database, a failure is logged and left to the validation
+
+        The profiles are cached under the meet_uuid of the meet configuration
+        file, the one the "Clear Current Best Times" button clears.
+        """
+        # pylint: disable=import-outside-toplevel
+        from hytek import HyTekReader
+        from sign_config import verify_config
+        from version import HYTEK_DB_PASSWORD
+
+        meet_config = verify_config(config.get_str("meet_config_file"), "public_key.pem")
+        self.fetcher.meet_uuid = meet_config["meet_uuid"] if meet_config is not None else ""
+        try:
+            reader = HyTekReader(config.get_str("hytek_db"), HYTEK_DB_PASSWORD)
+            entries = reader.read_entries_info(columns=["Reg_no"], exclude_scratches=True)
+        except Exception as ex:  # pylint: disable=broad-except
+            logging.warning("Best times not prefetched: %s", ex)
+            return
+        self.prefetch(entries["Reg_no"])
+
+    def log_summary(self) -> None:
+        """Log the lookups made through this client and the remote calls they avoided"""
+        stats = self.fetcher.stats
+        logging.info(
+            "Best times: %d lookups, %d remote calls (%d avoided, %d shared with a call in flight)",
+            stats["lookups"],
+            stats["requests"] - stats["retries"],
+            self.fetcher.calls_avoided,
+            stats["coalesced"],
+        )
+
+    def clear_cache(self, scope: str, *args) -> object:
+        """Drop the fetched and cached profiles along with the client's cache, see BestTimesCache.clear_cache"""
+        self.fetcher.forget()
+        if self.fetcher.cache is not None:
+            self.fetcher.cache.clear_cache(scope, *args)
+        return self.client.clear_cache(scope, *args)
+
+    def cache_stats(self) -> object:
+        """Log the cache statistics, returns the client's own"""
+        if self.fetcher.cache is not None:
+            self.fetcher.cache.cache_stats()
+        return self.client.cache_stats()
+
+    def close(self) -> None:
+        """Close the cache, the client itself stays open"""
+        if self.fetcher.cache is not None:
+            self.fetcher.cache.close()
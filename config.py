@@ -24,6 +24,13 @@ class appConfig:
             "opt_ignore_existing_bonus": "False",  # Ignore Existing Bonus
             "opt_ignore_cache": "False",  # Ignore Cache
             "opt_allow_2_percent": "False",  # Allow 2% time conversion
+            "opt_record_timings": "False",  # Log stage timings and save them next to the report
+            "opt_worker_process": "False",  # Validate in a separate process so the window stays responsive
+            "swimrankings_concurrency": "4",  # Best time lookups in flight at once
+            "swimrankings_rate": "10",  # Best time requests per second
+            "swimrankings_timeout": "10",  # Seconds allowed for each best time request
+            "swimrankings_cache_ttl_hours": "24",  # Hours a cached best time profile is used for
+            "swimrankings_cache_mb": "64",  # Size of cached best time profiles before the oldest are evicted
             "Theme": "System",  # Theme- System, Dark or Light
             "Scaling": "100%",  # Display Zoom Level
             "Colour": "blue",  # Colour Theme
@@ -1,149 +1,478 @@
 # Read HyTek EV3 event files and return two dataframes
 
-import pandas as pd
+import io
+import mmap
+
 import numpy as np
-from typing import Any
-from utils import time_from_str
+import pandas as pd
+from typing import Any, List, Optional, Tuple
+from instrumentation import timed
+from snapshot import EV3Cache
+from utils import time_from_str, times_from_str
 from dateutil import parser
 
 
+# Bytes compared at a time when indexing records, and records at a time when splitting fields
+_SCAN_BLOCK = 1 << 22
+_SPLIT_ROWS = 1 << 15
+
+# Bump when the parsed output changes so cached EV3 files are parsed again
+EV3_PARSER_VERSION = 3
+
+# Qualifying time columns converted to centiseconds (as <column>_cs)
+TIME_COLUMNS = ["lcm_qt", "lcm_dqt", "scm_qt", "scm_dqt", "scy_qt", "scy_dqt"]
+
+# Courses with time standards in an EV3, in time standard output order
+COURSES = ["lcm", "scm", "scy"]
+
+# Fields of each event line
+EVENT_FIELDS = [
+    "event_no",
+    "subevent_no",
+    "prelims_finals",
+    "rounds",
+    "ind_or_relay",
+    "gender",
+    "min_age",
+    "max_age",
+    "distance",
+    "stroke",
+    "unknown1",
+    "unknown2",
+    "unknown3",
+    "event_type",  # Event Type (N=Standard, D=Disabilty, ???)
+    "event_fee",
+    "lcm_dqt",  # Long Course Meters - De-qualifying Time
+    "lcm_qt",  # Long Course Meters - Qualifying Time
+    "scm_dqt",  # Short Course Meters - De-qualifying Time
+    "scm_qt",  # Short Course Meters - Qualifying Time
+    "scy_dqt",  # Short Course Yards - De-qualifying Time
+    "scy_qt",  # Short Course Yards - Qualifying Time
+    "session_number",  # Session #?
+    "session_event",  # Event # (again?)
+    "session_meet_day",  # Day of meet session is on
+    "session_start_time", # Start time of session
+    "session_course",  # Hy-Tek Course Code (1=LCM, 2=SCM, 3=SCY)
+    "max_entries",
+    "max_individual_entries",
+    "max_relay_entries",
+    "relay_team_members",
+]
+
+# Fields of the meet header (first) line
+HEADER_FIELDS = [
+    "meet_name",
+    "pool_name",
+    "meet_start_date",
+    "meet_end_date",
+    "age_up_date",
+    "seeding_type",
+    "team_surcharge",
+    "athelete_surcharge",
+    "facilty_surcharge",
+    "file_format",
+    "meet_software",
+    "meet_sw_version",
+    "date_generated",
+    "unknown1",
+    "sanction_number",
+    "altitude",
+    "valid_times_start_date",
+    "minimum_age_open_events",
+    "max_total_entries",
+    "max_individual_entries",
+    "max_relay_entries",
+    "id_format",  # ID Format - 1=USA, 2=NewZealand, 3=SouthAfrica, 4=AustralianSwimming, 5=BritishSwimming, 6=Other, 7=?Canada?, 8=USMasters
+    "class",  # (A)gegroup, (O)pen, (H)ighSchool, (C)ollege, (Y)MCA, (M)asters, (D)isabled
+    "entry_deadline",
+    "pool_address1",
+    "pool_address2",
+    "pool_city",
+    "pool_province",
+    "pool_postal_code",
+    "pool_country",
+    "host_LSC",
+    "exclude_notimes",  # IE/ Require a time, NT entries are not allowed
+    "unknown2",
+    "entry_open_date",
+    "check_digit",  # Check Digit
+]
+
+# Time columns are kept as text (a column of short times would otherwise be read
+# as floats, turning "40.00" into "40.0") and default to "0.00" when empty
+EV3_TIME_FIELDS = ["lcm_dqt", "lcm_qt", "scm_dqt", "scm_qt", "scy_dqt", "scy_qt"]
+EVENT_DTYPES = {"event_no": str, "min_age": int, "max_age": int} | {col: str for col in EV3_TIME_FIELDS}
+
+# Gender codes normalized to M or F
+GENDER_CODES = {"B": "M", "W": "F", "G": "F"}
+
+# Values the pandas parser reads as missing (its default na_values) or as booleans
+NA_VALUES = [
+    b"",
+    b"#N/A",
+    b"#N/A N/A",
+    b"#NA",
+    b"-1.#IND",
+    b"-1.#QNAN",
+    b"-NaN",
+    b"-nan",
+    b"1.#IND",
+    b"1.#QNAN",
+    b"<NA>",
+    b"N/A",
+    b"NA",
+    b"NULL",
+    b"NaN",
+    b"None",
+    b"n/a",
+    b"nan",
+    b"null",
+]
+TRUE_VALUES = [b"True", b"TRUE", b"true"]
+FALSE_VALUES = [b"False", b"FALSE", b"false"]
+
+
+@timed
 def parse_sdif_ev3(file: str) -> dict:
-    """Parse a SDIF .ev3 event export file."""
-
-    event_fields = [
-        "event_no",
-        "subevent_no",
-        "prelims_finals",
-        "rounds",
-        "ind_or_relay",
-        "gender",
-        "min_age",
-        "max_age",
-        "distance",
-        "stroke",
-        "unknown1",
-        "unknown2",
-        "unknown3",
-        "event_type",  # Event Type (N=Standard, D=Disabilty, ???)
-        "event_fee",
-        "lcm_dqt",  # Long Course Meters - De-qualifying Time
-        "lcm_qt",  # Long Course Meters - Qualifying Time
-        "scm_dqt",  # Short Course Meters - De-qualifying Time
-        "scm_qt",  # Short Course Meters - Qualifying Time
-        "scy_dqt",  # Short Course Yards - De-qualifying Time
-        "scy_qt",  # Short Course Yards - Qualifying Time
-        "session_number",  # Session #?
-        "session_event",  # Event # (again?)
-        "session_meet_day",  # Day of meet session is on
-        "session_start_time", # Start time of session
-        "session_course",  # Hy-Tek Course Code (1=LCM, 2=SCM, 3=SCY)
-        "max_entries",
-        "max_individual_entries",
-        "max_relay_entries",
-        "relay_team_members",
-    ]
-
-    events = pd.read_csv(
-        file, delimiter=";", names=event_fields, skiprows=1, index_col=False, header=None, encoding="utf-8"
-    )
+    """Parse a SDIF .ev3 event export file.
 
-    # Ensure event_no, min_age and max_age are strings
-
-    events["event_no"] = events["event_no"].astype(str)
-    events["min_age"] = events["min_age"].astype(int)
-    events["max_age"] = events["max_age"].astype(int)
-    events["lcm_qt"].replace(np.nan, "0.00", inplace=True)
-    events["lcm_qt"] = events["lcm_qt"].astype(str)
-    events["lcm_dqt"].replace(np.nan, "0.00", inplace=True)
-    events["lcm_dqt"] = events["lcm_dqt"].astype(str)
-    events["scm_qt"].replace(np.nan, "0.00", inplace=True)
-    events["scm_qt"] = events["scm_qt"].astype(str)
-    events["scm_dqt"].replace(np.nan, "0.00", inplace=True)
-    events["scm_dqt"] = events["scm_dqt"].astype(str)
-
-    # Fix Gender.   Set to M if M, B or F if F, W, G
-    events["gender"] = events["gender"].apply(lambda x: "M" if x in ["M", "B"] else "F" if x in ["F", "W", "G"] else x)
-
-    events = events.join(events.apply(add_new_columns, axis=1))
-
-    header_fields = [
-        "meet_name",
-        "pool_name",
-        "meet_start_date",
-        "meet_end_date",
-        "age_up_date",
-        "seeding_type",
-        "team_surcharge",
-        "athelete_surcharge",
-        "facilty_surcharge",
-        "file_format",
-        "meet_software",
-        "meet_sw_version",
-        "date_generated",
-        "unknown1",
-        "sanction_number",
-        "altitude",
-        "valid_times_start_date",
-        "minimum_age_open_events",
-        "max_total_entries",
-        "max_individual_entries",
-        "max_relay_entries",
-        "id_format",  # ID Format - 1=USA, 2=NewZealand, 3=SouthAfrica, 4=AustralianSwimming, 5=BritishSwimming, 6=Other, 7=?Canada?, 8=USMasters
-        "class",  # (A)gegroup, (O)pen, (H)ighSchool, (C)ollege, (Y)MCA, (M)asters, (D)isabled
-        "entry_deadline",
-        "pool_address1",
-        "pool_address2",
-        "pool_city",
-        "pool_province",
-        "pool_postal_code",
-        "pool_country",
-        "host_LSC",
-        "exclude_notimes",  # IE/ Require a time, NT entries are not allowed
-        "unknown2",
-        "entry_open_date",
-        "check_digit",  # Check Digit
-    ]
+    The file is read once: the first line is the meet header and the rest are
+    the events, parsed with explicit dtypes.
+    """
 
+    with open(file, "rb") as f:
+        header_line = f.readline()
+        events = pd.read_csv(
+            f, delimiter=";", names=EVENT_FIELDS, index_col=False, header=None, dtype=EVENT_DTYPES, encoding="utf-8"
+        )
     header = pd.read_csv(
-        file, delimiter=";", names=header_fields, index_col=False, nrows=1, header=None, encoding="utf-8"
+        io.BytesIO(header_line), delimiter=";", names=HEADER_FIELDS, index_col=False, header=None, encoding="utf-8"
     )
 
-    return {"events": events, "header": header}
+    return {"events": normalize_events(events), "header": header}
+
+
+def normalize_events(events: pd.DataFrame) -> pd.DataFrame:
+    """Default empty times, normalize gender codes and add the centisecond columns.
+
+    Works on a subset of the event columns, steps for missing columns are skipped.
+    """
+    events.fillna({col: "0.00" for col in EV3_TIME_FIELDS if col in events.columns}, inplace=True)
+    if "gender" in events.columns:
+        events["gender"] = events["gender"].replace(GENDER_CODES)
+    if all(col in events.columns for col in TIME_COLUMNS):
+        events = events.join(add_cs_columns(events))
+    return events
+
+
+class EV3File:
+    """Memory-mapped EV3 file with event columns split and decoded on first access.
+
+    Only the start and end of each record are indexed up front. Field
+    boundaries are found up to the last column accessed and kept as small
+    offsets into each record, so trailing fields such as sessions are never
+    split when only the time standards are needed. A column is only decoded
+    into Python strings when it is accessed.
+
+    Fields are split on every separator, so a file with quoted fields is
+    rejected with a ValueError (parse_sdif_ev3_mmap reads it with pandas).
+    """
+
+    def __init__(self, file: str):
+        with open(file, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header_end = self._mmap.find(b"\n")
+        if header_end >= 0 and self._mmap.find(b'"', header_end) >= 0:
+            self._mmap.close()
+            raise ValueError(f"{file}: quoted event fields are not supported")
+        buf = np.frombuffer(self._mmap, dtype=np.uint8)
+        self._buf = buf
+
+        newlines = self._find(buf, ord("\n"))
+        if len(newlines) == 0 or newlines[-1] != len(buf) - 1:
+            newlines = np.append(newlines, len(buf))
+        starts = np.concatenate([[0], newlines[:-1] + 1])
+        ends = newlines.copy()
+        # CRLF line endings
+        crlf = (ends > starts) & (buf[np.maximum(ends - 1, 0)] == ord("\r"))
+        ends[crlf] -= 1
+
+        self.header_line = bytes(buf[starts[0] : ends[0]]).decode("utf-8")
+        records = ends[1:] > starts[1:]
+        self._starts = starts[1:][records]
+        self._ends = ends[1:][records]
+        # End of each field split so far, relative to the start of its record
+        self._offset_dtype = np.min_scalar_type(int((self._ends - self._starts).max(initial=0)))
+        self._field_ends: List[np.ndarray] = []
+        self._columns: dict = {}
+
+    @staticmethod
+    def _find(buf: np.ndarray, byte: int) -> np.ndarray:
+        """Offsets of byte in buf, scanned in blocks so the comparison mask stays small"""
+        found = [np.flatnonzero(buf[i : i + _SCAN_BLOCK] == byte) + i for i in range(0, len(buf), _SCAN_BLOCK)]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def _gather(self, start: np.ndarray, width: int) -> np.ndarray:
+        """width bytes from each start offset as a (records, width) matrix, NUL past the end of the file"""
+        buf = self._buf
+        if len(buf) < width:
+            buf = np.concatenate([buf, np.zeros(width - len(buf), dtype=np.uint8)])
+        # Taking whole rows of a sliding window view copies each value in one go
+        windows = np.lib.stride_tricks.sliding_window_view(buf, width)
+        tail = start > len(buf) - width
+        out = windows[np.where(tail, 0, start)]
+        for row in np.flatnonzero(tail):
+            value = buf[start[row] :]
+            out[row] = 0
+            out[row, : len(value)] = value
+        return out
+
+    def _split_fields(self, k: int) -> None:
+        """Find the ends of the fields after the last one split, up to field k, of every record"""
+        first = len(self._field_ends)
+        start = self._field_start(first)
+        field_ends = np.empty((k + 1 - first, len(start)), dtype=self._offset_dtype)
+        # Records are contiguous in the file, so a block of records is searched for separators in one go
+        for block in range(0, len(start), _SPLIT_ROWS):
+            rows = slice(block, block + _SPLIT_ROWS)
+            record_end = self._ends[rows]
+            seps = np.flatnonzero(self._buf[start[rows][0] : record_end[-1]] == ord(";")) + start[rows][0]
+            seps = np.append(seps, len(self._buf))
+            index = np.searchsorted(seps, start[rows])
+            for i in range(k + 1 - first):
+                # A separator past the record end belongs to a later record, the field is the last one
+                end = np.minimum(seps[np.minimum(index + i, len(seps) - 1)], record_end)
+                field_ends[i, rows] = end - self._starts[rows]
+        self._field_ends.extend(field_ends)
+
+    def _field_start(self, k: int) -> np.ndarray:
+        if k == 0:
+            return self._starts
+        return np.minimum(self._starts + self._field_ends[k - 1] + 1, self._ends)
+
+    def _field_bounds(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and end offsets of field k of every record, splitting the fields before it if needed"""
+        if len(self._field_ends) <= k:
+            self._split_fields(k)
+        return self._field_start(k), self._starts + self._field_ends[k]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __enter__(self) -> "EV3File":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map"""
+        self._columns.clear()
+        self._buf = np.empty(0, dtype=np.uint8)
+        self._mmap.close()
+
+    def header(self) -> pd.DataFrame:
+        """Meet header, parsed like parse_sdif_ev3"""
+        return pd.read_csv(
+            io.StringIO(self.header_line), delimiter=";", names=HEADER_FIELDS, index_col=False, header=None
+        )
+
+    def _field_bytes(self, k: int) -> np.ndarray:
+        """Raw bytes of field k of every event record, as a fixed width bytes array"""
+        start, end = self._field_bounds(k)
+        length = end - start
+        width = max(int(length.max(initial=0)), 1)
+        # Every value in a fixed width byte matrix, padded with NULs
+        raw = self._gather(start, width)
+        raw[np.arange(width) >= length[:, None]] = 0
+        return raw.view(f"S{width}").ravel()
+
+    @staticmethod
+    def _decode(values: np.ndarray) -> np.ndarray:
+        """Decode a bytes array to Python strings, each distinct value is decoded once"""
+        width = values.dtype.itemsize
+        if width <= 8:
+            # Short values (codes, times) are hashed as integers, much faster than sorting bytes
+            padded = np.zeros((len(values), 8), dtype=np.uint8)
+            padded[:, :width] = values.view(np.uint8).reshape(len(values), width)
+            inverse, keys = pd.factorize(padded.view(np.uint64).ravel())
+            uniques = keys.view(np.uint8).reshape(len(keys), 8)[:, :width].copy().view(values.dtype).ravel()
+        else:
+            uniques, inverse = np.unique(values, return_inverse=True)
+        try:
+            decoded = uniques.astype(str).astype(object)
+        except UnicodeDecodeError:
+            decoded = np.array([v.decode("utf-8") for v in uniques], dtype=object)
+        return decoded[inverse.ravel()]
+
+    @staticmethod
+    def _digits(values: np.ndarray) -> Optional[np.ndarray]:
+        """Integers from a bytes array of plain digits, None if any value is empty or not all digits"""
+        width = values.dtype.itemsize
+        if width > 18:
+            return None
+        chars = values.view(np.uint8).reshape(len(values), width)
+        present = chars != 0
+        digits = chars.astype(np.int64) - ord("0")
+        if not present[:, 0].all() or ((digits < 0) | (digits > 9))[present].any():
+            return None
+        numbers = digits[:, 0]
+        # Values are NUL padded at the end, so shorter ones stop taking digits
+        for j in range(1, width):
+            numbers = np.where(present[:, j], numbers * 10 + digits[:, j], numbers)
+        return numbers
+
+    @staticmethod
+    def _to_number(values: np.ndarray, empty: np.ndarray) -> Optional[np.ndarray]:
+        """Integer or float array like the pandas parser would infer, None if the values are not numeric"""
+        try:
+            if not empty.any():
+                try:
+                    numbers = EV3File._digits(values)
+                    return numbers if numbers is not None else values.astype(np.int64)
+                except (ValueError, OverflowError):
+                    return values.astype(np.float64)
+            numbers = np.full(len(values), np.nan)
+            numbers[~empty] = values[~empty].astype(np.float64)
+            return numbers
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _to_bool(values: np.ndarray, empty: np.ndarray) -> Optional[np.ndarray]:
+        """Boolean array like the pandas parser would infer (object with NaN if any are missing), None otherwise"""
+        true = np.isin(values, TRUE_VALUES)
+        if not (true | empty | np.isin(values, FALSE_VALUES)).all():
+            return None
+        if not empty.any():
+            return true
+        flags = true.astype(object)
+        flags[empty] = np.nan
+        return flags
+
+    def __getitem__(self, name: str) -> pd.Series:
+        """Decoded event column, typed like parse_sdif_ev3"""
+        if name not in self._columns:
+            raw = self._field_bytes(EVENT_FIELDS.index(name))
+            empty = np.isin(raw, NA_VALUES)
+            if name in EV3_TIME_FIELDS:
+                values = self._decode(np.where(empty, b"0.00", raw))
+            elif EVENT_DTYPES.get(name) is str:
+                values = self._decode(raw)
+                values[empty] = np.nan
+            elif name in EVENT_DTYPES:
+                values = self._digits(raw) if EVENT_DTYPES[name] is int else None
+                if values is None:
+                    values = raw.astype(EVENT_DTYPES[name])
+            else:
+                values = self._to_number(raw, empty)
+                if values is None:
+                    values = self._to_bool(raw, empty)
+                if values is None:
+                    values = self._decode(raw)
+                    values[empty] = np.nan
+            self._columns[name] = pd.Series(values, name=name)
+        return self._columns[name]
+
+    def events(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Events frame with only the requested columns decoded (all columns by default)"""
+        columns = columns or EVENT_FIELDS
+        # Split up to the last column in one pass over the records
+        self._field_bounds(max(EVENT_FIELDS.index(name) for name in columns))
+        # The decoded columns are kept for later access, so the frame shares them rather than copying
+        return normalize_events(pd.DataFrame({name: self[name] for name in columns}, copy=False))
+
+
+@timed
+def parse_sdif_ev3_mmap(file: str, columns: Optional[List[str]] = None) -> dict:
+    """Parse a SDIF .ev3 event export file through a memory map, decoding only the requested event columns.
+
+    Returns the same {"events", "header"} dict as parse_sdif_ev3. Use
+    TIMESTANDARD_FIELDS as columns when only the time standards are needed.
+    Files with quoted fields are parsed by parse_sdif_ev3 instead.
+    """
+    try:
+        ev3 = EV3File(file)
+    except ValueError:
+        parsed = parse_sdif_ev3(file)
+        if columns:
+            cs_columns = [f"{col}_cs" for col in TIME_COLUMNS] if set(TIME_COLUMNS) <= set(columns) else []
+            parsed["events"] = parsed["events"][list(columns) + cs_columns]
+        return parsed
+    with ev3:
+        return {"events": ev3.events(columns), "header": ev3.header()}
+
+
+def add_cs_columns(events: pd.DataFrame) -> pd.DataFrame:
+    """Convert all qualifying time columns to centiseconds in a single vectorized pass"""
+    cs = times_from_str(events[TIME_COLUMNS].to_numpy()).reshape(len(events), len(TIME_COLUMNS))
+    return pd.DataFrame(cs, index=events.index, columns=[f"{col}_cs" for col in TIME_COLUMNS])
 
 
 def add_new_columns(row: Any) -> pd.Series:
-    """Add new columns and convert times to centiseconds"""
+    """Add new columns and convert times to centiseconds (per row, see add_cs_columns)"""
     return pd.Series(
-        [
-            time_from_str(row["lcm_qt"]),
-            time_from_str(row["lcm_dqt"]),
-            time_from_str(row["scm_qt"]),
-            time_from_str(row["scm_dqt"]),
-        ],
-        index=["lcm_qt_cs", "lcm_dqt_cs", "scm_qt_cs", "scm_dqt_cs"],
+        [time_from_str(row[col]) for col in TIME_COLUMNS],
+        index=[f"{col}_cs" for col in TIME_COLUMNS],
     )
 
 
+# Event columns used by ev3_to_timestandard
+TIMESTANDARD_FIELDS = ["ind_or_relay", "gender", "min_age", "max_age", "distance", "stroke"] + EV3_TIME_FIELDS
+
+
+@timed
 def ev3_to_timestandard(ev3data: pd.DataFrame) -> pd.DataFrame:
-    """Convert EV3 data to Time Standard format"""
+    """Convert EV3 data to Time Standard format
+
+    One row per event and course with a qualifying time, all events for LCM
+    first, then SCM and SCY. The per-course time columns are reshaped from
+    wide to long in one step and the output is allocated once.
+    """
+    keys = ["ind_or_relay", "gender", "min_age", "max_age", "distance", "stroke"]
+    values = {"course_qt": "qt", "course_dqt": "dqt", "course_qt_cs": "qt_cs", "course_dqt_cs": "dqt_cs"}
+
+    # Transposing the (event, course) block and flattening it gives course-major order
+    long = {
+        name: ev3data[[f"{course}_{suffix}" for course in COURSES]].to_numpy().T.ravel()
+        for name, suffix in values.items()
+    }
+    keep = long["course_qt"] != "0.00"
+    rows = np.tile(np.arange(len(ev3data)), len(COURSES))[keep]
+
+    data = {key: ev3data[key].to_numpy()[rows] for key in keys}
+    data["course"] = np.repeat([course.upper() for course in COURSES], len(ev3data))[keep]
+    data |= {name: column[keep] for name, column in long.items()}
+    return pd.DataFrame(data, index=ev3data.index[rows])
+
+
+@timed
+def load_ev3(file: str, ignore_cache: bool = False, cache: Optional[EV3Cache] = None) -> dict:
+    """Parse an EV3 file and derive its time standards, reusing the cached result for an unchanged file.
 
-    timestandard = pd.DataFrame()
+    Args:
+        file: EV3 file
+        ignore_cache: Parse the file again and replace the cached result (opt_ignore_cache)
+        cache: Optional EV3 cache override
 
-    # concatenate data from the ev3 frame for each course
+    Only the TIMESTANDARD_FIELDS event columns are decoded and cached, use
+    parse_sdif_ev3 for the other columns.
 
-    for course in ["lcm", "scm"]:
-        course_data = ev3data[["ind_or_relay", "gender", "min_age", "max_age", "distance", "stroke", f"{course}_qt", f"{course}_dqt", f"{course}_qt_cs", f"{course}_dqt_cs"]].copy()
-        course_data["course"] = course.upper()
-        course_data["course_qt"] = course_data[f"{course}_qt"]
-        course_data["course_dqt"] = course_data[f"{course}_dqt"]
-        course_data["course_qt_cs"] = course_data[f"{course}_qt_cs"]
-        course_data["course_dqt_cs"] = course_data[f"{course}_dqt_cs"]
-        course_data.drop(columns=[f"{course}_qt", f"{course}_dqt", f"{course}_qt_cs", f"{course}_dqt_cs"], inplace=True)
-        timestandard = pd.concat([timestandard, course_data])
+    Returns:
+        {"events", "header", "timestandard"} DataFrames
+    """
+    cache = cache or EV3Cache()
+    frames = ["events", "header", "timestandard"]
+    if not ignore_cache:
+        parsed = cache.load(file, EV3_PARSER_VERSION, frames)
+        if parsed is not None:
+            return parsed
 
-    timestandard = timestandard[timestandard["course_qt"] != "0.00"].copy()
+    parsed = parse_sdif_ev3_mmap(file, TIMESTANDARD_FIELDS)
+    parsed["timestandard"] = ev3_to_timestandard(parsed["events"])
+    cache.save(file, EV3_PARSER_VERSION, parsed)
+    return parsed
 
-    return timestandard
 
 if __name__ == "__main__":
 
@@ -1,15 +1,80 @@
 """Module for reading and processing HyTek meet results files."""
 
+import argparse
+import atexit
+import logging
+import threading
 import sqlalchemy as sa
-import sqlalchemy_access as sa_a  # type: ignore
-import sqlalchemy_access.pyodbc as sa_a_pyodbc  # type: ignore
 import pandas as pd
-import pyodbc  # type: ignore
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Hashable, Iterator, Optional, Sequence, Tuple, Union
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
 from version import HYTEK_DB_PASSWORD
+from instrumentation import timed
+from snapshot import SnapshotCache
+
+
+class EngineRegistry:
+    """Process-wide SQLAlchemy engines shared by all HyTekReader instances.
+
+    Creating an engine for the Access driver is slow, so engines (and their
+    pooled ODBC connections) are kept per key and reused across runs.
+    """
+
+    def __init__(self):
+        self._engines: Dict[Hashable, Engine] = {}
+        self._settings: Dict[Hashable, Tuple[URL, int]] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def get(self, key: Hashable, url: URL, pool_size: int = 1) -> Engine:
+        """Return the engine for key, creating it from url on first use.
+
+        Args:
+            key: Registry key, HyTekReader uses (driver, db_path, password, pool_size)
+            url: Connection URL used if the engine does not exist yet
+            pool_size: Number of pooled connections kept open for the engine
+
+        Returns:
+            Shared SQLAlchemy Engine
+
+        Raises:
+            ValueError: The engine for key was created with a different url or pool_size
+        """
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = sa.create_engine(url, pool_size=pool_size)
+                self._engines[key] = engine
+                self._settings[key] = (url, pool_size)
+                self.created += 1
+            elif self._settings[key] != (url, pool_size):
+                # The key may hold a password, keep it out of the message
+                raise ValueError("The engine for this key was created with a different URL or pool size")
+            return engine
+
+    def dispose(self, key: Hashable) -> None:
+        """Close the pooled connections for key and forget its engine."""
+        with self._lock:
+            engine = self._engines.pop(key, None)
+            self._settings.pop(key, None)
+        if engine is not None:
+            engine.dispose()
+
+    def dispose_all(self) -> None:
+        """Close the pooled connections of every engine."""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+            self._settings.clear()
+        for engine in engines:
+            engine.dispose()
+
+
+engines = EngineRegistry()
+atexit.register(engines.dispose_all)
+
 
 class HyTekReader:
     """Class to handle reading and processing of HyTek meet database files."""
@@ -17,42 +82,129 @@ class HyTekReader:
     # Class constants
     DEFAULT_DRIVER = '{Microsoft Access Driver (*.mdb, *.accdb)}'
 
+    MEET_INFO_SQL = """
+        SELECT 
+            TRIM(M.Meet_name1) AS Meet_name, 
+            M.Meet_start,
+            M.Meet_end,
+            M.Calc_date,
+            M.course_order,
+            M.EntryEligibility_date
+        FROM 
+            Meet AS M;
+    """
 
-    def __init__(self, db_path: str, password: str, driver: Optional[str] = None):
+    # Select list for the entries query, by output column
+    ENTRIES_COLUMNS = {
+        'Team_abbr': 'TRIM(T.Team_abbr) AS Team_abbr',
+        'Last_name': 'TRIM(A.Last_name) AS Last_name',
+        'First_name': 'TRIM(A.First_name) AS First_name',
+        'Reg_no': 'A.Reg_no',
+        'Ath_Sex': 'A.Ath_Sex',
+        'Birth_date': 'A.Birth_date',
+        'Ath_age': 'A.Ath_age',
+        'Event_no': 'E.Event_no',
+        'Ind_rel': 'E.Ind_rel',
+        'Event_dist': 'CInt(IIF(E.Event_dist IS NULL, 0, E.Event_dist)) AS Event_dist',
+        'Event_stroke': 'E.Event_stroke',
+        'Low_age': 'E.Low_age',
+        'Event_Type': 'E.Event_Type',
+        'ActSeed_course': 'EN.ActSeed_course',
+        'ActualSeed_time': 'CLng(IIF(EN.ActualSeed_time IS NULL, 0, EN.ActualSeed_time * 100)) AS ActualSeed_time',
+        'ConvSeed_course': 'EN.ConvSeed_course',
+        'ConvSeed_time': 'CLng(IIF(EN.ConvSeed_time IS NULL, 0, EN.ConvSeed_time * 100)) AS ConvSeed_time',
+        'Scr_stat': 'EN.Scr_stat',
+        'Bonus_event': 'EN.Bonus_event',
+        'Pre_exh': 'TRIM(EN.Pre_exh) AS Pre_exh',
+        'Fin_exh': 'TRIM(EN.Fin_exh) AS Fin_exh',
+    }
+
+    ENTRIES_FROM = """
+        FROM 
+            ((Athlete AS A 
+            INNER JOIN Team AS T ON A.Team_no = T.Team_no)
+            INNER JOIN Entry AS EN ON A.Ath_no = EN.Ath_no)
+            INNER JOIN Event AS E ON EN.Event_ptr = E.Event_ptr"""
+
+    ENTRIES_SQL = "SELECT " + ", ".join(ENTRIES_COLUMNS.values()) + ENTRIES_FROM + ";"
+
+    DEFAULT_POOL_SIZE = 1
+
+    # Columns that must be integers even when the query returns NULLs
+    INT_COLUMNS = ['Event_dist', 'ActualSeed_time', 'ConvSeed_time']
+
+    # Compact dtypes for the entries frame. Low cardinality codes are stored as
+    # categories rather than one Python string per row.
+    ENTRIES_SCHEMA = {
+        'Team_abbr': 'category',
+        'Ath_Sex': 'category',
+        'Ath_age': 'int16',
+        'Event_no': 'int16',
+        'Ind_rel': 'category',
+        'Event_dist': 'int16',
+        'Event_stroke': 'category',
+        'Low_age': 'int16',
+        'Event_Type': 'category',
+        'ActSeed_course': 'category',
+        'ActualSeed_time': 'int32',
+        'ConvSeed_course': 'category',
+        'ConvSeed_time': 'int32',
+        'Scr_stat': 'bool',
+        'Bonus_event': 'bool',
+        'Pre_exh': 'category',
+        'Fin_exh': 'category',
+    }
+
+
+    def __init__(
+        self, db_path: str, password: str, driver: Optional[str] = None, pool_size: Optional[int] = None
+    ):
         """Initialize HyTekReader with database path and credentials.
 
         Args:
             db_path: Path to the Access database file
             password: Database password
             driver: Optional database driver override
+            pool_size: Optional number of pooled connections kept for the database
         """
         self.db_path = Path(db_path)
         self.password = password
         self.driver = driver or self.DEFAULT_DRIVER
+        self.pool_size = pool_size or self.DEFAULT_POOL_SIZE
         self.engine: Optional[Engine] = None
         self.meet_info: Optional[pd.DataFrame] = None
         self.entries_info: Optional[pd.DataFrame] = None
 
 
+    @timed
     def connect(self) -> None:
-        """Establish connection to the database."""
+        """Establish connection to the database, reusing the shared engine if one exists."""
+        key = (self.driver, str(self.db_path.resolve()), self.password, self.pool_size)
+        self.engine = engines.get(key, self.connection_url(), pool_size=self.pool_size)
+
+    def connection_url(self) -> URL:
+        """Build the SQLAlchemy URL for the Access database."""
+        # Imported here so that importing hytek does not load pyodbc, the explicit
+        # import also registers the dialect in frozen builds without entry points
+        # pylint: disable-next=import-outside-toplevel,unused-import
+        import sqlalchemy_access.pyodbc  # type: ignore # noqa: F401
+
         connection_string = (
             f"DRIVER={self.driver};"
             f"DBQ={self.db_path};"
             f"PWD={self.password};"
             "ExtendedAnsiSQL=1;"
         )
-        connection_url = sa.engine.URL.create(
+        return sa.engine.URL.create(
             "access+pyodbc", 
             query={"odbc_connect": connection_string}
         )
-        self.engine = sa.create_engine(connection_url)
 
-    def read_data(self, query: str) -> pd.DataFrame:
+    def read_data(self, query: Union[str, sa.TextClause]) -> pd.DataFrame:
         """Read data from database using specified query.
 
         Args:
-            query: Optional SQL query string. Uses DEFAULT_SQL if not provided.
+            query: SQL query string, or a text clause with bound parameters
 
         Returns:
             pandas DataFrame containing query results
@@ -69,68 +221,160 @@ class HyTekReader:
         
         return self.df
 
+    @timed
     def read_meet_info(self) -> pd.DataFrame:
         """Read meet information from the database."""
 
-        MEET_INFO_SQL = """
-            SELECT 
-                TRIM(M.Meet_name1) AS Meet_name, 
-                M.Meet_start,
-                M.Meet_end,
-                M.Calc_date,
-                M.course_order,
-                M.EntryEligibility_date
-            FROM 
-                Meet AS M;
-        """
         if not self.engine:
             self.connect()
-        self.meet_info = self.read_data(MEET_INFO_SQL)
+        self.meet_info = self.read_data(self.MEET_INFO_SQL)
         return self.meet_info
-    
-    def read_entries_info(self) -> pd.DataFrame:
-        """Read entries information from the database."""
-
-        ENTRIES_SQL = """
-            SELECT 
-                TRIM(T.Team_abbr) AS Team_abbr, 
-                TRIM(A.Last_name) AS Last_name, 
-                TRIM(A.First_name) AS First_name, 
-                A.Reg_no,
-                A.Ath_Sex, 
-                A.Birth_date, 
-                A.Ath_age, 
-                E.Event_no, 
-                E.Ind_rel, 
-                CInt(IIF(E.Event_dist IS NULL, 0, E.Event_dist)) AS Event_dist,
-                E.Event_stroke, 
-                E.Low_age, 
-                E.Event_Type, 
-                EN.ActSeed_course, 
-                CLng(IIF(EN.ActualSeed_time IS NULL, 0, EN.ActualSeed_time * 100)) AS ActualSeed_time,
-                EN.ConvSeed_course, 
-                CLng(IIF(EN.ConvSeed_time IS NULL, 0, EN.ConvSeed_time * 100)) AS ConvSeed_time,
-                EN.Scr_stat, 
-                EN.Bonus_event, 
-                TRIM(EN.Pre_exh) AS Pre_exh, 
-                TRIM(EN.Fin_exh) AS Fin_exh
-            FROM 
-                ((Athlete AS A 
-                INNER JOIN Team AS T ON A.Team_no = T.Team_no)
-                INNER JOIN Entry AS EN ON A.Ath_no = EN.Ath_no)
-                INNER JOIN Event AS E ON EN.Event_ptr = E.Event_ptr;
+
+    def entries_query(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        events: Optional[Tuple[int, int]] = None,
+        gender: Optional[str] = None,
+        teams: Optional[Sequence[str]] = None,
+        exclude_scratches: bool = False,
+        seeded_only: bool = False,
+    ) -> sa.TextClause:
+        """Build the entries query with the filters evaluated by the database.
+
+        Filtering in the WHERE clause means the ODBC driver only transfers the
+        rows and columns the caller needs. Values are bound as parameters.
+
+        Args:
+            columns: Output columns, a subset of ENTRIES_COLUMNS. Defaults to all of them
+            events: Inclusive (first, last) range of event numbers
+            gender: Only athletes of this Ath_Sex
+            teams: Only athletes of these team abbreviations
+            exclude_scratches: Leave out scratched entries (Scr_stat)
+            seeded_only: Leave out entries without an actual seed time
+
+        Returns:
+            SQLAlchemy text clause for read_data or iter_entries
+        """
+        columns = list(columns or self.ENTRIES_COLUMNS)
+        unknown = [col for col in columns if col not in self.ENTRIES_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown entries columns: {', '.join(unknown)}")
+
+        predicates = []
+        params = []
+        if events is not None:
+            predicates.append("E.Event_no BETWEEN :first_event AND :last_event")
+            params += [sa.bindparam("first_event", events[0]), sa.bindparam("last_event", events[1])]
+        if gender is not None:
+            predicates.append("A.Ath_Sex = :gender")
+            params.append(sa.bindparam("gender", gender))
+        if teams is not None:
+            predicates.append("TRIM(T.Team_abbr) IN :teams")
+            params.append(sa.bindparam("teams", list(teams), expanding=True))
+        if exclude_scratches:
+            predicates.append("EN.Scr_stat = 0")
+        if seeded_only:
+            predicates.append("EN.ActualSeed_time > 0")
+
+        sql = "SELECT " + ", ".join(self.ENTRIES_COLUMNS[col] for col in columns) + self.ENTRIES_FROM
+        if predicates:
+            sql += "\n        WHERE " + " AND ".join(predicates)
+        return sa.text(sql + ";").bindparams(*params)
+
+    @timed
+    def read_entries_info(self, **filters) -> pd.DataFrame:
+        """Read entries information from the database.
+
+        Args:
+            filters: Optional columns and filters, see entries_query
         """
+
         if not self.engine:
             self.connect()
-        self.entries_info = self.read_data(ENTRIES_SQL)
-                # Ensure integer types for specific columns
-        int_columns = ['Event_dist', 'ActualSeed_time', 'ConvSeed_time']
-        for col in int_columns:
-            if col in self.entries_info.columns:
-                self.entries_info[col] = self.entries_info[col].fillna(0).astype(int)
-
+        entries_info = self.read_data(self.entries_query(**filters) if filters else self.ENTRIES_SQL)
+        report_memory = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if report_memory:
+            raw_bytes = entries_info.memory_usage(deep=True).sum()
+        self.entries_info = self._coerce_entries(entries_info)
+        if report_memory:
+            logging.debug(
+                "Entries memory: %.1f MiB -> %.1f MiB",
+                raw_bytes / 2**20,
+                self.entries_info.memory_usage(deep=True).sum() / 2**20,
+            )
         return self.entries_info
 
+    def iter_entries(self, chunksize: int = 10000, **filters) -> Iterator[pd.DataFrame]:
+        """Read entries information from the database in chunks.
+
+        Each chunk has the same columns and types as read_entries_info, so
+        callers can process large meets without holding every entry at once.
+        The exception is categorical columns: each chunk only has the
+        categories of its own rows, so pd.concat of the chunks turns them into
+        object columns. Combine them with pandas.api.types.union_categoricals
+        to get the categories read_entries_info would give.
+
+        Args:
+            chunksize: Number of entry rows per chunk
+            filters: Optional columns and filters, see entries_query
+
+        Yields:
+            pandas DataFrame for each chunk of entries
+        """
+        if not self.engine:
+            self.connect()
+
+        if self.engine is None:
+            raise RuntimeError("Failed to establish database connection")
+
+        query = self.entries_query(**filters) if filters else self.ENTRIES_SQL
+        for chunk in pd.read_sql(query, con=self.engine, chunksize=chunksize):
+            yield self._coerce_entries(chunk)
+
+    def _coerce_entries(self, entries: pd.DataFrame) -> pd.DataFrame:
+        """Apply ENTRIES_SCHEMA to an entries frame.
+
+        The time and distance columns default to 0 when NULL; other integer
+        columns keep their loaded type if they contain NULLs.
+        """
+        for col, dtype in self.ENTRIES_SCHEMA.items():
+            if col not in entries.columns:
+                continue
+            values = entries[col]
+            if col in self.INT_COLUMNS or dtype == 'bool':
+                values = values.fillna(0)
+            elif dtype.startswith('int') and values.isna().any():
+                continue
+            entries[col] = values.astype(dtype)
+        return entries
+
+    @timed
+    def read_snapshot(
+        self, ignore_cache: bool = False, cache: Optional[SnapshotCache] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Read meet and entries information, reusing the local snapshot if the database is unchanged.
+
+        Args:
+            ignore_cache: Skip the snapshot, re-read the database and replace it (opt_ignore_cache)
+            cache: Optional snapshot cache override
+
+        Returns:
+            Tuple of (meet_info, entries_info) DataFrames
+        """
+        cache = cache or SnapshotCache()
+        if ignore_cache:
+            cache.invalidate(str(self.db_path))
+        else:
+            snapshot = cache.load(str(self.db_path))
+            if snapshot is not None:
+                self.meet_info, self.entries_info = snapshot
+                return snapshot
+
+        meet_info = self.read_meet_info()
+        entries_info = self.read_entries_info()
+        cache.save(str(self.db_path), meet_info, entries_info)
+        return meet_info, entries_info
+
     def export_csv(self, df: pd.DataFrame, output_path: str) -> None:
         """Export the current DataFrame to CSV.
 
@@ -148,13 +392,16 @@ class HyTekReader:
         Returns:
             List of available ODBC drivers
         """
+        import pyodbc  # type: ignore  # pylint: disable=import-outside-toplevel
+
         return pyodbc.drivers()
 
 
 def main():
     """Main function to demonstrate HyTekReader usage."""
-    # Example usage
-    db_file = 'C:/Projects/TimeValidate/WRChamps.mdb'
+    parser = argparse.ArgumentParser(description="Export meet and entries information from a HyTek database")
+    parser.add_argument("db_file", help="HyTek meet database (.mdb)")
+    db_file = parser.parse_args().db_file
     password = HYTEK_DB_PASSWORD
     
     # Create reader instance
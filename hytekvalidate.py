@@ -1,30 +1,68 @@
 # Test basic functions
-import customtkinter as ctk  # type: ignore
-import hytekvalidate_ui as ui
 from version import APP_VERSION
 from config import appConfig
+from platformdirs import user_config_dir
+from typing import Any, Optional
+import datetime
 import logging
+import multiprocessing
 import os
 import sys
-import app_version
-from requests.exceptions import RequestException
+import threading
 
+# How long the result of an update check is reused before asking GitHub again
+UPDATE_CHECK_TTL = datetime.timedelta(hours=12)
 
-def check_for_update() -> None:
-    """Notifies if there's a newer released version"""
-    current_version = APP_VERSION
-    try:
-        latest_version = app_version.latest()
-        if latest_version is not None and not app_version.is_latest_version(latest_version, current_version):
+# Subcommands of hytekvalidate_cli, any other arguments start the GUI
+CLI_COMMANDS = {"validate", "batch"}
+
+
+def check_for_update(root: Any, cache_file: Optional[str] = None) -> threading.Thread:
+    """Notifies if there's a newer released version
+
+    The lookup runs in a background thread so startup never waits on the
+    network, and the result is reported on the Tk thread through root.after().
+    """
+    if cache_file is None:
+        cache_file = os.path.join(user_config_dir("Hytek-Validate", "Swim Ontario"), "update_check.json")
+    result: dict = {}
+
+    def fetch() -> None:
+        # requests is only needed here, keep it out of the startup imports
+        import app_version  # pylint: disable=import-outside-toplevel
+        from requests.exceptions import RequestException  # pylint: disable=import-outside-toplevel
+
+        try:
+            result["latest"] = app_version.latest_cached(cache_file, UPDATE_CHECK_TTL)
+        except (RequestException, OSError) as ex:
+            result["error"] = ex
+
+    def report() -> None:
+        if thread.is_alive():
+            root.after(100, report)
+            return
+        import app_version  # pylint: disable=import-outside-toplevel
+
+        if "error" in result:
+            logging.warning("Error checking for update: %s", result["error"])
+            return
+        latest_version = result.get("latest")
+        if latest_version is not None and not app_version.is_latest_version(latest_version, APP_VERSION):
             logging.info(f"New version available {latest_version.tag}")
             logging.info(f"Download URL: {latest_version.url}")
-    #           Make it clickable???  webbrowser.open(latest_version.url))
-    except RequestException as ex:
-        logging.warning("Error checking for update: %s", ex)
+        #           Make it clickable???  webbrowser.open(latest_version.url))
 
+    thread = threading.Thread(target=fetch, daemon=True)
+    thread.start()
+    root.after(100, report)
+    return thread
 
-def main():
-    """Runs the application"""
+
+def run_gui() -> None:
+    """Runs the GUI application"""
+    # Tk is only imported for the GUI so the command line runs headless
+    import customtkinter as ctk  # type: ignore  # pylint: disable=import-outside-toplevel
+    import hytekvalidate_ui as ui  # pylint: disable=import-outside-toplevel
 
     bundle_dir = getattr(sys, "_MEIPASS", os.path.abspath(os.path.dirname(__file__)))
 
@@ -45,7 +83,6 @@ def main():
     root.resizable(True, True)
     content = ui.mainApp(root, config)
     content.grid(column=0, row=0, sticky="news")
-    check_for_update()
 
     try:
         root.update()
@@ -59,10 +96,24 @@ def main():
     except RuntimeError:
         pass
 
+    # Check once the window is up so the splash screen does not wait on the network
+    check_for_update(root)
+
     root.mainloop()
 
     config.save()
 
 
+def main():
+    """Runs the application, or the command line interface if a subcommand is given"""
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS:
+        import hytekvalidate_cli  # pylint: disable=import-outside-toplevel
+
+        sys.exit(hytekvalidate_cli.main(sys.argv[1:]))
+    run_gui()
+
+
 if __name__ == "__main__":
+    # Needed by the batch process pool in the frozen executable
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,175 @@
+"""Headless command line validation
+
+    hytekvalidate validate --db meet.mdb --ev3 events.ev3 --out report.xlsx [--incremental] [--timings]
+    hytekvalidate batch --dir meets/ --jobs 4
+
+Nothing in this module imports Tk, so it runs on machines without a display.
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional
+
+from ev3 import EV3_PARSER_VERSION, load_ev3
+from hytek import HyTekReader
+from instrumentation import recording
+from report import write_report
+from snapshot import ValidationCache, file_hash
+from validation import VALIDATION_RULES_VERSION, validate_entries, validate_incremental
+from version import HYTEK_DB_PASSWORD
+
+LOG_FORMAT = "%(levelname)s - %(message)s"
+
+
+def validate_meet(
+    db: str,
+    ev3: str,
+    out: str,
+    allow_2_percent: bool = False,
+    ignore_existing_bonus: bool = False,
+    ignore_cache: bool = False,
+    incremental: bool = False,
+    timings: bool = False,
+) -> dict:
+    """Validate one meet database against its EV3 time standards and write the report
+
+    With incremental, only the entries added or changed since the last
+    incremental run against the same EV3 file and options, and with the same
+    EV3 parser and validation rules, are re-validated. All entries are still
+    read, hashed and written to the report.
+    With timings, the time and memory of each stage are logged and saved
+    next to the report as <report>.timings.json.
+
+    Returns:
+        Summary with the meet files and the number of entries for each status
+    """
+    options = {"allow_2_percent": allow_2_percent, "ignore_existing_bonus": ignore_existing_bonus}
+    summary = {"db": db, "ev3": ev3, "out": out}
+    # Each meet is validated on a single thread, so the process-wide tracemalloc peaks are per stage
+    with recording(trace_memory=True) if timings else contextlib.nullcontext() as recorder:
+        reader = HyTekReader(db, HYTEK_DB_PASSWORD)
+        _, entries_info = reader.read_snapshot(ignore_cache=ignore_cache)
+        entries_info = entries_info[~entries_info["Scr_stat"].astype(bool)]
+
+        timestandard = load_ev3(ev3, ignore_cache=ignore_cache)["timestandard"]
+        if incremental:
+            cache = ValidationCache()
+            context = {
+                "ev3": file_hash(ev3),
+                "ev3_parser": EV3_PARSER_VERSION,
+                "rules": VALIDATION_RULES_VERSION,
+                **options,
+            }
+            previous = None if ignore_cache else cache.load(db, context)
+            validated, summary["changes"] = validate_incremental(entries_info, timestandard, previous, **options)
+            cache.save(db, context, validated)
+        else:
+            validated = validate_entries(entries_info, timestandard, **options)
+        write_report(validated, out)
+
+    if recorder is not None:
+        recorder.log_summary()
+        summary["timings"] = str(pathlib.Path(out).with_suffix(".timings.json"))
+        recorder.write_json(summary["timings"], db=db, ev3=ev3, out=out, entries=len(validated), **options)
+    return summary | {"status": validated["status"].value_counts(sort=False).to_dict()}
+
+
+def find_meets(directory: str, out_dir: Optional[str] = None) -> List[dict]:
+    """Pair every .mdb in directory with the .ev3 of the same name"""
+    meets = []
+    for db in sorted(pathlib.Path(directory).glob("*.mdb")):
+        ev3 = db.with_suffix(".ev3")
+        if not ev3.exists():
+            logging.warning("No EV3 file for %s, skipping", db.name)
+            continue
+        out = pathlib.Path(out_dir or directory) / f"{db.stem}.xlsx"
+        meets.append({"db": str(db), "ev3": str(ev3), "out": str(out)})
+    return meets
+
+
+def _log_summary(summary: dict) -> None:
+    counts = ", ".join(f"{status}: {count}" for status, count in summary["status"].items())
+    logging.info("%s -> %s (%s)", os.path.basename(summary["db"]), summary["out"], counts)
+    if "changes" in summary:
+        changes = ", ".join(f"{change}: {count}" for change, count in summary["changes"].items())
+        logging.info("%s entries %s", os.path.basename(summary["db"]), changes)
+
+
+def _init_worker_logging(level: int) -> None:
+    """Pool initializer, spawned workers start with logging unconfigured and would drop warnings"""
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+
+def run_batch(meets: List[dict], jobs: int, **options) -> int:
+    """Validate several meets across a process pool, returns the number of failures"""
+    failures = 0
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker_logging, initargs=(logging.getLogger().getEffectiveLevel(),)
+    ) as pool:
+        futures = {pool.submit(validate_meet, **meet, **options): meet for meet in meets}
+        for future in as_completed(futures):
+            try:
+                _log_summary(future.result())
+            except Exception as ex:  # pylint: disable=broad-except
+                failures += 1
+                logging.error("%s failed: %s", futures[future]["db"], ex)
+    return failures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="hytekvalidate", description="Hytek entry time validation")
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument("--allow-2-percent", action="store_true", help="Allow 2%% time conversion")
+    options.add_argument("--ignore-existing-bonus", action="store_true", help="Validate bonus entries")
+    options.add_argument("--ignore-cache", action="store_true", help="Re-read the database and EV3 file instead of the cache")
+    options.add_argument(
+        "--timings", action="store_true", help="Log stage timings and save them next to each report as JSON"
+    )
+    options.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the last run's results for unchanged entries, all entries are still read and hashed",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser("validate", parents=[options], help="Validate a single meet")
+    validate.add_argument("--db", required=True, help="Hytek meet database (.mdb)")
+    validate.add_argument("--ev3", required=True, help="EV3 event file with the time standards")
+    validate.add_argument("--out", required=True, help="Report file (.xlsx)")
+
+    batch = commands.add_parser("batch", parents=[options], help="Validate every meet in a directory")
+    batch.add_argument("--dir", required=True, help="Directory of .mdb files, each with a matching .ev3")
+    batch.add_argument("--out-dir", help="Directory for the reports, defaults to --dir")
+    batch.add_argument("--jobs", type=int, default=os.cpu_count(), help="Number of worker processes")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the command line interface, returns the process exit code"""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    options = {
+        "allow_2_percent": args.allow_2_percent,
+        "ignore_existing_bonus": args.ignore_existing_bonus,
+        "ignore_cache": args.ignore_cache,
+        "incremental": args.incremental,
+        "timings": args.timings,
+    }
+
+    if args.command == "validate":
+        _log_summary(validate_meet(args.db, args.ev3, args.out, **options))
+        return 0
+
+    meets = find_meets(args.dir, args.out_dir)
+    if not meets:
+        logging.error("No meets found in %s", args.dir)
+        return 1
+    return 1 if run_batch(meets, args.jobs, **options) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
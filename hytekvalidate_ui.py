@@ -2,21 +2,22 @@
 
 import os
 import logging
+import queue
+import threading
 import customtkinter as ctk  # type: ignore
 import webbrowser
 import tkinter as tk
 from tkinter import filedialog, BooleanVar, StringVar, HORIZONTAL
 from typing import Any
 from platformdirs import user_config_dir
-from swimrankings import SwimRankings
-from sign_config import verify_config
 import pathlib
 
 # Appliction Specific Imports
 from config import appConfig
 from version import APP_VERSION, ADMIN_MODE
-from hytekvalidate_core import HyTekValidateTimes
-from hytekvalidate_config import generate_meet_config, verify_meet_config
+
+# The validation, config and SwimRankings modules pull in pandas, sqlalchemy and
+# requests. They are imported on first use so the window appears quickly.
 
 tkContainer = Any
 
@@ -24,25 +25,62 @@ tkContainer = Any
 class TextHandler(logging.Handler):
     # This class allows you to log to a Tkinter Text or ScrolledText widget
     # Adapted from Moshe Kaplan: https://gist.github.com/moshekaplan/c425f861de7bbf28ef06
+    #
+    # Records are queued by emit() on any thread and written by a timer on the Tk
+    # thread, many records per widget update, so a burst of messages cannot flood
+    # the event loop. Only the last max_lines lines are kept in the widget, the
+    # log file has the full history.
+
+    FLUSH_MS = 100  # How often queued records are written to the widget
+    MAX_BATCH = 1000  # Records written per flush, the rest wait for the next one
+    MAX_LINES = 5000  # Scrollback kept in the widget
 
-    def __init__(self, text):
+    def __init__(self, text, max_lines: int = MAX_LINES):
         # run the regular Handler __init__
         logging.Handler.__init__(self)
         # Store a reference to the Text it will log to
         self.text = text
+        self.max_lines = max_lines
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Must be created on the Tk thread, the timer reschedules itself from there
+        self.text.after(self.FLUSH_MS, self._flush)
 
     def emit(self, record):
-        msg = self.format(record)
-
-        def append():
-            self.text.configure(state="normal")
-            self.text.insert(tk.END, msg + "\n")
-            self.text.configure(state="disabled")
-            # Autoscroll to the bottom
-            self.text.yview(tk.END)
+        try:
+            self._queue.put(self.format(record))
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
 
-        # This is necessary because we can't modify the Text from other threads
-        self.text.after(0, append)
+    def _drain(self) -> list:
+        messages = []
+        try:
+            while len(messages) < self.MAX_BATCH:
+                messages.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return messages
+
+    def _flush(self) -> None:
+        messages = self._drain()
+        try:
+            if messages:
+                self._append(messages[-self.max_lines :])
+            # Come straight back while a backlog is still queued
+            self.text.after(1 if len(messages) == self.MAX_BATCH else self.FLUSH_MS, self._flush)
+        except tk.TclError:
+            # The widget has been destroyed
+            pass
+
+    def _append(self, messages: list) -> None:
+        self.text.configure(state="normal")
+        self.text.insert(tk.END, "\n".join(messages) + "\n")
+        # The widget always ends with an empty line after the last newline
+        excess = int(self.text.index("end-1c").split(".")[0]) - 1 - self.max_lines
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+        self.text.configure(state="disabled")
+        # Autoscroll to the bottom
+        self.text.yview(tk.END)
 
 
 class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
@@ -59,8 +97,12 @@ class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
         self._opt_ignore_existing_bonus = BooleanVar(value=self._config.get_bool("opt_ignore_existing_bonus"))
         self._opt_ignore_cache = BooleanVar(value=self._config.get_bool("opt_ignore_cache"))
         self._opt_allow_2_percent = BooleanVar(value=self._config.get_bool("opt_allow_2_percent"))
+        self._opt_worker_process = BooleanVar(value=self._config.get_bool("opt_worker_process"))
+        self._progress = StringVar(value="")
 
-        self._swimrankings = SwimRankings()
+        self._swimrankings_client = None
+        self._recorder = None
+        self._worker = None
 
         # self is a vertical container that will contain 3 frames
         self.columnconfigure(0, weight=1)
@@ -121,6 +163,15 @@ class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
             command=self._handle_opt_allow_2_percent,
         ).grid(column=0, row=2, sticky="w", padx=20, pady=10)
 
+        ctk.CTkSwitch(
+            right_optionsframe,
+            text="Validate in a Separate Process",
+            variable=self._opt_worker_process,
+            onvalue=True,
+            offvalue=False,
+            command=self._handle_opt_worker_process,
+        ).grid(column=0, row=3, sticky="w", padx=20, pady=10)
+
         # Add Command Buttons
 
         ctk.CTkLabel(buttonsframe, text="Report Generation").grid(column=0, row=0, sticky="w", padx=10, pady=10)
@@ -134,6 +185,11 @@ class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
             )   
             self.meet_config_btn.grid(column=1, row=1, sticky="news", padx=20, pady=10)
 
+        self.cancel_btn = ctk.CTkButton(buttonsframe, text="Cancel", command=self._handle_cancel_btn, state="disabled")
+        self.cancel_btn.grid(column=2, row=1, sticky="news", padx=20, pady=10)
+        progress_label = ctk.CTkLabel(buttonsframe, textvariable=self._progress)
+        progress_label.grid(column=0, row=2, columnspan=3, sticky="w", padx=20)
+
         # Add Cache Control Buttons (Clear current meet, Clear all meets, Reset Cache)
         ctk.CTkLabel(cacheframe, text="Swim Rankings Cache Control").grid(column=0, row=0, sticky="w", padx=10, pady=10)
         self.clear_current_best_times_btn = ctk.CTkButton(cacheframe, text="Clear Current Best Times", command=self._handle_clear_current_meet)
@@ -145,6 +201,17 @@ class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
         self.cache_stats_btn = ctk.CTkButton(cacheframe, text="Cache Stats", command=self._handle_cache_stats)
         self.cache_stats_btn.grid(column=3, row=1, sticky="w", padx=10, pady=10)
 
+    @property
+    def _swimrankings(self):
+        """SwimRankings client, created on first use, with its best time lookups prefetched concurrently"""
+        if self._swimrankings_client is None:
+            # pylint: disable=import-outside-toplevel
+            from besttimes import BestTimesClient
+            from swimrankings import SwimRankings
+
+            self._swimrankings_client = BestTimesClient.from_config(SwimRankings(), self._config)
+        return self._swimrankings_client
+
     def _handle_hytek_db_browse(self) -> None:
         hytek_db = filedialog.askopenfilename(
             filetypes=[("Hytek Database", "*.mdb")],
@@ -209,6 +276,9 @@ class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
     def _handle_opt_allow_2_percent(self, *_arg) -> None:
         self._config.set_bool("opt_allow_2_percent", self._opt_allow_2_percent.get())
 
+    def _handle_opt_worker_process(self, *_arg) -> None:
+        self._config.set_bool("opt_worker_process", self._opt_worker_process.get())
+
     def buttons(self, newstate) -> None:
         """Enable/disable all buttons"""
         self.qb_report_btn.configure(state=newstate)
@@ -220,14 +290,44 @@ class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
            self.meet_config_btn.configure(state=newstate)
 
     def _handle_reports_btn(self) -> None:
+        if self._config.get_bool("opt_worker_process"):
+            self._start_worker()
+            return
+
+        from validation_worker import validate_times  # pylint: disable=import-outside-toplevel
+
         self.buttons("disabled")
-        
+        if self._config.get_bool("opt_record_timings"):
+            from instrumentation import StageRecorder  # pylint: disable=import-outside-toplevel
+
+            self._recorder = StageRecorder()
+            self._recorder.start()
+
         # Pass the existing SwimRankings instance to the thread
-        reports_thread = HyTekValidateTimes(self._config, self._swimrankings)
+        reports_thread = threading.Thread(target=validate_times, args=(self._config, self._swimrankings), daemon=True)
         reports_thread.start()
         self.monitor_reports_thread(reports_thread)
 
+    def _start_worker(self) -> None:
+        from validation_worker import ValidationWorker  # pylint: disable=import-outside-toplevel
+
+        self.buttons("disabled")
+        # The worker runs HyTekValidateTimes with a copy of these settings, records its own stage
+        # timings and saves them next to the report
+        self._worker = ValidationWorker(config=self._config)
+        self._worker.start()
+        self.cancel_btn.configure(state="normal")
+        self.monitor_reports_worker(self._worker)
+
+    def _handle_cancel_btn(self) -> None:
+        if self._worker is not None:
+            self.cancel_btn.configure(state="disabled")
+            self._worker.cancel()
+
     def _handle_generate_config_btn(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from hytekvalidate_config import generate_meet_config, verify_meet_config
+
         self.buttons("disabled")
         meet_config = generate_meet_config(self._config)
         
@@ -244,8 +344,33 @@ class _Entry_Validation_Tab(ctk.CTkFrame):  # pylint: disable=too-many-ancestors
         else:
             self.buttons("enabled")
             thread.join()
+            if self._recorder is not None:
+                self._recorder.stop()
+                self._recorder.log_summary()
+                report_file = self._config.get_str("report_file")
+                self._recorder.write_json(
+                    str(pathlib.Path(report_file).with_suffix(".timings.json")),
+                    hytek_db=self._config.get_str("hytek_db"),
+                    report_file=report_file,
+                )
+                self._recorder = None
+
+    def monitor_reports_worker(self, worker):
+        if worker.poll():
+            if worker.progress is not None:
+                step, done, total = worker.progress
+                self._progress.set(f"{step} ({done + 1}/{total})")
+            # drain the worker's messages every 100ms
+            self.after(100, lambda: self.monitor_reports_worker(worker))
+            return
+        self._worker = None
+        self._progress.set("")
+        self.cancel_btn.configure(state="disabled")
+        self.buttons("enabled")
 
     def _handle_clear_current_meet(self) -> None:
+        from sign_config import verify_config  # pylint: disable=import-outside-toplevel
+
         # Load, validate and read the config file to get the meet UUID
         self.buttons("disabled")
         config_data = verify_config(self._config.get_str("meet_config_file"), "public_key.pem")
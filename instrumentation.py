@@ -0,0 +1,191 @@
+"""Per-stage timing and memory instrumentation for validation runs
+
+Stages are marked with the stage() context manager or the timed decorator.
+They cost one global lookup until a StageRecorder is started, after which
+each stage records its wall time and the CPU time of the calling thread, and
+with trace_memory the peak memory traced by tracemalloc while it ran. Stages
+nest, so connect shows up inside read_entries_info when the reader connects
+on first use.
+
+    with recording() as recorder:
+        validate_meet(...)
+    recorder.log_summary()
+    recorder.write_json("timings.json")
+"""
+
+import contextlib
+import datetime
+import functools
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+_active: Optional["StageRecorder"] = None
+
+
+class StageRecorder:
+    """Collects one record per stage while it is the active recorder
+
+    tracemalloc has a single process-wide peak, which each stage resets when it
+    starts. Peaks are only meaningful when stages run on one thread at a time:
+    a stage that overlaps one on another thread resets that stage's peak and
+    counts its allocations. Leave trace_memory off when validation runs
+    alongside other threads, as in the GUI.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stages: List[dict] = []
+        self.started: Optional[str] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stop_tracing = False
+
+    def start(self) -> None:
+        """Make this the active recorder, starting tracemalloc if it is not already tracing"""
+        global _active  # pylint: disable=global-statement
+        self.started = datetime.datetime.now().isoformat(timespec="seconds")
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracing = True
+        _active = self
+
+    def stop(self) -> None:
+        """Stop recording, tracemalloc is only stopped if start() started it"""
+        global _active  # pylint: disable=global-statement
+        if _active is self:
+            _active = None
+        if self._stop_tracing:
+            tracemalloc.stop()
+            self._stop_tracing = False
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Record the wall time, CPU time and peak traced memory of the enclosed block"""
+        stack = self._local.__dict__.setdefault("stack", [])
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        frame = {"peak": 0}
+        if tracing:
+            base, peak = tracemalloc.get_traced_memory()
+            # Resetting the peak loses the enclosing stage's peak so far, keep it in its frame
+            if stack:
+                stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+        stack.append(frame)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            record = {
+                "name": name,
+                "depth": len(stack) - 1,
+                "wall_s": time.perf_counter() - wall,
+                "cpu_s": time.thread_time() - cpu,
+                "peak_bytes": None,
+            }
+            stack.pop()
+            if tracing:
+                peak = max(tracemalloc.get_traced_memory()[1], frame["peak"])
+                record["peak_bytes"] = max(peak - base, 0)
+                if stack:
+                    stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+            with self._lock:
+                self.stages.append(record)
+
+    def totals(self) -> Dict[str, dict]:
+        """Stage records combined by name, in the order each stage first finished"""
+        totals: Dict[str, dict] = {}
+        for record in self.stages:
+            total = totals.setdefault(
+                record["name"], {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": None}
+            )
+            total["calls"] += 1
+            total["wall_s"] += record["wall_s"]
+            total["cpu_s"] += record["cpu_s"]
+            if record["peak_bytes"] is not None:
+                total["peak_bytes"] = max(total["peak_bytes"] or 0, record["peak_bytes"])
+        return totals
+
+    def summary(self) -> List[str]:
+        """One line per stage name for the log window
+
+        >>> recorder = StageRecorder(trace_memory=False)
+        >>> recorder.stages = [{"name": "connect", "depth": 0, "wall_s": 0.5, "cpu_s": 0.25, "peak_bytes": None}]
+        >>> recorder.summary()
+        ['connect               1x  wall   0.500s  cpu   0.250s']
+        """
+        lines = []
+        for name, total in self.totals().items():
+            line = f"{name:20} {total['calls']:>2}x  wall {total['wall_s']:7.3f}s  cpu {total['cpu_s']:7.3f}s"
+            if total["peak_bytes"] is not None:
+                line += f"  peak {total['peak_bytes'] / 2**20:7.1f} MiB"
+            lines.append(line)
+        return lines
+
+    def log_summary(self, level: int = logging.INFO) -> None:
+        """Write the summary through logging, which the UI shows in its log window"""
+        logging.log(level, "Stage timings:")
+        for line in self.summary():
+            logging.log(level, "  %s", line)
+
+    def to_dict(self) -> dict:
+        return {"started": self.started, "stages": self.stages, "totals": self.totals()}
+
+    def write_json(self, file: str, **metadata) -> None:
+        """Save the stages, their totals and any metadata (meet files, options) for comparing runs"""
+        with open(file, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict() | metadata, f, indent=2)
+
+
+@contextlib.contextmanager
+def recording(trace_memory: bool = False) -> Iterator[StageRecorder]:
+    """Record the stages run inside the block, see StageRecorder for trace_memory"""
+    recorder = StageRecorder(trace_memory=trace_memory)
+    recorder.start()
+    try:
+        yield recorder
+    finally:
+        recorder.stop()
+
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Mark a stage, recorded only while a StageRecorder is active"""
+    recorder = _active
+    if recorder is None:
+        yield
+        return
+    with recorder.stage(name):
+        yield
+
+
+def timed(name: Union[str, Callable, None] = None) -> Callable:
+    """Decorator that runs the function as a stage, named after the function unless a name is given
+
+    >>> @timed("work")
+    ... def work():
+    ...     return 42
+    >>> with recording(trace_memory=False) as recorder:
+    ...     work()
+    42
+    >>> [record["name"] for record in recorder.stages]
+    ['work']
+    """
+
+    def decorate(func: Callable) -> Callable:
+        stage_name = name if isinstance(name, str) else func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _active
+            if recorder is None:
+                return func(*args, **kwargs)
+            with recorder.stage(stage_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate(name) if callable(name) else decorate
@@ -0,0 +1,135 @@
+"""Excel report of validated entries"""
+
+import pandas as pd
+import xlsxwriter
+
+from instrumentation import timed
+from utils import formats_from_cs, hytek_stroke_code_to_text
+from validation import STATUSES
+
+# Fill colour of the Status cell for each entry status
+STATUS_COLOURS = {
+    "Exhibition": "BDD7EE",
+    "Bonus": "BDD7EE",
+    "NT": "FFEB9C",
+    "No Standard": "D9D9D9",
+    "Under DQT": "F4B084",
+    "Meets QT": "C6EFCE",
+    "Slower than QT": "FFC7CE",
+}
+
+# Same look as the header and index cells pandas writes
+HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+
+REPORT_COLUMNS = {
+    "Team_abbr": "Team",
+    "Last_name": "Last Name",
+    "First_name": "First Name",
+    "Reg_no": "Reg No",
+    "Ath_Sex": "Sex",
+    "Ath_age": "Age",
+    "Event_no": "Event",
+    "Event_dist": "Distance",
+    "stroke": "Stroke",
+    "seed_course": "Course",
+    "seed": "Seed Time",
+    "qt": "QT",
+    "dqt": "DQT",
+    "converted": "Converted",
+    "status": "Status",
+}
+
+
+def report_rows(validated: pd.DataFrame) -> pd.DataFrame:
+    """Entries sheet contents, with times formatted and report column names"""
+    rows = validated.assign(
+        stroke=validated["Event_stroke"].astype(object).map(hytek_stroke_code_to_text),
+        seed=formats_from_cs(validated["seed_cs"]),
+        qt=formats_from_cs(validated["qt_cs"]),
+        dqt=formats_from_cs(validated["dqt_cs"]),
+    )
+    return rows[list(REPORT_COLUMNS)].rename(columns=REPORT_COLUMNS)
+
+
+def status_counts(validated: pd.DataFrame) -> pd.DataFrame:
+    """Entry counts by team and status, teams sorted and statuses in STATUSES order"""
+    counts = pd.crosstab(validated["Team_abbr"].astype(object), validated["status"], dropna=False)
+    return counts.reindex(columns=STATUSES, fill_value=0)
+
+
+def summary_rows(counts: pd.DataFrame) -> pd.DataFrame:
+    """Summary sheet contents, the status counts with a Total row"""
+    summary = counts.copy()
+    summary.loc["Total"] = summary.sum()
+    summary.index.name = "Team"
+    return summary
+
+
+class ReportWriter:
+    """Writes the report a chunk of validated entries at a time
+
+    The workbook is written by xlsxwriter in constant_memory mode, which
+    flushes each row to a temporary file once the next row is started, so
+    memory use does not grow with the meet. The Summary sheet is built from
+    status counts kept as the chunks are written.
+
+        with ReportWriter(report_file) as writer:
+            for chunk in chunks:
+                writer.write(validate_entries(chunk, timestandard))
+    """
+
+    def __init__(self, report_file: str):
+        self.workbook = xlsxwriter.Workbook(
+            report_file, {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+        )
+        self.header_format = self.workbook.add_format(HEADER_FORMAT)
+        self.status_formats = {
+            status: self.workbook.add_format({"pattern": 1, "bg_color": f"#{colour}"})
+            for status, colour in STATUS_COLOURS.items()
+        }
+        # Summary comes first in the workbook but is only written once all the entries have been counted
+        self.summary_sheet = self.workbook.add_worksheet("Summary")
+        self.entries_sheet = self.workbook.add_worksheet("Entries")
+        self.entries_sheet.write_row(0, 0, list(REPORT_COLUMNS.values()), self.header_format)
+        self.entries_sheet.freeze_panes(1, 0)
+        self.rows_written = 0
+        self.counts = pd.DataFrame(columns=STATUSES, dtype="int64")
+
+    def write(self, validated: pd.DataFrame) -> None:
+        """Append a chunk of validated entries to the Entries sheet and add them to the status counts"""
+        rows = report_rows(validated)
+        # Python values, with missing values as None so they are written as blank cells
+        columns = [rows[col].astype(object).where(rows[col].notna(), None).tolist() for col in rows.columns]
+        status_col = len(columns) - 1
+        write_row = self.entries_sheet.write_row
+        write = self.entries_sheet.write
+        formats = self.status_formats
+        first = self.rows_written + 1
+        for i, values in enumerate(zip(*columns), start=first):
+            write_row(i, 0, values[:status_col])
+            write(i, status_col, values[status_col], formats.get(values[status_col]))
+        self.rows_written += len(rows)
+        self.counts = self.counts.add(status_counts(validated), fill_value=0)
+
+    def close(self) -> None:
+        """Write the Summary sheet and finish the workbook"""
+        summary = summary_rows(self.counts.sort_index().astype("int64"))
+        self.summary_sheet.write_row(0, 0, [summary.index.name, *summary.columns], self.header_format)
+        for i, (team, counts) in enumerate(zip(summary.index, summary.to_numpy().tolist()), start=1):
+            self.summary_sheet.write(i, 0, team, self.header_format)
+            self.summary_sheet.write_row(i, 1, counts)
+        self.workbook.close()
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+@timed
+def write_report(validated: pd.DataFrame, report_file: str, chunksize: int = 10_000) -> None:
+    """Write the validated entries and a summary to an Excel workbook, chunksize rows at a time"""
+    with ReportWriter(report_file) as writer:
+        for start in range(0, len(validated), chunksize):
+            writer.write(validated.iloc[start : start + chunksize])
@@ -0,0 +1,301 @@
+"""Local snapshot caches of the HyTek database extract and parsed EV3 files
+
+The meet and entries frames read over ODBC are stored column by column in a
+NumPy .npz file, keyed on the database path and validated against its size,
+modification time and content hash, so reruns against an unchanged database
+skip the Access driver entirely.
+
+Parsed EV3 files are stored the same way, keyed by the file's content hash and
+the parser version, with least recently used files evicted past a size limit.
+
+The last validation result for each database is kept too, so a rerun during the
+entry window only re-validates the entries that were added or changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from platformdirs import user_config_dir
+
+# Bump when the stored layout changes so old snapshots are ignored
+SNAPSHOT_VERSION = 3
+
+FRAMES = ("meet_info", "entries_info")
+
+# Object columns of these kinds are stored as typed arrays and come back as the same Python values
+OBJECT_KINDS = {"integer": np.int64, "floating": np.float64, "mixed-integer-float": np.float64, "boolean": np.bool_}
+
+
+def mdb_fingerprint(db_path: str, content_hash: bool = True) -> Dict[str, object]:
+    """Identify a database file by path, size, mtime and (optionally) a SHA-256 of its contents"""
+    path = pathlib.Path(db_path).resolve()
+    stat = path.stat()
+    fingerprint: Dict[str, object] = {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if content_hash:
+        with open(path, "rb") as f:
+            fingerprint["sha256"] = hashlib.file_digest(f, "sha256").hexdigest()
+    return fingerprint
+
+
+def frame_to_arrays(df: pd.DataFrame, prefix: str) -> Dict[str, np.ndarray]:
+    """Split a DataFrame into plain NumPy arrays that can be saved without pickling
+
+    Object columns must hold strings, integers, floats or booleans (and missing
+    values). Other objects, such as dates or bytes, raise TypeError rather than
+    coming back as their string form.
+
+    >>> df = pd.DataFrame({"name": ["A", None], "time": [6500, 0], "course": pd.Categorical(["L", "S"])})
+    >>> arrays = frame_to_arrays(df, "f")
+    >>> frame_from_arrays(arrays, "f").equals(df)
+    True
+    >>> frame_from_arrays(frame_to_arrays(df.set_index(pd.Index([3, 3])), "f"), "f").index.tolist()
+    [3, 3]
+    >>> mixed = pd.DataFrame({"n": pd.Series([7, None], dtype=object), "flag": pd.Series([True, None], dtype=object)})
+    >>> frame_from_arrays(frame_to_arrays(mixed, "f"), "f").to_dict("list")
+    {'n': [7, None], 'flag': [True, None]}
+    >>> frame_to_arrays(pd.DataFrame({"raw": [b"x"]}), "f")
+    Traceback (most recent call last):
+    ...
+    TypeError: Column 'raw' holds bytes objects, only strings, numbers and booleans can be stored
+    """
+    columns = []
+    arrays: Dict[str, np.ndarray] = {}
+    for i, col in enumerate(df.columns):
+        values = df[col]
+        if values.dtype == object:
+            mask = values.isna().to_numpy()
+            kind = pd.api.types.infer_dtype(values, skipna=True)
+            if kind in ("string", "empty"):
+                arrays[f"{prefix}.c{i}"] = values.where(~mask, "").astype(str).to_numpy(dtype=str)
+                columns.append([col, "object"])
+            elif kind in OBJECT_KINDS:
+                arrays[f"{prefix}.c{i}"] = values.where(~mask, 0).to_numpy(dtype=OBJECT_KINDS[kind])
+                columns.append([col, f"object:{kind}"])
+            else:
+                raise TypeError(
+                    f"Column {col!r} holds {kind} objects, only strings, numbers and booleans can be stored"
+                )
+            arrays[f"{prefix}.m{i}"] = mask
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            arrays[f"{prefix}.c{i}"] = values.cat.codes.to_numpy()
+            arrays[f"{prefix}.k{i}"] = values.cat.categories.astype(str).to_numpy(dtype=str)
+            columns.append([col, "category"])
+        else:
+            arrays[f"{prefix}.c{i}"] = values.to_numpy()
+            columns.append([col, str(values.dtype)])
+    arrays[f"{prefix}.columns"] = np.array(json.dumps(columns))
+    if not df.index.equals(pd.RangeIndex(len(df))) and df.index.dtype.kind in "iu":
+        arrays[f"{prefix}.index"] = df.index.to_numpy()
+    return arrays
+
+
+def save_arrays(cache_file: pathlib.Path, frames: Dict[str, pd.DataFrame], **arrays: np.ndarray) -> bool:
+    """Write the frames and extra arrays to cache_file, returns False if they could not be stored
+
+    Each writer saves to its own temporary file and replaces cache_file with it,
+    so parallel writers of the same entry (batch runs sharing an EV3 file) never
+    see each other's partial files. A write that fails, for example because
+    another process has cache_file open on Windows, is logged and skipped.
+    """
+    try:
+        for frame, df in frames.items():
+            arrays |= frame_to_arrays(df, frame)
+    except TypeError as ex:
+        logging.warning("Not caching %s: %s", cache_file.name, ex)
+        return False
+    tmp_file = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, prefix=f"{cache_file.stem}.", delete=False) as f:
+            tmp_file = pathlib.Path(f.name)
+            np.savez(f, **arrays)
+        os.replace(tmp_file, cache_file)
+    except OSError as ex:
+        logging.warning("Not caching %s: %s", cache_file.name, ex)
+        if tmp_file is not None:
+            tmp_file.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def frame_from_arrays(arrays, prefix: str) -> pd.DataFrame:
+    """Rebuild a DataFrame saved with frame_to_arrays"""
+    data = {}
+    for i, (col, dtype) in enumerate(json.loads(str(arrays[f"{prefix}.columns"]))):
+        values = arrays[f"{prefix}.c{i}"]
+        if dtype.startswith("object"):
+            values = values.astype(object)
+            values[arrays[f"{prefix}.m{i}"]] = None
+        elif dtype == "category":
+            values = pd.Categorical.from_codes(values, arrays[f"{prefix}.k{i}"].astype(object))
+        data[col] = values
+    index = arrays[f"{prefix}.index"] if f"{prefix}.index" in arrays else None
+    return pd.DataFrame(data, index=index)
+
+
+class SnapshotCache:
+    """Snapshots of meet_info/entries_info keyed by the .mdb they were read from"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        if cache_dir is None:
+            cache_dir = os.path.join(user_config_dir("Hytek-Validate", "Swim Ontario"), "snapshots")
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _snapshot_file(self, db_path: str) -> pathlib.Path:
+        key = hashlib.sha1(str(pathlib.Path(db_path).resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.npz"
+
+    def load(self, db_path: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """Return (meet_info, entries_info) if a snapshot of the current database exists"""
+        snapshot_file = self._snapshot_file(db_path)
+        if not snapshot_file.exists():
+            return None
+        with np.load(snapshot_file, allow_pickle=False) as arrays:
+            stored = json.loads(str(arrays["fingerprint"]))
+            if stored.get("version") != SNAPSHOT_VERSION:
+                return None
+            # Cheap checks first, only hash the database when size and mtime still match
+            current = mdb_fingerprint(db_path, content_hash=False)
+            if any(stored.get(k) != current[k] for k in current):
+                return None
+            if stored.get("sha256") != mdb_fingerprint(db_path)["sha256"]:
+                return None
+            meet_info, entries_info = (frame_from_arrays(arrays, frame) for frame in FRAMES)
+        return meet_info, entries_info
+
+    def save(self, db_path: str, meet_info: pd.DataFrame, entries_info: pd.DataFrame) -> None:
+        """Store a snapshot of the frames read from db_path"""
+        fingerprint = mdb_fingerprint(db_path) | {"version": SNAPSHOT_VERSION}
+        save_arrays(
+            self._snapshot_file(db_path),
+            dict(zip(FRAMES, (meet_info, entries_info))),
+            fingerprint=np.array(json.dumps(fingerprint)),
+        )
+
+    def invalidate(self, db_path: str) -> None:
+        """Drop the snapshot for a single database"""
+        self._snapshot_file(db_path).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all snapshots"""
+        for snapshot_file in self.cache_dir.glob("*.npz"):
+            snapshot_file.unlink(missing_ok=True)
+
+
+def file_hash(file: str) -> str:
+    """SHA-256 of a file's contents"""
+    with open(file, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class EV3Cache:
+    """Parsed EV3 frames keyed by file content hash and parser version, evicted least recently used first"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 50 * 2**20):
+        if cache_dir is None:
+            cache_dir = os.path.join(user_config_dir("Hytek-Validate", "Swim Ontario"), "ev3")
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _cache_file(self, ev3_file: str, parser_version: int) -> pathlib.Path:
+        return self.cache_dir / f"{file_hash(ev3_file)}-v{parser_version}.npz"
+
+    def load(self, ev3_file: str, parser_version: int, frames: List[str]) -> Optional[Dict[str, pd.DataFrame]]:
+        """Return the cached frames for ev3_file, or None if it has not been cached or cannot be read"""
+        cache_file = self._cache_file(ev3_file, parser_version)
+        try:
+            with np.load(cache_file, allow_pickle=False) as arrays:
+                parsed = {frame: frame_from_arrays(arrays, frame) for frame in frames}
+            # The modification time records the last use for LRU eviction
+            os.utime(cache_file)
+        except FileNotFoundError:
+            return None
+        except OSError as ex:
+            # Evicted or replaced by another process while it was being read
+            logging.warning("Not using cached %s: %s", cache_file.name, ex)
+            return None
+        return parsed
+
+    def save(self, ev3_file: str, parser_version: int, parsed: Dict[str, pd.DataFrame]) -> None:
+        """Store the parsed frames for ev3_file, then evict old entries past max_bytes"""
+        if save_arrays(self._cache_file(ev3_file, parser_version), parsed):
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in max_bytes
+
+        Entries that another process removes or has open meanwhile are skipped.
+        """
+        entries = []
+        for cache_file in self.cache_dir.glob("*.npz"):
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, cache_file))
+        total = 0
+        for _, size, cache_file in sorted(entries, reverse=True):
+            total += size
+            if total > self.max_bytes:
+                try:
+                    cache_file.unlink(missing_ok=True)
+                except OSError as ex:
+                    logging.warning("Not evicting %s: %s", cache_file.name, ex)
+
+    def invalidate(self, ev3_file: str, parser_version: int) -> None:
+        """Drop the cached frames for a single EV3 file"""
+        self._cache_file(ev3_file, parser_version).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all cached EV3 files"""
+        for cache_file in self.cache_dir.glob("*.npz"):
+            cache_file.unlink(missing_ok=True)
+
+
+class ValidationCache:
+    """Last validated entries for each database, tagged with the EV3 file and options they were validated with"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        if cache_dir is None:
+            cache_dir = os.path.join(user_config_dir("Hytek-Validate", "Swim Ontario"), "validation")
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _cache_file(self, db_path: str) -> pathlib.Path:
+        key = hashlib.sha1(str(pathlib.Path(db_path).resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.npz"
+
+    def load(self, db_path: str, context: Dict[str, object]) -> Optional[pd.DataFrame]:
+        """Return the previous validation of db_path if it was made in the same context"""
+        cache_file = self._cache_file(db_path)
+        if not cache_file.exists():
+            return None
+        with np.load(cache_file, allow_pickle=False) as arrays:
+            if json.loads(str(arrays["context"])) != context | {"version": SNAPSHOT_VERSION}:
+                return None
+            return frame_from_arrays(arrays, "validated")
+
+    def save(self, db_path: str, context: Dict[str, object], validated: pd.DataFrame) -> None:
+        """Store the validation of db_path, replacing the previous one"""
+        save_arrays(
+            self._cache_file(db_path),
+            {"validated": validated},
+            context=np.array(json.dumps(context | {"version": SNAPSHOT_VERSION})),
+        )
+
+    def invalidate(self, db_path: str) -> None:
+        """Drop the validation for a single database"""
+        self._cache_file(db_path).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all stored validations"""
+        for cache_file in self.cache_dir.glob("*.npz"):
+            cache_file.unlink(missing_ok=True)
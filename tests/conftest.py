@@ -0,0 +1,24 @@
+"""The tests import the application modules from the repository root, and the
+SQLite and HTTP stand-ins and synthetic data generators from benchmarks/.
+Previous implementations to compare against are in references.py, which the
+benchmarks import too.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "benchmarks")]
+
+
+@pytest.fixture
+def standin(tmp_path):
+    """HyTekReader over a populated SQLite stand-in of a meet database"""
+    from hytek import engines  # pylint: disable=import-outside-toplevel
+    from hytek_standin import standin_reader  # pylint: disable=import-outside-toplevel
+
+    reader = standin_reader(str(tmp_path / "meet.db"), athletes=300)
+    yield reader
+    engines.dispose_all()
@@ -0,0 +1,102 @@
+"""Previous implementations and pandas equivalents the parity tests and benchmarks compare against"""
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.styles import PatternFill
+
+from ev3 import EVENT_FIELDS, HEADER_FIELDS, add_cs_columns
+from report import STATUS_COLOURS, report_rows, status_counts, summary_rows
+
+# Entry columns validate_entries reads
+VALIDATED_ENTRY_COLUMNS = ["Reg_no", "Ath_Sex", "Ath_age", "Event_no", "Ind_rel", "Event_dist", "Event_stroke",
+                           "ActSeed_course", "ActualSeed_time", "ConvSeed_course", "ConvSeed_time", "Bonus_event",
+                           "Pre_exh", "Fin_exh"]
+
+# HyTekReader.entries_query filters checked against pandas_filter
+ENTRY_FILTER_CASES = {
+    "exclude scratches": dict(exclude_scratches=True),
+    "validation columns, no scratches": dict(columns=VALIDATED_ENTRY_COLUMNS, exclude_scratches=True),
+    "seeded, no scratches": dict(exclude_scratches=True, seeded_only=True),
+    "girls, events 1-12": dict(gender="F", events=(1, 12)),
+    "three teams": dict(teams=["T001", "T002", "T003"]),
+}
+
+
+def parse_sdif_ev3_reference(file: str) -> dict:
+    """The previous parse_sdif_ev3: two reads of the file, post-hoc fills and a per-row gender apply"""
+    events = pd.read_csv(file, delimiter=";", names=EVENT_FIELDS, skiprows=1, index_col=False, header=None,
+                         encoding="utf-8")
+    events["event_no"] = events["event_no"].astype(str)
+    events["min_age"] = events["min_age"].astype(int)
+    events["max_age"] = events["max_age"].astype(int)
+    for col in ["lcm_qt", "lcm_dqt", "scm_qt", "scm_dqt"]:
+        events[col] = events[col].replace(np.nan, "0.00").astype(str)
+    events["gender"] = events["gender"].apply(lambda x: "M" if x in ["M", "B"] else "F" if x in ["F", "W", "G"] else x)
+    events = events.join(add_cs_columns(events))
+    header = pd.read_csv(file, delimiter=";", names=HEADER_FIELDS, index_col=False, nrows=1, header=None,
+                         encoding="utf-8")
+    return {"events": events, "header": header}
+
+
+def ev3_to_timestandard_reference(ev3data: pd.DataFrame) -> pd.DataFrame:
+    """The previous ev3_to_timestandard: copy, rename and concat each course in a loop (LCM and SCM only)"""
+    timestandard = pd.DataFrame()
+    for course in ["lcm", "scm"]:
+        course_data = ev3data[["ind_or_relay", "gender", "min_age", "max_age", "distance", "stroke", f"{course}_qt",
+                               f"{course}_dqt", f"{course}_qt_cs", f"{course}_dqt_cs"]].copy()
+        course_data["course"] = course.upper()
+        course_data["course_qt"] = course_data[f"{course}_qt"]
+        course_data["course_dqt"] = course_data[f"{course}_dqt"]
+        course_data["course_qt_cs"] = course_data[f"{course}_qt_cs"]
+        course_data["course_dqt_cs"] = course_data[f"{course}_dqt_cs"]
+        course_data.drop(columns=[f"{course}_qt", f"{course}_dqt", f"{course}_qt_cs", f"{course}_dqt_cs"],
+                         inplace=True)
+        timestandard = pd.concat([timestandard, course_data])
+    return timestandard[timestandard["course_qt"] != "0.00"].copy()
+
+
+def openpyxl_report(validated: pd.DataFrame, report_file: str) -> None:
+    """The previous write_report, the whole workbook built in memory"""
+    rows = report_rows(validated)
+    with pd.ExcelWriter(report_file, engine="openpyxl") as writer:
+        summary_rows(status_counts(validated)).to_excel(writer, sheet_name="Summary")
+        rows.to_excel(writer, sheet_name="Entries", index=False)
+
+        sheet = writer.sheets["Entries"]
+        status_col = rows.columns.get_loc("Status") + 1
+        fills = {status: PatternFill("solid", start_color=colour) for status, colour in STATUS_COLOURS.items()}
+        for (cell,) in sheet.iter_rows(min_row=2, min_col=status_col, max_col=status_col):
+            fill = fills.get(cell.value)
+            if fill is not None:
+                cell.fill = fill
+        sheet.freeze_panes = "A2"
+
+
+def report_cells(report_file: str) -> dict:
+    """Value, bold and fill colour of every cell of each sheet, and the Entries freeze panes"""
+    workbook = load_workbook(report_file)
+    return {
+        sheet.title: [
+            [(cell.value, cell.font.b, cell.fill.fgColor.rgb[-6:] if cell.fill.fill_type else None) for cell in row]
+            for row in sheet.iter_rows()
+        ]
+        for sheet in workbook
+    } | {"freeze": workbook["Entries"].freeze_panes}
+
+
+def pandas_filter(entries: pd.DataFrame, columns=None, events=None, gender=None, teams=None,
+                  exclude_scratches=False, seeded_only=False) -> pd.DataFrame:
+    """The filters of HyTekReader.entries_query applied in pandas to the full extract"""
+    keep = pd.Series(True, index=entries.index)
+    if events is not None:
+        keep &= entries["Event_no"].between(*events)
+    if gender is not None:
+        keep &= entries["Ath_Sex"] == gender
+    if teams is not None:
+        keep &= entries["Team_abbr"].isin(teams)
+    if exclude_scratches:
+        keep &= ~entries["Scr_stat"].astype(bool)
+    if seeded_only:
+        keep &= entries["ActualSeed_time"] > 0
+    return entries.loc[keep, columns or entries.columns].reset_index(drop=True)
@@ -0,0 +1,31 @@
+import datetime
+
+import app_version
+from app_version import ReleaseInfo
+
+TTL = datetime.timedelta(hours=1)
+RELEASE = {"tag_name": "v1.0.0", "html_url": "", "draft": False, "prerelease": False, "published_at": "2020-01-01"}
+
+
+def test_latest_cached_reuses_a_release(tmp_path, monkeypatch):
+    cache_file = str(tmp_path / "update_check.json")
+    lookups = []
+    monkeypatch.setattr(app_version, "latest", lambda: lookups.append(1) or ReleaseInfo(RELEASE))
+
+    assert app_version.latest_cached(cache_file, TTL).tag == "v1.0.0"
+    assert app_version.latest_cached(cache_file, TTL).tag == "v1.0.0"
+    assert len(lookups) == 1
+
+    assert app_version.latest_cached(cache_file, datetime.timedelta(0)).tag == "v1.0.0"
+    assert len(lookups) == 2
+
+
+def test_latest_cached_does_not_cache_a_failed_lookup(tmp_path, monkeypatch):
+    cache_file = tmp_path / "update_check.json"
+    results = [None, ReleaseInfo(RELEASE)]
+    monkeypatch.setattr(app_version, "latest", lambda: results.pop(0))
+
+    assert app_version.latest_cached(str(cache_file), TTL) is None
+    assert not cache_file.exists()
+    assert app_version.latest_cached(str(cache_file), TTL).tag == "v1.0.0"
+    assert not results
@@ -0,0 +1,345 @@
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import types
+
+import pandas as pd
+import pytest
+import requests
+from besttimes_standin import BestTimesServer, best_times
+from hytek_standin import StandinReader, standin_reader
+
+import hytek
+from besttimes import (
+    BestTimeFetcher,
+    BestTimesCache,
+    BestTimesClient,
+    FetchError,
+    SingleFlight,
+    TokenBucket,
+    entry_best_times,
+    json_fetcher,
+)
+from hytek import engines
+
+KEYS = [f"{n:010d}" for n in range(1, 21)]
+
+
+class FakeSwimRankings:
+    """SwimRankings stand-in that counts its lookups"""
+
+    def __init__(self):
+        self.lookups = []
+        self.cleared = []
+
+    def athlete_best_times(self, reg_no, course=None):
+        self.lookups.append((reg_no, course))
+        if reg_no == "unknown":
+            raise KeyError(reg_no)
+        time.sleep(0.01)
+        return best_times(reg_no)
+
+    def clear_cache(self, scope, meet_uuid=None):
+        self.cleared.append((scope, meet_uuid))
+
+    def cache_stats(self):
+        return {"client": True}
+
+
+class FakeConfig:
+    def __init__(self, **settings):
+        self.settings = {
+            "swimrankings_concurrency": 4,
+            "swimrankings_rate": 1000,
+            "swimrankings_timeout": 5,
+            "swimrankings_cache_ttl_hours": 24,
+            "swimrankings_cache_mb": 64,
+            "meet_config_file": "meet.json",
+        }
+        self.settings |= settings
+
+    def get_str(self, name):
+        return self.settings[name]
+
+    get_int = get_float = get_str
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch):
+    """Caches under tmp_path, and a meet configuration with a fixed meet_uuid"""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    sign_config = types.SimpleNamespace(verify_config=lambda file, key: {"meet_uuid": "meet-1"})
+    monkeypatch.setitem(sys.modules, "sign_config", sign_config)
+
+
+def test_token_bucket_holds_the_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.19
+
+
+def test_transient_failures_are_retried():
+    with BestTimesServer(latency=0.01, fail_every=1) as server:
+        fetcher = BestTimeFetcher(json_fetcher(server.url), concurrency=4, rate=1000, backoff=0.01)
+        results = fetcher.fetch_all(KEYS)
+    assert results == {key: best_times(key) for key in KEYS}
+    stats = fetcher.stats
+    assert (stats["requests"], stats["retries"], stats["failures"]) == (2 * len(KEYS), len(KEYS), 0)
+
+
+def test_permanent_failures_are_not_retried(caplog):
+    with BestTimesServer(latency=0) as server:
+        fetcher = BestTimeFetcher(json_fetcher(server.url.replace("besttimes", "missing")), rate=1000)
+        assert fetcher.fetch_all(KEYS[:3]) == {}
+    assert set(fetcher.errors) == set(KEYS[:3])
+    assert isinstance(fetcher.errors[KEYS[0]].cause, requests.HTTPError)
+    stats = fetcher.stats
+    assert (stats["requests"], stats["retries"], stats["failures"]) == (3, 0, 3)
+    assert "Best times lookup failed" in caplog.text
+
+
+def test_slow_requests_time_out():
+    with BestTimesServer(latency=0.5) as server:
+        fetcher = BestTimeFetcher(json_fetcher(server.url), rate=1000, retries=1, backoff=0.01, timeout=0.05)
+        with pytest.raises(FetchError) as raised:
+            fetcher.fetch_one(KEYS[0])
+    assert isinstance(raised.value.cause, requests.Timeout)
+    assert fetcher.stats["requests"] == 2
+
+
+def test_requests_in_flight_are_bounded_by_the_concurrency():
+    with BestTimesServer(latency=0.05) as server:
+        BestTimeFetcher(json_fetcher(server.url), concurrency=4, rate=1000).fetch_all(KEYS)
+    assert 1 < server.peak_in_flight <= 4
+
+
+def test_client_answers_prefetched_lookups():
+    swimrankings = FakeSwimRankings()
+    client = BestTimesClient.from_config(swimrankings, FakeConfig())
+    client.prefetch(KEYS + [f" {KEYS[0]} ", None, ""])
+    assert len(swimrankings.lookups) == len(KEYS)
+
+    assert client.athlete_best_times(KEYS[0]) == best_times(KEYS[0])
+    assert len(swimrankings.lookups) == len(KEYS)
+    # Lookups the prefetch cannot answer go to the client
+    client.athlete_best_times(KEYS[0], course="L")
+    client.athlete_best_times("0000000999")
+    client.athlete_best_times("0000000999")
+    assert swimrankings.lookups[-2:] == [(KEYS[0], "L"), ("0000000999", None)]
+
+
+def test_client_raises_the_error_of_a_failed_lookup():
+    client = BestTimesClient(FakeSwimRankings(), rate=1000)
+    with pytest.raises(KeyError):
+        client.athlete_best_times("unknown")
+
+
+def test_client_passes_everything_else_to_swimrankings():
+    swimrankings = FakeSwimRankings()
+    client = BestTimesClient(swimrankings)
+    client.prefetch(KEYS[:1])
+    client.clear_cache("meet", "uuid")
+    assert swimrankings.cleared == [("meet", "uuid")]
+    assert client.cache_stats() == {"client": True}
+    assert client.lookups is swimrankings.lookups
+    # The prefetched profiles go with the client's cache
+    client.athlete_best_times(KEYS[0])
+    assert len(swimrankings.lookups) == 2
+    with pytest.raises(AttributeError):
+        client.missing_method()
+
+
+def test_client_prefetches_the_athletes_entered_in_the_meet(tmp_path, monkeypatch):
+    db = str(tmp_path / "meet.mdb")
+    reader = standin_reader(db, athletes=50)
+    monkeypatch.setattr(hytek, "HyTekReader", StandinReader)
+    swimrankings = FakeSwimRankings()
+    try:
+        BestTimesClient.from_config(swimrankings, FakeConfig(hytek_db=db)).prefetch_meet(FakeConfig(hytek_db=db))
+        entered = reader.read_entries_info(exclude_scratches=True)["Reg_no"].unique()
+    finally:
+        engines.dispose_all()
+    assert sorted(reg_no for reg_no, _ in swimrankings.lookups) == sorted(entered)
+
+
+def test_a_failed_meet_prefetch_is_left_to_the_validation(tmp_path, monkeypatch, caplog):
+    # An empty database has no entries tables
+    monkeypatch.setattr(hytek, "HyTekReader", StandinReader)
+    swimrankings = FakeSwimRankings()
+    try:
+        BestTimesClient(swimrankings).prefetch_meet(FakeConfig(hytek_db=str(tmp_path / "empty.mdb")))
+    finally:
+        engines.dispose_all()
+    assert "Best times not prefetched" in caplog.text
+    assert not swimrankings.lookups
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def call():
+        calls.append(1)
+        release.wait(5)
+        return "profile"
+
+    results = []
+    callers = [threading.Thread(target=lambda: results.append(flight.do("A1", call))) for _ in range(8)]
+    for caller in callers:
+        caller.start()
+    while not calls:
+        time.sleep(0.001)
+    # Let the followers reach the in-flight call before it finishes
+    time.sleep(0.05)
+    release.set()
+    for caller in callers:
+        caller.join()
+    assert len(calls) == 1
+    assert sorted(results) == [("profile", False)] + [("profile", True)] * 7
+    # Finished calls are not kept, the next call runs again
+    assert flight.do("A1", lambda: "again") == ("again", False)
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("down")
+
+    def caller():
+        try:
+            flight.do("A1", fail)
+        except ValueError as ex:
+            errors.append(str(ex))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=caller)
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join()
+    follower.join()
+    assert errors == ["down", "down"]
+
+
+def test_entries_are_looked_up_once_per_athlete():
+    swimrankings = FakeSwimRankings()
+    fetcher = BestTimesClient(swimrankings, rate=1000).fetcher
+    entries = pd.DataFrame({"Reg_no": ["A1", "B2", "A1 ", None, "unknown", "B2"]}, index=[5, 6, 7, 8, 9, 10])
+    profiles, summary = entry_best_times(entries, fetcher)
+    assert sorted(reg_no for reg_no, _ in swimrankings.lookups) == ["A1", "B2", "unknown"]
+    assert profiles.index.tolist() == entries.index.tolist()
+    assert profiles.tolist() == [best_times("A1"), best_times("B2"), best_times("A1"), None, None, best_times("B2")]
+    assert summary == {"entries": 5, "athletes": 3, "requests": 3, "cached": 0, "calls_avoided": 2}
+
+
+def test_concurrent_lookups_of_one_athlete_share_a_request():
+    swimrankings = FakeSwimRankings()
+    client = BestTimesClient(swimrankings, rate=1000)
+    lookups = [threading.Thread(target=client.athlete_best_times, args=(KEYS[0],)) for _ in range(8)]
+    for lookup in lookups:
+        lookup.start()
+    for lookup in lookups:
+        lookup.join()
+    assert swimrankings.lookups == [(KEYS[0], None)]
+    assert client.fetcher.stats["coalesced"] + client.fetcher.stats["reused"] == 7
+
+
+def test_cache_expires_profiles_after_the_ttl(tmp_path):
+    cache = BestTimesCache(str(tmp_path), ttl=0.2)
+    cache.put("meet-1", "A1", best_times("A1"))
+    assert cache.get("meet-1", "A1") == best_times("A1")
+    time.sleep(0.25)
+    assert cache.get("meet-1", "A1") is None
+    assert cache.best_time("meet-1", "A1", "L", "A", 50) is None
+    cache.put("meet-1", "B2", best_times("B2"))
+    stats = cache.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["profiles"]) == (1, 1, 1, 1)
+    cache.close()
+
+
+def test_cache_evicts_the_least_recently_used_profiles(tmp_path):
+    size = len(json.dumps(best_times(KEYS[0]), separators=(",", ":")))
+    cache = BestTimesCache(str(tmp_path), max_bytes=int(size * 3.5))
+    for key in KEYS[:3]:
+        cache.put("", key, best_times(key))
+    # Reading the oldest makes it the most recently used once the reads are written with the next put
+    assert cache.get("", KEYS[0]) is not None
+    cache.put("", KEYS[3], best_times(KEYS[3]))
+    assert [cache.get("", key) is not None for key in KEYS[:4]] == [True, False, True, True]
+    assert cache.cache_stats()["evictions"] == 1
+    cache.close()
+
+
+def test_cache_clears_one_meet_every_meet_or_everything(tmp_path):
+    cache = BestTimesCache(str(tmp_path))
+    for meet_uuid in ("meet-1", "meet-2", ""):
+        cache.put(meet_uuid, "A1", best_times("A1"))
+    cache.clear_cache("meet", "meet-1")
+    assert [cache.get(m, "A1") is not None for m in ("meet-1", "meet-2", "")] == [False, True, True]
+    cache.clear_cache("meets")
+    assert [cache.get(m, "A1") is not None for m in ("meet-2", "")] == [False, True]
+    cache.clear_cache("all")
+    assert cache.cache_stats()["profiles"] == 0
+    assert cache.cache_stats()["hits"] == 0
+    with pytest.raises(ValueError):
+        cache.clear_cache("meet")
+    cache.close()
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc to list open files")
+def test_lookup_threads_share_one_cache_connection(tmp_path):
+    def open_cache_files():
+        files = []
+        for fd in os.listdir("/proc/self/fd"):
+            with contextlib.suppress(OSError):
+                files.append(os.readlink(f"/proc/self/fd/{fd}"))
+        return sum(file.startswith(str(tmp_path)) for file in files)
+
+    cache = BestTimesCache(str(tmp_path))
+    before = open_cache_files()
+    client = BestTimesClient(FakeSwimRankings(), concurrency=8, rate=1000, cache=cache)
+    for _ in range(5):
+        # Every run starts new pool threads
+        client.prefetch(KEYS)
+    assert open_cache_files() == before
+    client.close()
+
+
+def test_repeat_runs_are_answered_from_the_cache(tmp_path):
+    db = str(tmp_path / "meet.mdb")
+    standin_reader(db, athletes=50)
+    config = FakeConfig(hytek_db=db)
+    first, second = FakeSwimRankings(), FakeSwimRankings()
+    try:
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(hytek, "HyTekReader", StandinReader)
+            client = BestTimesClient.from_config(first, config)
+            client.prefetch_meet(config)
+            client.close()
+            # A new session, such as the worker process, reads the same cache
+            client = BestTimesClient.from_config(second, config)
+            client.prefetch_meet(config)
+    finally:
+        engines.dispose_all()
+    assert first.lookups and not second.lookups
+    assert client.fetcher.stats["cached"] == len(first.lookups)
+
+    client.clear_cache("meet", "meet-1")
+    assert second.cleared == [("meet", "meet-1")]
+    client.athlete_best_times(first.lookups[0][0])
+    assert len(second.lookups) == 1
+    client.close()
@@ -0,0 +1,79 @@
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from generators import write_ev3
+from hytek_standin import StandinReader, standin_reader
+
+import hytekvalidate_cli
+from hytek import engines
+from hytekvalidate_cli import _init_worker_logging, run_batch, validate_meet
+
+
+def test_spawned_workers_log_warnings(capfd):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        1, mp_context=context, initializer=_init_worker_logging, initargs=(logging.INFO,)
+    ) as pool:
+        pool.submit(logging.warning, "from the worker").result()
+        pool.submit(logging.debug, "below the level").result()
+    err = capfd.readouterr().err
+    assert "WARNING - from the worker" in err
+    assert "below the level" not in err
+
+
+def test_run_batch_counts_failures(tmp_path, caplog):
+    meets = [
+        {"db": str(tmp_path / "missing.mdb"), "ev3": str(tmp_path / "missing.ev3"), "out": str(tmp_path / "out.xlsx")}
+    ]
+    with caplog.at_level(logging.ERROR):
+        assert run_batch(meets, 1) == 1
+    assert "missing.mdb failed" in caplog.text
+
+
+@pytest.fixture
+def meet(tmp_path, monkeypatch):
+    """Stand-in meet database and EV3 file, with the caches under tmp_path"""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setattr(hytekvalidate_cli, "HyTekReader", StandinReader)
+    db, ev3 = str(tmp_path / "meet.mdb"), str(tmp_path / "meet.ev3")
+    standin_reader(db, athletes=200)
+    write_ev3(ev3, 300)
+    yield {"db": db, "ev3": ev3, "out": str(tmp_path / "meet.xlsx")}
+    engines.dispose_all()
+
+
+@pytest.mark.parametrize("version", ["EV3_PARSER_VERSION", "VALIDATION_RULES_VERSION"])
+def test_incremental_results_are_not_reused_across_versions(meet, monkeypatch, version):
+    first = validate_meet(**meet, incremental=True)
+    entries = first["changes"]["added"]
+    assert validate_meet(**meet, incremental=True)["changes"]["unchanged"] == entries
+
+    monkeypatch.setattr(hytekvalidate_cli, version, getattr(hytekvalidate_cli, version) + 1)
+    assert validate_meet(**meet, incremental=True)["changes"]["added"] == entries
+
+
+@pytest.mark.parametrize(
+    "argv, runs",
+    [
+        ([], "gui"),
+        (["validate", "--db", "meet.mdb"], "cli"),
+        (["batch", "meets"], "cli"),
+        (["meet.mdb"], "gui"),  # a file opened with the application
+        (["-psn_0_12345"], "gui"),  # launcher arguments
+    ],
+)
+def test_only_cli_subcommands_bypass_the_gui(monkeypatch, argv, runs):
+    import hytekvalidate  # pylint: disable=import-outside-toplevel
+
+    started = []
+    monkeypatch.setattr(sys, "argv", ["hytekvalidate", *argv])
+    monkeypatch.setattr(hytekvalidate, "run_gui", lambda: started.append("gui"))
+    monkeypatch.setattr(hytekvalidate_cli, "main", lambda args: started.append("cli") or 0)
+    try:
+        hytekvalidate.main()
+    except SystemExit as ex:
+        assert ex.code == 0
+    assert started == [runs]
@@ -0,0 +1,168 @@
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from generators import HEADER, write_ev3
+from references import ev3_to_timestandard_reference, parse_sdif_ev3_reference
+
+from ev3 import (
+    EVENT_FIELDS,
+    TIME_COLUMNS,
+    TIMESTANDARD_FIELDS,
+    EV3File,
+    ev3_to_timestandard,
+    load_ev3,
+    parse_sdif_ev3,
+    parse_sdif_ev3_mmap,
+)
+from snapshot import EV3Cache
+
+SCY = ["scy_qt", "scy_dqt"]
+
+
+def write_events(path, *events: str) -> str:
+    path.write_text(HEADER + "\n" + "".join(event + "\n" for event in events), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parse_matches_the_previous_reader(tmp_path, seed):
+    file = str(tmp_path / "meet.ev3")
+    write_ev3(file, 200, seed)
+    expected = parse_sdif_ev3_reference(file)
+    actual = parse_sdif_ev3(file)
+    pd.testing.assert_frame_equal(actual["header"], expected["header"])
+    # SCY times were left as NaN floats by the previous reader, they now default to "0.00" like the others
+    pd.testing.assert_frame_equal(actual["events"].drop(columns=SCY), expected["events"].drop(columns=SCY))
+    assert (actual["events"][SCY] == "0.00").all().all()
+
+
+def test_gender_codes_are_normalized(tmp_path):
+    file = write_events(
+        tmp_path / "genders.ev3",
+        *(f"{n};0;F;0;I;{code};0;109;50;A;;;;N;0.00;;;;;;;1;{n};1;09:00;2;0;0;0;0" for n, code in enumerate("MFBWGX"))
+    )
+    assert parse_sdif_ev3(file)["events"]["gender"].tolist() == ["M", "F", "M", "F", "F", "X"]
+
+
+def test_short_times_keep_their_centiseconds(tmp_path):
+    # A column holding only short times used to be read as floats, "40.00" became "40.0" and then 0
+    file = write_events(
+        tmp_path / "short.ev3", "1;0;F;0;I;F;0;109;50;A;;;;N;0.00;30.10;40.00;;;;;1;1;1;09:00;2;0;0;0;0"
+    )
+    events = parse_sdif_ev3(file)["events"]
+    assert events.loc[0, ["lcm_dqt", "lcm_qt"]].tolist() == ["30.10", "40.00"]
+    assert events.loc[0, ["lcm_dqt_cs", "lcm_qt_cs"]].tolist() == [3010, 4000]
+    assert events.loc[0, ["scm_qt", "scm_dqt"] + SCY].tolist() == ["0.00"] * 4
+    assert events.loc[0, ["scm_qt_cs", "scm_dqt_cs"]].tolist() == [0, 0]
+
+
+def assert_mmap_matches(file: str) -> None:
+    expected = parse_sdif_ev3(file)
+    actual = parse_sdif_ev3_mmap(file)
+    pd.testing.assert_frame_equal(actual["header"], expected["header"])
+    pd.testing.assert_frame_equal(actual["events"], expected["events"])
+    subset = parse_sdif_ev3_mmap(file, TIMESTANDARD_FIELDS)["events"]
+    pd.testing.assert_frame_equal(subset, expected["events"][subset.columns])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_mmap_matches_parse_sdif_ev3(tmp_path, seed):
+    file = str(tmp_path / "meet.ev3")
+    write_ev3(file, 500, seed)
+    assert_mmap_matches(file)
+
+
+def test_mmap_reads_crlf(tmp_path):
+    path = tmp_path / "meet.ev3"
+    write_ev3(str(path), 500)
+    path.write_bytes(path.read_bytes().replace(b"\n", b"\r\n"))
+    assert_mmap_matches(str(path))
+
+
+def test_mmap_reads_short_records_blank_lines_and_no_final_newline(tmp_path):
+    path = tmp_path / "meet.ev3"
+    write_events(
+        path,
+        "1;0;F;0;I;F;0;109;50;A;;;;N;0.00;30.10;40.00;;;;;1;1;1;09:00;2;0;0;0;0",
+        "",
+        "2;0;F;0;I;M;11;12;1500;E;;;;N;0.00;;20:01.50;;19:30.00;;;1;2;1;09:00;2;0;0;0;0",
+    )
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+    assert_mmap_matches(str(path))
+
+
+@pytest.mark.parametrize(
+    "unknown",
+    [
+        ["NA;1", "5;2"],  # missing values in numeric columns
+        ["n/a;NULL", "x;2"],  # and in text columns
+        ["True;TRUE", "true;false"],  # booleans
+        ["True;", ";2"],  # booleans with missing values
+        ['"a;b";x', "c;y"],  # a quoted separator, read by pandas
+    ],
+)
+def test_mmap_reads_values_like_pandas(tmp_path, unknown):
+    line = "{};0;F;0;I;F;0;109;50;A;{};;N;0.00;30.10;40.00;;NA;;;1;1;1;09:00;2;0;0;0;0"
+    events = [line.format(n, fields) for n, fields in enumerate(unknown)]
+    # A missing event number and a missing time
+    events.append("NA;0;F;0;I;M;11;12;1500;E;;;;N;0.00;;20:01.50;;19:30.00;;;1;2;1;09:00;2;0;0;0;0")
+    assert_mmap_matches(write_events(tmp_path / "meet.ev3", *events))
+
+
+def test_mmap_splits_only_the_fields_it_needs(tmp_path):
+    file = str(tmp_path / "meet.ev3")
+    write_ev3(file, 100)
+    with EV3File(file) as ev3:
+        ev3.events(TIMESTANDARD_FIELDS)
+        assert len(ev3._field_ends) == max(EVENT_FIELDS.index(name) for name in TIMESTANDARD_FIELDS) + 1
+        assert ev3._field_ends[0].dtype == np.uint8
+
+
+def test_time_standards_match_the_previous_reshape(tmp_path):
+    file = str(tmp_path / "meet.ev3")
+    write_ev3(file, 500)
+    events = parse_sdif_ev3(file)["events"]
+    # Give some events SCY standards, which the previous version dropped
+    scy_events = events.index[::7]
+    events.loc[scy_events, SCY + ["scy_qt_cs", "scy_dqt_cs"]] = events.loc[
+        scy_events, ["scm_qt", "scm_dqt", "scm_qt_cs", "scm_dqt_cs"]
+    ].to_numpy()
+
+    actual = ev3_to_timestandard(events)
+    # LCM then SCM rows, in the same order, with the same index and values
+    pd.testing.assert_frame_equal(actual[actual["course"] != "SCY"], ev3_to_timestandard_reference(events))
+    # followed by the SCY rows the previous version dropped
+    scy = actual[len(actual) - (events["scy_qt"] != "0.00").sum() :]
+    assert (scy["course"] == "SCY").all()
+    assert scy.index.tolist() == events.index[events["scy_qt"] != "0.00"].tolist()
+    assert scy["course_qt"].tolist() == events.loc[scy.index, "scy_qt"].tolist()
+    assert scy["course_dqt_cs"].tolist() == events.loc[scy.index, "scy_dqt_cs"].tolist()
+
+
+def test_load_ev3_reads_and_caches_the_time_standards(tmp_path):
+    file = str(tmp_path / "meet.ev3")
+    write_ev3(file, 200)
+    cache = EV3Cache(str(tmp_path / "cache"))
+    parsed = load_ev3(file, cache=cache)
+    events = parse_sdif_ev3(file)["events"]
+    # Only the columns the time standards are built from are decoded and cached
+    columns = TIMESTANDARD_FIELDS + [f"{col}_cs" for col in TIME_COLUMNS]
+    pd.testing.assert_frame_equal(parsed["events"], events[columns])
+    assert load_ev3(file, cache=cache)["events"].columns.tolist() == parsed["events"].columns.tolist()
+    pd.testing.assert_frame_equal(load_ev3(file, cache=cache)["timestandard"], parsed["timestandard"])
+
+
+def test_parallel_loads_of_the_same_content_share_the_cache(tmp_path):
+    # Batch runs load copies of one time standard file at once, their writers must not collide
+    first = tmp_path / "meet0.ev3"
+    write_ev3(str(first), 2000)
+    files = [str(first)] + [shutil.copy(first, tmp_path / f"meet{n}.ev3") for n in range(1, 8)]
+    cache = EV3Cache(str(tmp_path / "cache"))
+    with ProcessPoolExecutor(len(files)) as pool:
+        loaded = list(pool.map(load_ev3, files, [False] * len(files), [cache] * len(files)))
+    for parsed in loaded:
+        pd.testing.assert_frame_equal(parsed["timestandard"], loaded[0]["timestandard"])
+    assert [f.suffix for f in cache.cache_dir.iterdir()] == [".npz"]
@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+from pandas.api.types import union_categoricals
+from references import ENTRY_FILTER_CASES, pandas_filter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_iter_entries_matches_read_entries_info(standin):
+    full = standin.read_entries_info()
+    chunks = list(standin.iter_entries(chunksize=100))
+    assert len(chunks) > 1 and all(len(chunk) <= 100 for chunk in chunks)
+    # Each chunk has its own categories, so concatenated categoricals fall back to object
+    categorical = {col: object for col in full.select_dtypes("category").columns}
+    assert categorical
+    pd.testing.assert_frame_equal(
+        full.astype(categorical), pd.concat([chunk.astype(categorical) for chunk in chunks], ignore_index=True)
+    )
+    # and unioned, they have the categories of the whole read
+    for col in categorical:
+        unioned = union_categoricals([chunk[col] for chunk in chunks], sort_categories=True)
+        pd.testing.assert_series_equal(pd.Series(unioned, name=col), full[col])
+
+
+def test_iter_entries_chunks_have_the_entries_schema(standin):
+    chunk = next(standin.iter_entries(chunksize=50))
+    for col, dtype in standin.ENTRIES_SCHEMA.items():
+        assert str(chunk[col].dtype) == dtype, col
+
+
+def test_readers_of_the_same_database_share_an_engine(standin):
+    from hytek_standin import StandinReader
+
+    standin.connect()
+    other = StandinReader(str(standin.db_path), standin.password)
+    other.connect()
+    assert other.engine is standin.engine
+
+
+def test_pool_size_and_password_get_their_own_engine(standin):
+    from hytek_standin import StandinReader
+
+    standin.connect()
+    pooled = StandinReader(str(standin.db_path), standin.password, pool_size=4)
+    pooled.connect()
+    other_password = StandinReader(str(standin.db_path), "other")
+    other_password.connect()
+    assert len({id(standin.engine), id(pooled.engine), id(other_password.engine)}) == 3
+    assert pooled.engine.pool.size() == 4
+
+
+def test_registry_rejects_a_key_reused_with_other_settings():
+    import sqlalchemy as sa
+    from hytek import EngineRegistry
+
+    registry = EngineRegistry()
+    url = sa.engine.URL.create("sqlite", database="meet.db")
+    registry.get("meet", url, pool_size=1)
+    assert registry.get("meet", url, pool_size=1) is registry.get("meet", url)
+    with pytest.raises(ValueError):
+        registry.get("meet", url, pool_size=2)
+    registry.dispose_all()
+
+
+def test_importing_hytek_does_not_load_pyodbc():
+    code = "import sys, hytek; print(sorted({'pyodbc', 'sqlalchemy_access'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("filters", ENTRY_FILTER_CASES.values(), ids=ENTRY_FILTER_CASES.keys())
+def test_pushed_down_filters_match_pandas(standin, filters):
+    expected = pandas_filter(standin.read_entries_info(), **filters)
+    # A filtered read only has the categories of the rows it returns
+    categorical = expected.select_dtypes("category").columns
+    expected[categorical] = expected[categorical].apply(lambda col: col.cat.remove_unused_categories())
+    pd.testing.assert_frame_equal(standin.read_entries_info(**filters), expected)
+    chunks = list(standin.iter_entries(chunksize=100, **filters))
+    assert sum(map(len, chunks)) == len(expected)
+
+
+def test_entries_query_rejects_unknown_columns(standin):
+    with pytest.raises(ValueError, match="Nope"):
+        standin.entries_query(columns=["Reg_no", "Nope"])
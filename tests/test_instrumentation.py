@@ -0,0 +1,23 @@
+import tracemalloc
+
+from instrumentation import recording, stage
+
+
+def test_memory_is_not_traced_by_default():
+    with recording() as recorder:
+        with stage("work"):
+            assert not tracemalloc.is_tracing()
+    assert recorder.stages[0]["peak_bytes"] is None
+    assert recorder.totals()["work"]["calls"] == 1
+
+
+def test_traced_peaks_cover_nested_stages():
+    with recording(trace_memory=True) as recorder:
+        with stage("outer"):
+            with stage("inner"):
+                block = bytearray(4 * 2**20)
+            del block
+    assert not tracemalloc.is_tracing()
+    peaks = {record["name"]: record["peak_bytes"] for record in recorder.stages}
+    assert peaks["inner"] > 4_000_000
+    assert peaks["outer"] >= peaks["inner"]
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from generators import report_entries, synthetic_timestandard
+from openpyxl import load_workbook
+from references import openpyxl_report, report_cells
+
+from report import STATUS_COLOURS, ReportWriter, write_report
+from validation import STATUSES, validate_entries
+
+
+@pytest.fixture(name="validated", scope="module")
+def validated_entries():
+    timestandard = synthetic_timestandard()
+    # Without 200m standards some entries have no standard, so every status is reported
+    return validate_entries(report_entries(2_000), timestandard[timestandard["distance"] != 200])
+
+
+def test_streamed_report_matches_the_openpyxl_report(tmp_path, validated):
+    streamed, reference = str(tmp_path / "streamed.xlsx"), str(tmp_path / "reference.xlsx")
+    with ReportWriter(streamed) as writer:
+        for start in range(0, len(validated), 300):
+            writer.write(validated.iloc[start : start + 300])
+    openpyxl_report(validated, reference)
+    assert report_cells(streamed) == report_cells(reference)
+
+
+def test_entries_have_a_status_fill(tmp_path, validated):
+    report_file = str(tmp_path / "report.xlsx")
+    write_report(validated, report_file, chunksize=333)
+    header, *rows = load_workbook(report_file)["Entries"].iter_rows()
+    status_col = [cell.value for cell in header].index("Status")
+
+    assert [row[status_col].value for row in rows] == validated["status"].astype(str).tolist()
+    assert set(validated["status"]) == set(STATUSES)
+    for row in rows:
+        cell = row[status_col]
+        assert cell.fill.fill_type == "solid" and cell.fill.fgColor.rgb[-6:] == STATUS_COLOURS[cell.value]
+
+
+def test_summary_totals_the_counts_of_every_chunk(tmp_path, validated):
+    report_file = str(tmp_path / "report.xlsx")
+    write_report(validated, report_file, chunksize=333)
+    summary = pd.read_excel(report_file, sheet_name="Summary", index_col="Team")
+
+    expected = pd.crosstab(validated["Team_abbr"].astype(str), validated["status"].astype(str))
+    expected = expected.reindex(columns=STATUSES, fill_value=0)
+    assert summary.columns.tolist() == STATUSES
+    assert summary.index.tolist() == sorted(expected.index) + ["Total"]
+    assert (summary.drop("Total").to_numpy() == expected.sort_index().to_numpy()).all()
+    assert summary.loc["Total"].tolist() == [(validated["status"] == status).sum() for status in STATUSES]
+
+
+def test_empty_report_has_a_zero_total(tmp_path):
+    report_file = str(tmp_path / "report.xlsx")
+    with ReportWriter(report_file):
+        pass
+    summary = pd.read_excel(report_file, sheet_name="Summary", index_col="Team")
+    assert summary.index.tolist() == ["Total"] and summary.loc["Total"].tolist() == [0] * len(STATUSES)
+    assert pd.read_excel(report_file, sheet_name="Entries").empty
@@ -0,0 +1,76 @@
+import datetime
+import decimal
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from snapshot import EV3Cache, SnapshotCache, frame_from_arrays, frame_to_arrays
+
+
+def round_trip(df: pd.DataFrame) -> pd.DataFrame:
+    return frame_from_arrays(frame_to_arrays(df, "f"), "f")
+
+
+def test_round_trip_keeps_values_and_dtypes():
+    df = pd.DataFrame(
+        {
+            "name": ["A", None, "C"],
+            "count": pd.Series([1, None, 3], dtype=object),
+            "ratio": pd.Series([0.5, 1.5, None], dtype=object),
+            "flag": pd.Series([True, False, None], dtype=object),
+            "empty": pd.Series([None, None, None], dtype=object),
+            "time": np.array([6500, 0, 12], dtype=np.int32),
+            "course": pd.Categorical(["L", "S", "L"]),
+            "start": pd.to_datetime(["2024-02-23", "2024-02-24", "2024-02-25"]),
+        }
+    )
+    restored = round_trip(df)
+    pd.testing.assert_frame_equal(restored, df)
+    assert [type(v) for v in restored["count"]] == [int, type(None), int]
+    assert [type(v) for v in restored["flag"]] == [bool, bool, type(None)]
+
+
+@pytest.mark.parametrize("value", [datetime.date(2024, 2, 23), b"raw", decimal.Decimal("1.5")])
+def test_objects_that_are_not_strings_numbers_or_booleans_are_rejected(value):
+    with pytest.raises(TypeError):
+        frame_to_arrays(pd.DataFrame({"col": [value, None]}), "f")
+
+
+def test_snapshot_is_skipped_when_a_frame_cannot_be_stored(tmp_path, caplog):
+    db = tmp_path / "meet.mdb"
+    db.write_bytes(b"mdb")
+    cache = SnapshotCache(str(tmp_path / "snapshots"))
+    cache.save(str(db), pd.DataFrame({"Meet_start": [datetime.date(2024, 2, 23)]}), pd.DataFrame({"n": [1]}))
+    assert cache.load(str(db)) is None
+    assert "Not caching" in caplog.text
+
+
+def test_read_snapshot_round_trips_the_database_extract(standin, tmp_path):
+    cache = SnapshotCache(str(tmp_path / "snapshots"))
+    meet_info, entries_info = standin.read_snapshot(cache=cache)
+    cached_meet_info, cached_entries_info = standin.read_snapshot(cache=cache)
+    pd.testing.assert_frame_equal(meet_info, cached_meet_info)
+    pd.testing.assert_frame_equal(entries_info, cached_entries_info)
+
+
+def test_cache_errors_are_treated_as_misses(tmp_path, monkeypatch, caplog):
+    ev3 = tmp_path / "meet.ev3"
+    ev3.write_bytes(b"ev3")
+    cache = EV3Cache(str(tmp_path / "ev3"))
+    frames = {"events": pd.DataFrame({"n": [1]})}
+
+    def locked(*_args, **_kwargs):
+        raise PermissionError("The file is in use by another process")
+
+    monkeypatch.setattr(os, "replace", locked)
+    cache.save(str(ev3), 1, frames)
+    assert "Not caching" in caplog.text
+    assert not list(cache.cache_dir.iterdir())
+    monkeypatch.undo()
+
+    cache.save(str(ev3), 1, frames)
+    monkeypatch.setattr(np, "load", locked)
+    assert cache.load(str(ev3), 1, ["events"]) is None
+    assert "Not using cached" in caplog.text
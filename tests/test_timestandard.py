@@ -0,0 +1,31 @@
+import numpy as np
+from generators import synthetic_entries, synthetic_timestandard
+
+from timestandard import HYTEK_COURSES, TimeStandardTable
+
+
+def test_empty_standards_match_nothing():
+    table = TimeStandardTable(synthetic_timestandard().iloc[:0])
+    entries = synthetic_entries(50)
+    rows = table.match_rows(
+        entries["Ind_rel"],
+        entries["Ath_Sex"],
+        entries["Event_dist"],
+        entries["Event_stroke"],
+        entries["ConvSeed_course"].map(HYTEK_COURSES),
+        entries["Ath_age"],
+    )
+    assert (rows == -1).all()
+
+    matched = table.match_entries(entries)
+    assert matched.index.equals(entries.index)
+    assert not matched["has_standard"].any()
+    assert (matched[["course_qt", "course_dqt"]] == "0.00").all().all()
+    assert (matched[["course_qt_cs", "course_dqt_cs"]] == 0).all().all()
+
+
+def test_match_entries_finds_the_standard_for_each_age():
+    table = TimeStandardTable(synthetic_timestandard())
+    entries = synthetic_entries(500)
+    matched = table.match_entries(entries)
+    assert matched["has_standard"].to_numpy().sum() == np.isin(entries["ConvSeed_course"], ["L", "S"]).sum()
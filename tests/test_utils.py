@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from generators import synthetic_events
+from utils import format_from_cs, formats_from_cs, time_from_str, times_from_str
+
+
+@pytest.mark.parametrize(
+    "text", ["1:23.45", "23.45", "1.23", "123.45", "1:23.456", "0.00", "", "NT", "10:00.00", " 1:00.00", "59.99"]
+)
+def test_times_from_str_matches_time_from_str(text):
+    assert times_from_str([text]).tolist() == [time_from_str(text)]
+
+
+def test_times_from_str_matches_time_from_str_on_synthetic_events():
+    events = synthetic_events(2_000)
+    for col in ["lcm_qt", "scm_dqt"]:
+        assert times_from_str(events[col]).tolist() == [time_from_str(t) for t in events[col]]
+
+
+def test_times_from_str_flattens_arrays():
+    assert times_from_str(np.array([["1.00", "2.00"], ["3.00", "4.00"]])).tolist() == [100, 200, 300, 400]
+
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, 1, 99, 100, 5999, 6000, 6001, 600000, -1, -99, -6000, -6001, True, np.int64(8345), np.int32(-7)]
+    + [10**20, -(10**20)]  # beyond int64
+    + [None, float("nan"), 6000.0, np.float64(12.5), "1:00.00", pd.NA],
+)
+def test_formats_from_cs_matches_format_from_cs(value):
+    values = np.empty(1, dtype=object)
+    values[0] = value
+    assert formats_from_cs(values).tolist() == [format_from_cs(value)]
+
+
+@pytest.mark.parametrize("dtype", ["int16", "int32", "int64", "uint32", "float64"])
+def test_formats_from_cs_matches_format_from_cs_on_arrays(dtype):
+    values = np.arange(-200_000, 200_000, 13).astype(dtype)
+    assert formats_from_cs(values).tolist() == [format_from_cs(v) for v in values]
+
+
+def test_formats_from_cs_matches_format_from_cs_on_mixed_and_nullable_values():
+    mixed = pd.Series([8345, 10**20, None, 12.5, "1:00.00", -6001], dtype=object)
+    assert formats_from_cs(mixed).tolist() == [format_from_cs(v) for v in mixed]
+    nullable = pd.Series([8345, None, 0, -1], dtype="Int64")
+    assert formats_from_cs(nullable).tolist() == [format_from_cs(v) for v in nullable]
+    large = np.array([2**63 - 1, 2**64 - 1], dtype=np.uint64)
+    assert formats_from_cs(large).tolist() == [format_from_cs(v) for v in large]
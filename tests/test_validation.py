@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+from generators import next_extract, registered_entries, synthetic_timestandard, synthetic_validation_entries
+
+from snapshot import ValidationCache
+from timestandard import TimeStandardTable
+from validation import STATUS_NO_STANDARD, VALIDATION_COLUMNS, validate_entries, validate_incremental
+
+
+def test_empty_time_standards_give_no_standard():
+    entries = synthetic_validation_entries(500)
+    validated = validate_entries(entries, synthetic_timestandard().iloc[:0])
+
+    assert not validated["has_standard"].any()
+    assert (validated[["qt_cs", "dqt_cs"]] == 0).all().all()
+    plain = ~(validated["nt"] | validated["bonus"] | validated["exhibition"])
+    assert plain.any()
+    assert (validated.loc[plain, "status"] == STATUS_NO_STANDARD).all()
+
+
+def test_every_entry_with_a_standard_is_validated():
+    validated = validate_entries(synthetic_validation_entries(500), synthetic_timestandard())
+
+    assert validated["has_standard"].any()
+    assert (validated.loc[validated["has_standard"], "qt_cs"] > 0).all()
+    assert STATUS_NO_STANDARD not in set(validated.loc[validated["has_standard"], "status"])
+
+
+@pytest.mark.parametrize("changes", [0, 10, 300])
+def test_incremental_validation_matches_a_full_validation(tmp_path, changes):
+    table = TimeStandardTable(synthetic_timestandard())
+    first = registered_entries(3_000)
+    previous, counts = validate_incremental(first, table, allow_2_percent=True)
+    assert counts == {"added": 3_000, "changed": 0, "removed": 0, "unchanged": 0}
+    # Reused results come back from the validation cache
+    cache = ValidationCache(str(tmp_path))
+    cache.save("meet.mdb", {"ev3": "x"}, previous)
+    previous = cache.load("meet.mdb", {"ev3": "x"})
+
+    # changes entries edited, changes added and changes // 10 removed
+    entries = next_extract(first, changes)
+    actual, counts = validate_incremental(entries, table, previous, allow_2_percent=True)
+    expected = validate_entries(entries, table, allow_2_percent=True)
+
+    pd.testing.assert_frame_equal(actual[VALIDATION_COLUMNS], expected[VALIDATION_COLUMNS])
+    assert counts == {
+        "added": changes,
+        "changed": changes,
+        "removed": changes // 10,
+        "unchanged": len(first) - changes - changes // 10,
+    }
@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import sys
+import time
+import types
+
+from besttimes import BestTimesClient
+from validation_worker import CANCEL_GRACE_S, ValidationWorker, validate_times_job
+
+
+class FakeConfig:
+    def __init__(self, **settings):
+        self.settings = {
+            "swimrankings_concurrency": 4,
+            "swimrankings_rate": 10,
+            "swimrankings_timeout": 10,
+            "swimrankings_cache_ttl_hours": 24,
+            "swimrankings_cache_mb": 64,
+        }
+        self.settings |= settings
+
+    def get_str(self, name):
+        return self.settings[name]
+
+    get_bool = get_int = get_float = get_str
+
+
+def fake_core(monkeypatch, tmp_path):
+    """Stand-ins for HyTekValidateTimes and SwimRankings, records the arguments of each run and prefetch"""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    runs = []
+
+    class HyTekValidateTimes:
+        def __init__(self, config, swimrankings):
+            self.args = (config, swimrankings)
+
+        def run(self):
+            runs.append(self.args)
+
+    core = types.SimpleNamespace(HyTekValidateTimes=HyTekValidateTimes)
+    monkeypatch.setitem(sys.modules, "hytekvalidate_core", core)
+    monkeypatch.setitem(sys.modules, "swimrankings", types.SimpleNamespace(SwimRankings=object))
+    monkeypatch.setattr(BestTimesClient, "prefetch_meet", lambda client, config: runs.append(("prefetch", config)))
+    return runs
+
+
+def test_runs_the_gui_validation_with_the_given_config(monkeypatch, tmp_path):
+    runs = fake_core(monkeypatch, tmp_path)
+    report_file = str(tmp_path / "report.xlsx")
+    config = FakeConfig(report_file=report_file, hytek_db="meet.mdb", opt_record_timings=False)
+    steps = []
+
+    result = validate_times_job(config, progress=lambda *step: steps.append(step))
+
+    assert result == {"out": report_file}
+    assert runs[0] == ("prefetch", config)
+    assert runs[1][0] is config and isinstance(runs[1][1], BestTimesClient)
+    assert steps == [("Looking up best times", 0, 2), ("Validating entries", 1, 2)]
+    assert not (tmp_path / "report.timings.json").exists()
+
+
+def test_timings_are_saved_next_to_the_report(monkeypatch, tmp_path):
+    fake_core(monkeypatch, tmp_path)
+    report_file = str(tmp_path / "report.xlsx")
+    config = FakeConfig(report_file=report_file, hytek_db="meet.mdb", opt_record_timings=True)
+
+    validate_times_job(config, progress=lambda *step: None)
+
+    timings = json.loads((tmp_path / "report.timings.json").read_text())
+    assert "meet.mdb" in json.dumps(timings)
+
+
+# Worker targets, module level so the spawned worker can import them
+
+
+def echo_job(value, progress):
+    logging.getLogger("worker").warning("Validating %s", value)
+    progress("Validating", 0, 1)
+    return {"out": value}
+
+
+def failing_job(progress):
+    progress("Validating", 0, 1)
+    raise ValueError("no entries")
+
+
+def stepping_job(progress):
+    for step in range(1000):
+        progress("Validating", step, 1000)
+        time.sleep(0.01)
+    return {}
+
+
+def stuck_job(steps, total, progress):
+    # Reports steps of total and then hangs, only terminating it stops it
+    for step in range(steps):
+        progress("Validating", step, total)
+    time.sleep(600)
+
+
+def exiting_job(progress):
+    progress("Validating", 0, 1)
+    os._exit(3)
+
+
+def run(worker: ValidationWorker, until=None, timeout: float = 60) -> None:
+    """Poll the worker like the GUI timer until it finishes (or until(worker) is true)"""
+    deadline = time.monotonic() + timeout
+    while worker.poll() and not (until and until(worker)):
+        assert time.monotonic() < deadline, "worker did not finish"
+        time.sleep(0.02)
+
+
+def test_worker_returns_the_result_and_log_records(caplog):
+    worker = ValidationWorker(echo_job, value="report.xlsx")
+    worker.start()
+    run(worker)
+    assert worker.result == {"out": "report.xlsx"} and worker.error is None and not worker.cancelled
+    assert worker.progress == ("Validating", 0, 1)
+    assert ("worker", logging.WARNING, "Validating report.xlsx") in caplog.record_tuples
+
+
+def test_worker_reports_errors():
+    worker = ValidationWorker(failing_job)
+    worker.start()
+    run(worker)
+    assert worker.error == "ValueError: no entries" and worker.result is None
+
+
+def test_cancel_stops_the_worker_at_its_next_step():
+    worker = ValidationWorker(stepping_job)
+    worker.start()
+    run(worker, until=lambda w: w.progress is not None)
+    worker.cancel(grace=60)
+    run(worker)
+    assert worker.cancelled and worker.result is None
+    assert worker.progress[1] < 999
+
+
+def test_cancel_terminates_a_worker_that_does_not_reach_a_step():
+    worker = ValidationWorker(stuck_job, steps=1, total=2)
+    worker.start()
+    run(worker, until=lambda w: w.progress is not None)
+    worker.cancel(grace=0.5)
+    run(worker)
+    assert worker.cancelled and worker.result is None and worker.error is None
+    assert not worker._process.is_alive()
+
+
+def test_cancel_after_the_last_step_terminates_at_once():
+    worker = ValidationWorker(stuck_job, steps=2, total=2)
+    worker.start()
+    run(worker, until=lambda w: w.progress == ("Validating", 1, 2))
+    start = time.monotonic()
+    worker.cancel()
+    run(worker)
+    # Well within CANCEL_GRACE_S, the worker had no step left to stop at
+    assert worker.cancelled and time.monotonic() - start < CANCEL_GRACE_S / 2
+
+
+def test_worker_exit_without_a_result_is_an_error():
+    worker = ValidationWorker(exiting_job)
+    worker.start()
+    run(worker)
+    assert worker.error == "Validation worker exited with code 3" and worker.result is None
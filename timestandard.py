@@ -0,0 +1,131 @@
+"""Indexed time standard lookups
+
+Builds a lookup structure once from the frame returned by
+ev3.ev3_to_timestandard so that a whole entries frame can be matched to its
+qualifying (QT) and de-qualifying (DQT) times with a single searchsorted.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# HyTek entry course codes to the course names used in the EV3 time standards
+HYTEK_COURSES = {"L": "LCM", "S": "SCM", "Y": "SCY"}
+
+# Ages are packed below the key id in a single int64 sort key
+_AGE_SPAN = 1000
+
+
+class TimeStandardTable:
+    """Time standards indexed by (ind_or_relay, gender, distance, stroke, course) and age
+
+    Each key holds sorted, non-overlapping age segments. Where an EV3 has
+    overlapping age groups for the same event (e.g. Open and 13-14), the
+    narrowest group covering an age wins.
+
+    >>> ts = pd.DataFrame({
+    ...     "ind_or_relay": ["I", "I", "I"], "gender": ["F", "F", "F"], "min_age": [0, 13, 0],
+    ...     "max_age": [109, 14, 109], "distance": [100, 100, 100], "stroke": ["A", "A", "A"],
+    ...     "course": ["LCM", "LCM", "SCM"], "course_qt": ["1:05.00", "1:08.00", "1:03.00"],
+    ...     "course_dqt": ["0.00", "0.00", "0.00"], "course_qt_cs": [6500, 6800, 6300], "course_dqt_cs": [0, 0, 0]})
+    >>> table = TimeStandardTable(ts)
+    >>> table.match(["I", "I", "I", "I"], ["F", "F", "F", "M"], [100, 100, 100, 100], ["A", "A", "A", "A"],
+    ...             ["LCM", "LCM", "SCM", "LCM"], [12, 13, 13, 13])["course_qt_cs"].tolist()
+    [6500, 6800, 6300, 0]
+    """
+
+    KEY_COLUMNS = ["ind_or_relay", "gender", "distance", "stroke", "course"]
+    VALUE_COLUMNS = ["course_qt", "course_dqt", "course_qt_cs", "course_dqt_cs"]
+
+    def __init__(self, timestandard: pd.DataFrame):
+        standards = timestandard.drop_duplicates(self.KEY_COLUMNS + ["min_age", "max_age"]).reset_index(drop=True)
+        standards["distance"] = standards["distance"].astype(np.int64)
+
+        self.keys = pd.MultiIndex.from_frame(standards[self.KEY_COLUMNS]).unique()
+        key_ids = self.keys.get_indexer(pd.MultiIndex.from_frame(standards[self.KEY_COLUMNS]))
+
+        seg_key, seg_start, seg_end, seg_row = [], [], [], []
+        for key_id, rows in pd.Series(np.arange(len(standards))).groupby(key_ids):
+            min_age = standards["min_age"].to_numpy()[rows]
+            max_age = standards["max_age"].to_numpy()[rows]
+            width = max_age - min_age
+            bounds = np.unique(np.concatenate([min_age, max_age + 1]))
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                covering = np.flatnonzero((min_age <= start) & (max_age >= stop - 1))
+                if len(covering) == 0:
+                    continue
+                best = covering[np.argmin(width[covering])]
+                seg_key.append(key_id)
+                seg_start.append(start)
+                seg_end.append(stop - 1)
+                seg_row.append(rows.iloc[best])
+
+        self._sort_key = np.asarray(seg_key, dtype=np.int64) * _AGE_SPAN + np.asarray(seg_start, dtype=np.int64)
+        self._seg_key = np.asarray(seg_key, dtype=np.int64)
+        self._seg_end = np.asarray(seg_end, dtype=np.int64)
+        self._seg_row = np.asarray(seg_row, dtype=np.int64)
+        self.standards = standards
+
+    def __len__(self) -> int:
+        return len(self.standards)
+
+    def match_rows(self, ind_or_relay, gender, distance, stroke, course, age) -> np.ndarray:
+        """Row number in self.standards for each entry, -1 where there is no standard"""
+        keys = pd.MultiIndex.from_arrays(
+            [
+                np.asarray(ind_or_relay, dtype=object),
+                np.asarray(gender, dtype=object),
+                np.asarray(distance, dtype=np.int64),
+                np.asarray(stroke, dtype=object),
+                np.asarray(course, dtype=object),
+            ]
+        )
+        key_ids = self.keys.get_indexer(keys)
+        if len(self._seg_key) == 0:
+            return np.full(len(key_ids), -1, dtype=np.int64)
+        age = np.asarray(age, dtype=np.float64)
+        ages = np.clip(np.nan_to_num(age, nan=-1), -1, _AGE_SPAN - 1).astype(np.int64)
+
+        seg = np.searchsorted(self._sort_key, key_ids * _AGE_SPAN + ages, side="right") - 1
+        seg_ok = np.clip(seg, 0, None)
+        found = (key_ids >= 0) & (ages >= 0) & (seg >= 0) & (self._seg_key[seg_ok] == key_ids) & (ages <= self._seg_end[seg_ok])
+        return np.where(found, self._seg_row[seg_ok], -1)
+
+    def match(self, ind_or_relay, gender, distance, stroke, course, age) -> pd.DataFrame:
+        """QT/DQT for each entry, times are 0 and has_standard False where there is no standard"""
+        rows = self.match_rows(ind_or_relay, gender, distance, stroke, course, age)
+        found = rows >= 0
+        if len(self.standards):
+            matched = self.standards[self.VALUE_COLUMNS].iloc[np.where(found, rows, 0)].reset_index(drop=True)
+        else:
+            matched = pd.DataFrame(
+                {"course_qt": "0.00", "course_dqt": "0.00", "course_qt_cs": 0, "course_dqt_cs": 0},
+                index=pd.RangeIndex(len(rows)),
+            )
+        matched.loc[~found, ["course_qt", "course_dqt"]] = "0.00"
+        matched.loc[~found, ["course_qt_cs", "course_dqt_cs"]] = 0
+        matched["has_standard"] = found
+        return matched
+
+    def match_entries(self, entries: pd.DataFrame, course: Optional[str] = None) -> pd.DataFrame:
+        """Match a HyTekReader entries frame, indexed like entries
+
+        Args:
+            entries: Frame from HyTekReader.read_entries_info
+            course: Course of the standards to use (LCM/SCM/SCY), defaults to each entry's ConvSeed_course
+        """
+        if course is None:
+            courses = entries["ConvSeed_course"].astype(object).map(HYTEK_COURSES).to_numpy()
+        else:
+            courses = np.full(len(entries), course, dtype=object)
+        matched = self.match(
+            entries["Ind_rel"].astype(object),
+            entries["Ath_Sex"].astype(object),
+            entries["Event_dist"],
+            entries["Event_stroke"].astype(object),
+            courses,
+            entries["Ath_age"],
+        )
+        matched.index = entries.index
+        return matched
@@ -2,6 +2,12 @@
 
 import re
 
+import numpy as np
+import pandas as pd
+
+# Same pattern as time_from_str, anchored because str.extract searches rather than matches
+_TIME_PATTERN = r"^(\d+:)?(\d{1,2})\.(\d{2})"
+
 
 def time_from_str(s: str) -> int:
     m = re.match(r"(\d+:)?(\d{1,2})\.(\d{2})", s)
@@ -13,6 +19,21 @@ def time_from_str(s: str) -> int:
     return time
 
 
+def times_from_str(times) -> np.ndarray:
+    """Vectorized time_from_str for a Series or array of time strings
+
+    >>> times_from_str(["1:23.45", "23.45", "1.23", "123.45", "1:23.456", "0.00"]).tolist()
+    [8345, 2345, 123, 0, 8345, 0]
+    """
+    # Time standards repeat across age groups and sessions, so only parse each distinct string once
+    codes, uniques = pd.factorize(pd.Series(np.asarray(times, dtype=object).ravel()).astype(str))
+    parts = pd.Series(uniques).str.extract(_TIME_PATTERN)
+    minutes = parts[0].str[:-1].fillna("0").astype(np.int64).to_numpy()
+    seconds = parts[1].fillna("0").astype(np.int64).to_numpy()
+    hundredths = parts[2].fillna("0").astype(np.int64).to_numpy()
+    return (hundredths + 100 * seconds + (60 * 100) * minutes)[codes]
+
+
 def format_from_cs(centiseconds) -> str:
     try:
         c = centiseconds % 100
@@ -28,6 +49,49 @@ def format_from_cs(centiseconds) -> str:
     except:
         return "0:00.00"
 
+# "SS.cc" for every centisecond value within a minute, indexed by centiseconds % 6000
+_SECONDS_TEXT = np.array([f"{s:02d}.{c:02d}" for s in range(60) for c in range(100)])
+
+
+def formats_from_cs(centiseconds) -> np.ndarray:
+    """Vectorized format_from_cs for a Series or array of centiseconds
+
+    Integers format exactly as format_from_cs does, anything else (floats,
+    NaN, None, strings) becomes its "0:00.00" fallback.
+
+    >>> formats_from_cs([8345, 2345, 83, 0, 600000, -1]).tolist()
+    ['1:23.45', '23.45', '00.83', '00.00', '100:00.00', '-1:59.99']
+    >>> formats_from_cs(pd.Series([6000, None, 12.5, "1:00.00"], dtype=object)).tolist()
+    ['1:00.00', '0:00.00', '0:00.00', '0:00.00']
+    """
+    if isinstance(getattr(centiseconds, "dtype", None), pd.api.extensions.ExtensionDtype):
+        # Nullable integers and categories, missing values become None
+        centiseconds = pd.Series(centiseconds).to_numpy(dtype=object, na_value=None)
+    values = np.asarray(centiseconds)
+    shape, values = values.shape, values.ravel()
+    if values.dtype.kind in "iub":
+        valid = np.ones(values.shape, dtype=bool)
+    elif values.dtype == object:
+        valid = np.fromiter((isinstance(v, (int, np.integer, np.bool_)) for v in values), dtype=bool, count=values.size)
+    else:
+        # format_from_cs rejects every float, whole or not
+        return np.full(shape, "0:00.00", dtype=object)
+    try:
+        cs = np.where(valid, values, 0).astype(np.int64, casting="safe" if values.dtype.kind == "u" else "unsafe")
+    except (OverflowError, TypeError):
+        # Beyond int64, leave it to Python's arbitrary precision ints
+        return np.frompyfunc(format_from_cs, 1, 1)(values).reshape(shape)
+
+    # Seed times and standards repeat, so only build a string for each distinct value
+    codes, unique_cs = pd.factorize(cs)
+    # Floor division and modulo match Python's, so negative values format the same way
+    minutes, inverse = np.unique(unique_cs // 6000, return_inverse=True)
+    prefix = np.array([f"{m:d}:" if m else "" for m in minutes.tolist()], dtype=str)[inverse]
+    text = np.char.add(prefix, _SECONDS_TEXT[unique_cs % 6000]).astype(object)[codes]
+    text[~valid] = "0:00.00"
+    return text.reshape(shape)
+
+
 def hytek_stroke_code_to_text(stroke_code: str) -> str:
     if stroke_code == "A":
         return "Free"
@@ -46,6 +110,7 @@ if __name__ == "__main__":
     print(time_from_str("1.23"))
     print(time_from_str("123.45"))  # Invalid
     print(time_from_str("1:23.456"))  # Invalid
+    print(times_from_str(["1:23.45", "23.45", "1.23", "123.45", "1:23.456"]))
     # centiseconds tests
     print(format(83))
     print(format(1234))
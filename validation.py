@@ -0,0 +1,214 @@
+"""Entry time validation
+
+Evaluates every entry of a HyTekReader entries frame against the EV3 time
+standards in one vectorized pass. Nothing here depends on the UI, so it can
+run headless.
+"""
+
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import timed
+from timestandard import HYTEK_COURSES, TimeStandardTable
+
+# Bump when validate_entries gives different results for the same entries and time standards, so
+# results saved by an earlier version are not reused by validate_incremental
+VALIDATION_RULES_VERSION = 1
+
+# Allowance applied to the QT when a seed time has been converted from another course
+CONVERSION_ALLOWANCE = 1.02
+
+# Entry status, in order of precedence
+STATUS_EXHIBITION = "Exhibition"
+STATUS_BONUS = "Bonus"
+STATUS_NT = "NT"
+STATUS_NO_STANDARD = "No Standard"
+STATUS_UNDER_DQT = "Under DQT"
+STATUS_MEETS_QT = "Meets QT"
+STATUS_SLOWER_THAN_QT = "Slower than QT"
+STATUSES = [
+    STATUS_EXHIBITION,
+    STATUS_BONUS,
+    STATUS_NT,
+    STATUS_NO_STANDARD,
+    STATUS_UNDER_DQT,
+    STATUS_MEETS_QT,
+    STATUS_SLOWER_THAN_QT,
+]
+
+# Columns added by validate_entries
+VALIDATION_COLUMNS = [
+    "seed_course",
+    "seed_cs",
+    "converted",
+    "qt_cs",
+    "dqt_cs",
+    "has_standard",
+    "nt",
+    "exhibition",
+    "bonus",
+    "meets_qt",
+    "under_dqt",
+    "status",
+]
+
+# Identifies an entry between runs, the row hash tells whether it changed
+ENTRY_KEY = ["Reg_no", "Event_no"]
+
+
+@timed
+def validate_entries(
+    entries: pd.DataFrame,
+    timestandard: Union[pd.DataFrame, TimeStandardTable],
+    allow_2_percent: bool = False,
+    ignore_existing_bonus: bool = False,
+) -> pd.DataFrame:
+    """Validate entry times against the meet time standards
+
+    Each entry is checked with its actual seed time against the standard for
+    the course the time was swum in. If the meet has no standard for that
+    course, the converted seed time is checked against the standard for the
+    converted course, and with allow_2_percent the QT is relaxed by 2%.
+
+    Args:
+        entries: Frame from HyTekReader.read_entries_info
+        timestandard: Frame from ev3.ev3_to_timestandard, or a TimeStandardTable built from it
+        allow_2_percent: Allow converted times up to 2% slower than the QT (opt_allow_2_percent)
+        ignore_existing_bonus: Validate bonus entries like any other (opt_ignore_existing_bonus)
+
+    Returns:
+        entries with the validation columns added: seed_course, seed_cs, converted, qt_cs, dqt_cs,
+        has_standard, nt, exhibition, bonus, meets_qt, under_dqt and status
+    """
+    table = timestandard if isinstance(timestandard, TimeStandardTable) else TimeStandardTable(timestandard)
+    keys = (
+        entries["Ind_rel"].astype(object),
+        entries["Ath_Sex"].astype(object),
+        entries["Event_dist"],
+        entries["Event_stroke"].astype(object),
+    )
+    age = entries["Ath_age"]
+
+    actual_course = entries["ActSeed_course"].astype(object).map(HYTEK_COURSES).to_numpy()
+    conv_course = entries["ConvSeed_course"].astype(object).map(HYTEK_COURSES).to_numpy()
+    actual_rows = table.match_rows(*keys, actual_course, age)
+    conv_rows = table.match_rows(*keys, conv_course, age)
+
+    # Prefer the standard for the course the time was swum in
+    converted = (actual_rows < 0) & (conv_rows >= 0)
+    rows = np.where(converted, conv_rows, actual_rows)
+    has_standard = rows >= 0
+    seed_cs = np.where(converted, entries["ConvSeed_time"], entries["ActualSeed_time"]).astype(np.int64)
+    seed_course = np.where(converted, conv_course, actual_course)
+
+    qt_cs = np.zeros(len(entries), dtype=np.int64)
+    dqt_cs = np.zeros(len(entries), dtype=np.int64)
+    if len(table.standards):
+        standards = table.standards.iloc[np.where(has_standard, rows, 0)]
+        qt_cs = np.where(has_standard, standards["course_qt_cs"], 0).astype(np.int64)
+        dqt_cs = np.where(has_standard, standards["course_dqt_cs"], 0).astype(np.int64)
+
+    allowance = np.where(converted & allow_2_percent, CONVERSION_ALLOWANCE, 1.0)
+    nt = seed_cs <= 0
+    exhibition = entries["Pre_exh"].astype(object).fillna("").ne("").to_numpy() | entries["Fin_exh"].astype(
+        object
+    ).fillna("").ne("").to_numpy()
+    bonus = entries["Bonus_event"].fillna(False).astype(bool).to_numpy() & (not ignore_existing_bonus)
+    meets_qt = has_standard & ~nt & (seed_cs <= qt_cs * allowance)
+    under_dqt = has_standard & ~nt & (dqt_cs > 0) & (seed_cs < dqt_cs)
+
+    status = np.select(
+        [exhibition, bonus, nt, ~has_standard, under_dqt, meets_qt],
+        STATUSES[:-1],
+        default=STATUS_SLOWER_THAN_QT,
+    )
+
+    return entries.assign(
+        seed_course=seed_course,
+        seed_cs=seed_cs,
+        converted=converted,
+        qt_cs=qt_cs,
+        dqt_cs=dqt_cs,
+        has_standard=has_standard,
+        nt=nt,
+        exhibition=exhibition,
+        bonus=bonus,
+        meets_qt=meets_qt,
+        under_dqt=under_dqt,
+        status=pd.Categorical(status, categories=STATUSES),
+    )
+
+
+def entry_hashes(entries: pd.DataFrame) -> np.ndarray:
+    """64-bit hash of each entry's database columns, ignoring any validation columns"""
+    columns = [col for col in entries.columns if col not in VALIDATION_COLUMNS and col != "row_hash"]
+    return pd.util.hash_pandas_object(entries[columns], index=False).to_numpy()
+
+
+@timed
+def validate_incremental(
+    entries: pd.DataFrame,
+    timestandard: Union[pd.DataFrame, TimeStandardTable],
+    previous: Optional[pd.DataFrame] = None,
+    allow_2_percent: bool = False,
+    ignore_existing_bonus: bool = False,
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Validate entries, reusing the results of a previous run for the entries that did not change
+
+    An entry whose row hash matches a previously validated row gets that row's
+    results, only the added and changed entries go through validate_entries.
+    Every entry is still hashed and matched against previous, so a run costs
+    a pass over the whole frame plus validating the changes, it saves the
+    validation of unchanged entries rather than scaling with the changes.
+    previous must come from the same time standards and options, otherwise the
+    reused results are stale.
+
+    Args:
+        entries: Frame from HyTekReader.read_entries_info
+        timestandard: Frame from ev3.ev3_to_timestandard, or a TimeStandardTable built from it
+        previous: Result of an earlier validate_incremental call, None validates everything
+        allow_2_percent: Allow converted times up to 2% slower than the QT (opt_allow_2_percent)
+        ignore_existing_bonus: Validate bonus entries like any other (opt_ignore_existing_bonus)
+
+    Returns:
+        Tuple of the validate_entries result with a row_hash column, in the order of entries, and
+        the number of added, changed, removed and unchanged entries keyed by ENTRY_KEY
+    """
+    row_hash = entry_hashes(entries)
+    options = {"allow_2_percent": allow_2_percent, "ignore_existing_bonus": ignore_existing_bonus}
+    if previous is None or len(previous) == 0:
+        changes = {"added": len(entries), "changed": 0, "removed": 0, "unchanged": 0}
+        return validate_entries(entries, timestandard, **options).assign(row_hash=row_hash), changes
+
+    # Position of each entry's identical row in previous, -1 if it is new or changed
+    previous_hash = pd.Index(previous["row_hash"].to_numpy())
+    first = np.flatnonzero(~previous_hash.duplicated())
+    match = previous_hash[first].get_indexer(row_hash)
+    stale = match < 0
+    reused = first[match[~stale]]
+
+    columns = {}
+    validated = validate_entries(entries[stale], timestandard, **options) if stale.any() else None
+    for col in VALIDATION_COLUMNS:
+        values = previous[col].to_numpy()
+        if validated is None:
+            columns[col] = values[reused]
+            continue
+        merged = np.empty(len(entries), dtype=np.result_type(values.dtype, validated[col].to_numpy().dtype))
+        merged[~stale] = values[reused]
+        merged[stale] = validated[col].to_numpy()
+        columns[col] = merged
+    columns["status"] = pd.Categorical(columns["status"], categories=STATUSES)
+
+    keys = pd.util.hash_pandas_object(entries[ENTRY_KEY], index=False).to_numpy()
+    previous_keys = pd.util.hash_pandas_object(previous[ENTRY_KEY], index=False).to_numpy()
+    known = np.isin(keys[stale], previous_keys)
+    changes = {
+        "added": int((~known).sum()),
+        "changed": int(known.sum()),
+        "removed": int((~np.isin(previous_keys, keys)).sum()),
+        "unchanged": int((~stale).sum()),
+    }
+    return entries.assign(**columns, row_hash=row_hash), changes
@@ -0,0 +1,211 @@
+"""Validation in a separate process, so the GUI stays responsive
+
+Validation is CPU-bound pandas work and an Excel write, both of which hold the
+GIL, so running it on a thread in the GUI process stalls the Tk event loop.
+ValidationWorker runs it in a child process instead. Log records, progress
+and the result come back over a multiprocessing queue, and the GUI drains the
+queue from its after() timer by calling poll():
+
+    worker = ValidationWorker(config=config)
+    worker.start()
+    ...
+    if not worker.poll():
+        report(worker.result or worker.error)
+
+cancel() asks the worker to stop at its next progress step and terminates it
+if it is still running after a grace period. A GUI validation reports a step
+after the best times are looked up. HyTekValidateTimes itself reports none,
+so once the worker has reported its last step (done == total - 1) there is
+nothing to wait for and a cancelled worker is terminated at once.
+
+Nothing in this module imports Tk. The child process is started with spawn,
+as a forked copy of a process running Tk is not safe.
+"""
+
+import contextlib
+import logging
+import logging.handlers
+import multiprocessing
+import pathlib
+import queue
+import time
+from typing import Callable, Optional, Tuple
+
+# How long a cancelled worker gets to stop at a progress step before it is terminated
+CANCEL_GRACE_S = 5.0
+
+
+class Cancelled(Exception):
+    """Raised in the worker at the next progress step after cancel()"""
+
+
+def _run(target: Callable[..., dict], job: dict, messages, cancel_event, log_level: int) -> None:
+    """Worker process entry point, sends log records, progress and then one of result, error or cancelled"""
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(messages)]
+    root.setLevel(log_level)
+
+    def progress(step: str, done: int, total: int) -> None:
+        if cancel_event.is_set():
+            raise Cancelled(step)
+        messages.put(("progress", (step, done, total)))
+
+    try:
+        messages.put(("result", target(**job, progress=progress)))
+    except Cancelled:
+        messages.put(("cancelled", None))
+    except Exception as ex:  # pylint: disable=broad-except
+        logging.exception("Validation failed")
+        messages.put(("error", f"{type(ex).__name__}: {ex}"))
+
+
+def validate_times(config, swimrankings, progress: Optional[Callable[[str, int, int], None]] = None) -> None:
+    """The GUI validation, run on the calling thread after the meet's best times are prefetched
+
+    Args:
+        config: appConfig with the files and options to validate with
+        swimrankings: BestTimesClient wrapping the SwimRankings client
+        progress: Optional progress(step, done, total) callback
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from hytekvalidate_core import HyTekValidateTimes
+
+    if progress is not None:
+        progress("Looking up best times", 0, 2)
+    swimrankings.prefetch_meet(config)
+    if progress is not None:
+        progress("Validating entries", 1, 2)
+    # run() rather than start(), the validation runs on the calling thread
+    HyTekValidateTimes(config, swimrankings).run()
+    swimrankings.log_summary()
+
+
+def validate_times_job(config, progress: Callable[[str, int, int], None]) -> dict:
+    """Default worker target, the GUI validation run with the GUI's settings
+
+    Runs HyTekValidateTimes with the same appConfig and a SwimRankings client
+    of its own, so the meet configuration checks and best time lookups are the
+    same as on a thread in the GUI process.
+    """
+    # Imported in the worker process only, the GUI process never loads pandas for it
+    # pylint: disable=import-outside-toplevel
+    from besttimes import BestTimesClient
+    from instrumentation import recording
+    from swimrankings import SwimRankings
+
+    report_file = config.get_str("report_file")
+    timings = config.get_bool("opt_record_timings")
+    # The run is on this process's main thread, so the memory peaks are per stage
+    with recording(trace_memory=True) if timings else contextlib.nullcontext() as recorder:
+        with contextlib.closing(BestTimesClient.from_config(SwimRankings(), config)) as swimrankings:
+            validate_times(config, swimrankings, progress)
+    if recorder is not None:
+        recorder.log_summary()
+        recorder.write_json(
+            str(pathlib.Path(report_file).with_suffix(".timings.json")),
+            hytek_db=config.get_str("hytek_db"),
+            report_file=report_file,
+        )
+    return {"out": report_file}
+
+
+class ValidationWorker:
+    """One validation run in a child process, driven by poll() from the GUI timer"""
+
+    def __init__(self, target: Callable[..., dict] = validate_times_job, **job):
+        """
+        Args:
+            target: Module level function run in the worker as target(**job, progress=progress),
+                it should call progress(step, done, total) between steps so it can be cancelled
+            job: Keyword arguments for target, they must be picklable
+        """
+        self.target = target
+        self.job = job
+        self.progress: Optional[Tuple[str, int, int]] = None
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.cancelled = False
+        self.finished = False
+        context = multiprocessing.get_context("spawn")
+        self._messages = context.Queue()
+        self._cancel_event = context.Event()
+        self._process = context.Process(
+            target=_run,
+            args=(target, job, self._messages, self._cancel_event, logging.getLogger().getEffectiveLevel()),
+            daemon=True,
+        )
+        self._terminate_at: Optional[float] = None
+
+    def start(self) -> None:
+        self._process.start()
+
+    def cancel(self, grace: float = CANCEL_GRACE_S) -> None:
+        """Ask the worker to stop at its next progress step, it is terminated if it is still running after grace
+
+        A worker that has reported its last step has no next step, so it is terminated at once.
+        """
+        if self.finished or self._cancel_event.is_set():
+            return
+        logging.info("Cancelling validation")
+        self._cancel_event.set()
+        self._terminate_at = time.monotonic() + (0 if self._at_last_step() else grace)
+
+    def _at_last_step(self) -> bool:
+        """True once the worker has reported its last step, it will not check for cancellation again"""
+        return self.progress is not None and self.progress[1] + 1 >= self.progress[2]
+
+    def poll(self, max_messages: int = 1000) -> bool:
+        """Handle up to max_messages queued messages, returns True while the worker is still running
+
+        Log records are passed to this process's loggers, so they reach the log
+        window and file like records from the GUI itself.
+        """
+        for _ in range(max_messages):
+            if self.finished:
+                break
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            self._handle(message)
+        if not self.finished:
+            self._check_process()
+        return not self.finished
+
+    def _handle(self, message) -> None:
+        if isinstance(message, logging.LogRecord):
+            logging.getLogger(message.name).handle(message)
+            return
+        kind, value = message
+        if kind == "progress":
+            self.progress = value
+            if self._terminate_at is not None and self._at_last_step():
+                self._terminate_at = time.monotonic()
+        elif kind == "result":
+            self.result = value
+        elif kind == "error":
+            self.error = value
+        elif kind == "cancelled":
+            self.cancelled = True
+            logging.info("Validation cancelled")
+        if kind != "progress":
+            self._finish()
+
+    def _check_process(self) -> None:
+        if self._terminate_at is not None and time.monotonic() >= self._terminate_at:
+            self._process.terminate()
+            self.cancelled = True
+            logging.info("Validation cancelled, the worker was stopped")
+            self._finish()
+        elif not self._process.is_alive() and self._messages.empty():
+            # Exited without a final message, killed or crashed in native code
+            self.error = f"Validation worker exited with code {self._process.exitcode}"
+            logging.error(self.error)
+            self._finish()
+
+    def _finish(self) -> None:
+        self.finished = True
+        self._process.join(timeout=1)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()